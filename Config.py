@@ -1,44 +1,45 @@
 # Author: Justin David Todd
-# Last Modified: 02/04/2021
+# Last Modified: 10/17/2026
 # Description: This Config class represents the running game console.
 #   Holds system's "ON" status and stores/retrieves menu images, backgrounds,
 #   window attributes, icons, fps, etc.
 #   Music, Game saves and High scores would also be stored in this class.
+#   Only the display is started when a Config is created; fonts are loaded when first used.
+#   The window can be any size: the game is played in a world DESIGN_HEIGHT pixels tall
+#   (and as wide as the window's shape allows) that is drawn scaled to fill the window.
 import pygame
-pygame.font.init()
+from assets import Assets, DESIGN_HEIGHT
 
 
 class Config:
     """Holds system's ON status and stores and retrieves game saves."""
 
-    def __init__(self):
-        """Initializes attributes that store game running and save data"""
+    def __init__(self, width=800, height=800):
+        """
+        Takes an optional window width and height in pixels.
+        Initializes attributes that store game running and save data
+        """
         self._system_on = True
         self._destination = "new_game"
-        self._window_width = 800
-        self._window_height = 800
+        self._window_width = width
+        self._window_height = height
         self._fps = 60
+        # Moves enemies and lasers with the optional NumPy backend when True
+        self._vectorized = False
+        # Restores and updates only the regions drawn over each frame when True
+        self._dirty_rendering = False
         self._window = pygame.display.set_mode((self._window_width, self._window_height))
-        self._image = {
-            "bg_default": pygame.transform.scale(pygame.image.load("assets/starlight_bg.png"),
-                                                 (self._window_width, self._window_height)),
-
-            # Sprites
-            # Player Images - image file should be 64x64 pixels
-            "main_ship": pygame.image.load("assets/main_ship.png"),
-        }
-        self._window = pygame.display.set_mode((self._window_width, self._window_height))
-        self._background = self._image["bg_default"]
-        self._icon = self._image["main_ship"]
+        # Converts any images loaded before the window existed to the window's pixel format,
+        # and draws sprites scaled to the window.
+        Assets.convert_all()
+        Assets.set_resolution(self._window_width, self._window_height)
+        # The background and icon are looked up when first used, after the loading screen has decoded them.
+        self._background_name = "bg_default"
+        self._icon_name = "main_ship"
         self._caption = "Garuda"
 
-        self._font = {
-            "main": pygame.font.SysFont('comicsansms', self.get_height()//16),
-            "lost": pygame.font.SysFont('comicsansms', self.get_height()//10),
-            "sub menu": pygame.font.SysFont('comicsansms', self.get_height()//12),
-            "sub title": pygame.font.SysFont('comicsansms', self.get_height() // 24),
-            "title": pygame.font.SysFont('comicsansms', self.get_height()//5)
-        }
+        # Font name and size of each font, loaded from the asset registry when first used
+        self._font = self._font_specs()
 
     def get_width(self):
         """Returns the width of the game window."""
@@ -48,13 +49,33 @@ class Config:
         """Returns the height of the game window"""
         return self._window_height
 
+    def get_scale(self):
+        """Returns the window's height over the height of the game's world, which every sprite is scaled by"""
+        return self._window_height / DESIGN_HEIGHT
+
+    def get_world_width(self):
+        """Returns the width of the game's world: the window's width at the world's scale"""
+        return round(self._window_width / self.get_scale())
+
+    def get_world_height(self):
+        """Returns the height of the game's world"""
+        return DESIGN_HEIGHT
+
     def get_fps(self):
         """Returns the game's fps"""
         return self._fps
 
+    def get_vectorized(self):
+        """Returns True if the NumPy movement backend is selected, else False"""
+        return self._vectorized
+
+    def get_dirty_rendering(self):
+        """Returns True if only the regions drawn over are updated each frame, else False"""
+        return self._dirty_rendering
+
     def get_icon(self):
         """Returns the game's icon"""
-        return self._icon
+        return Assets.get_image(self._icon_name)
 
     def get_caption(self):
         """Returns the game's caption"""
@@ -70,16 +91,23 @@ class Config:
 
     def get_background(self):
         """Returns the game's background"""
-        return self._background
+        return Assets.get_background(self._background_name)
 
     def get_image(self, image_name):
         """Takes an image name and returns the related image."""
-        return self._image[image_name]
+        return Assets.get_image(image_name)
 
     def set_background(self, image_name):
         """Takes an image and sets the background to that image."""
-        self._background = pygame.transform.scale(self._image[image_name],
-                                                  (self._window_width, self._window_height))
+        self._background_name = image_name
+
+    def set_vectorized(self, enabled):
+        """Takes True or False and selects or deselects the NumPy movement backend."""
+        self._vectorized = enabled
+
+    def set_dirty_rendering(self, enabled):
+        """Takes True or False. Updates only the regions drawn over each frame if True."""
+        self._dirty_rendering = enabled
 
     def set_destination(self, screen):
         """Takes a string and sets self._destination to that screen."""
@@ -87,7 +115,7 @@ class Config:
 
     def set_icon(self, image_name):
         """Takes an image name and sets the icon to that image."""
-        self._icon = self._image[image_name]
+        self._icon_name = image_name
         pygame.display.set_icon(self.get_icon())
 
     def set_caption(self, string):
@@ -101,15 +129,32 @@ class Config:
         pygame.display.set_caption(self.get_caption())
 
     def resize_window(self, width, height):
-        """Takes two integers, width and height, and resizes the window to those dimensions."""
+        """
+        Takes two integers, width and height, and resizes the window to those dimensions.
+        Scales every sprite, the background and the fonts to the new size once.
+        """
         self._window_width = width
         self._window_height = height
+        self._window = pygame.display.set_mode((width, height))
+        Assets.set_resolution(width, height)
+        self._font = self._font_specs()
+
+    def _font_specs(self):
+        """Returns a dictionary of font name -> (system font name, size) sized for the window"""
+        return {
+            "main": ('comicsansms', self.get_height()//16),
+            "lost": ('comicsansms', self.get_height()//10),
+            "sub menu": ('comicsansms', self.get_height()//12),
+            "sub title": ('comicsansms', self.get_height() // 24),
+            "title": ('comicsansms', self.get_height()//5),
+            "overlay": ('couriernew', self.get_height()//40)
+        }
 
     def font(self, font_name):
         """
-        Takes a font name and retrieves the image of that name.
+        Takes a font name and retrieves the font of that name.
         """
-        return self._font[font_name]
+        return Assets.get_font(*self._font[font_name])
 
     def on(self):
         """Returns True if the system is On, else False"""
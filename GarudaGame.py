@@ -1,11 +1,19 @@
 # Author: Justin David Todd
-# Last Modified: 01/31/2021
+# Last Modified: 10/17/2026
 # Description: This class stores and initializes all existing player ships,
 # enemy ships, and lasers. Keeps track of current score.
 # Contains functions for enemy spawn patterns and constructed levels
-# for user to play.
+# for user to play. The levels played are loaded from the compiled level files
+# in levels/ (see leveldata.py), which were converted from the level methods below.
+# Levels are laid out for a DESIGN_WIDTH wide screen; in a wider world they are centered,
+# in a narrower one squeezed to its width, while ships and the player can use the world's full width.
 
 from ships import *
+from assets import Assets, DESIGN_WIDTH
+from pools import EntityPool, LaserPool, SpawnQueue, SpawnRecord, TimerQueue
+import leveldata
+import math
+import pygame
 import random
 
 
@@ -16,37 +24,70 @@ class GarudaGame:
       game backgrounds, level sequence, and level configurations.
     """
 
-    def __init__(self):
-        """Initializes default window configurations."""
+    def __init__(self, seed=None):
+        """
+        Initializes default window configurations.
+        Takes an optional seed so the game's random numbers can be reproduced.
+        """
 
-        # Stores window size
+        # Stores window size, and the x coordinate at which the DESIGN_WIDTH wide level layouts start
+        # (0 when the window is narrower than the layouts, which are then squeezed into it)
         self._window_width = 800
         self._window_height = 800
-
-        # Dictionary of Game Backgrounds
-        self._backgrounds = {
-            "bg_default": pygame.transform.scale(pygame.image.load("assets/starlight_bg.png"),
-                                                 (self._window_width, self._window_height)),
-        }
+        self._margin = 0
 
         # General Display Attributes
-        self._background = self._backgrounds["bg_default"]
+        # Background is shared with Config through the asset registry, and only looked up when drawn.
+        self._background_name = "bg_default"
         self._fps = 60
         self._current_level = 0
 
         # Stores Enemies, Enemy Lasers, Player Lasers and Levels
-        self._enemies = []
-        self._enemy_lasers = []
-        self._player_lasers = []
+        # Entity pools queue removals during a frame and apply them in flush_removals.
+        self._enemies = EntityPool()
+        # Enemies outside the interest region (the screen) only move; they wake when they enter it.
+        self._dormant = EntityPool()
+        # Dormant enemies above the region whose movement pattern has a closed form are not moved at all:
+        # they wait by the frame they reach the region, with the frame their position is from.
+        self._sleeping = TimerQueue()
+        self._interest = pygame.Rect(0, 0, self._window_width, self._window_height)
+        self._enemy_lasers = LaserPool()
+        self._player_lasers = LaserPool()
         self._level_sequence = []
 
+        # Enemies spawned far above the screen wait in the spawn queue as SpawnRecords
+        # and are only created shortly before they could be seen.
+        self._spawns = SpawnQueue()
+        self._spawn_margin = 64     # Pixels above the screen at which waiting enemies are created
+        self._frame = 0             # Frames counted by release_spawns
+        self._spawn_designs = {}    # Species -> (ship height + spawn margin, fastest descent, ship width)
+
+        # Active enemies by the frame they next fire, drawn once per shot rather than rolled every frame,
+        # and enemies that became active since the last call to fire_enemies, not yet scheduled
+        self._fire_schedule = TimerQueue()
+        self._unscheduled = []
+
         # Stores Current Score
         self._score = 0
 
+        # Seeded random number streams, one per subsystem, so a game can be replayed exactly.
+        # A stream's numbers do not change when another subsystem draws more or fewer numbers.
+        if seed is None:
+            seed = random.getrandbits(32)
+        self._seed = seed
+        self._random = {
+            "spawn": random.Random("{}:spawn".format(seed)),        # Spawn pattern positions
+            "fire": random.Random("{}:fire".format(seed)),          # When enemies fire
+            "movement": random.Random("{}:movement".format(seed))   # Random movement patterns
+        }
+
+        # Optional NumPy movement backend; None moves each enemy and laser with its own method
+        self._movement = None
+
     # Get Methods
     def get_background(self):
-        """Returns the current game background"""
-        return self._background
+        """Returns the current game background, scaled to the window"""
+        return Assets.get_background(self._background_name)
 
     def get_fps(self):
         """Returns the game's fps"""
@@ -60,22 +101,51 @@ class GarudaGame:
         """Returns the height of the game window"""
         return self._window_height
 
+    def get_margin(self):
+        """Returns the x coordinate at which level layouts, made for a DESIGN_WIDTH wide screen, start"""
+        return self._margin
+
     def get_current_level(self):
         """Returns the current level"""
         return self._current_level
 
     def get_enemies(self):
-        """Returns the list of all active enemies"""
+        """Returns the pool of all active enemies"""
         return self._enemies
 
+    def get_dormant_enemies(self):
+        """Returns the pool of enemies outside the interest region that are moved each frame"""
+        return self._dormant
+
+    def get_sleeping_enemies(self):
+        """
+        Returns a list of (enemy, its (x, y, move_counter) this frame) for the dormant enemies
+        that are not moved each frame, in the order they will reach the interest region.
+        Their positions are computed from their movement pattern's closed form.
+        """
+        frame = self._frame
+        return [(enemy, enemy.get_state_after(frame - since)) for enemy, since in self._sleeping]
+
+    def get_dormant_count(self):
+        """Returns the number of enemies outside the interest region, moved each frame or not"""
+        return len(self._dormant) + len(self._sleeping)
+
+    def get_interest_region(self):
+        """Returns the rect enemies must enter to fire, be drawn, and collide"""
+        return self._interest
+
     def get_enemy_lasers(self):
-        """Returns the list of all active enemies"""
+        """Returns the pool of all active enemy lasers"""
         return self._enemy_lasers
 
     def get_player_lasers(self):
-        """Returns the list of all active enemies"""
+        """Returns the pool of all active player lasers"""
         return self._player_lasers
 
+    def get_spawn_queue(self):
+        """Returns the queue of enemies waiting to be created"""
+        return self._spawns
+
     def get_level_sequence(self):
         """Retrieves the level sequence"""
         return self._level_sequence
@@ -84,21 +154,169 @@ class GarudaGame:
         """Returns the current score"""
         return self._score
 
+    def get_seed(self):
+        """Returns the seed of the game's random number streams"""
+        return self._seed
+
+    def get_fire_schedule(self):
+        """Returns the TimerQueue of active enemies by the frame they next fire"""
+        return self._fire_schedule
+
+    def get_random(self, stream):
+        """Takes a stream name ("spawn", "fire" or "movement") and returns that random number stream"""
+        return self._random[stream]
+
+    def get_vectorized(self):
+        """Returns True if enemies and lasers are moved by the NumPy backend, else False"""
+        return self._movement is not None
+
     # Set Methods
     def set_background(self, image_name):
         """Takes an image and sets the background to that image."""
-        self._background = self._backgrounds[image_name]
+        self._background_name = image_name
+
+    def set_current_level(self, level):
+        """Takes an index into level_sequence; the next call to next_level loads that level."""
+        self._current_level = level
 
     def resize_window(self, width, height):
         """Takes two integers, width and height, and resizes the window to those dimensions."""
         self._window_width = width
         self._window_height = height
+        self._margin = max(0, (width - DESIGN_WIDTH) // 2)
+        self._interest.size = (width, height)
+
+    def set_vectorized(self, enabled):
+        """
+        Takes True or False.
+        Moves enemies and lasers with the NumPy backend if True (requires NumPy),
+        else with each object's own movement method.
+        """
+        if enabled and self._movement is None:
+            from vectorized import VectorMovement
+            self._movement = VectorMovement()
+        elif not enabled and self._movement is not None:
+            # The pools stop updating the NumPy arrays; each enemy and laser already holds its state
+            self._movement.detach()
+            self._movement = None
 
     # Other Methods
+    def is_level_cleared(self):
+        """Returns True if no enemies are active or waiting to be created, else False"""
+        return (len(self._enemies) == 0 and len(self._dormant) == 0 and len(self._sleeping) == 0
+                and len(self._spawns) == 0)
+
+    def move_enemies(self):
+        """
+        Moves every active and dormant enemy one frame according to its movement pattern,
+        then wakes the dormant enemies that entered the interest region.
+        """
+        if self._movement is not None:
+            self._movement.move_enemies(self._enemies)
+            if len(self._dormant):
+                self._movement.move_enemies(self._dormant)
+        else:
+            for enemy in self._enemies:
+                enemy.move()
+            for enemy in self._dormant:
+                enemy.move()
+        self.wake_enemies()
+
+    def wake_enemies(self):
+        """
+        Moves the dormant enemies inside the interest region into the pool of active enemies,
+        and removes those that have passed below it without entering it, as active enemies are removed
+        when they escape. Sleeping enemies due this frame are first moved to where their movement pattern
+        has taken them.
+        """
+        dormant = self._dormant
+        interest = self._interest
+        for enemy in dormant:
+            rect = enemy.get_rect()
+            if interest.colliderect(rect):
+                dormant.discard(enemy)
+                self._enemies.add(enemy)
+                self._unscheduled.append(enemy)
+            elif rect.top >= interest.bottom:
+                dormant.discard(enemy)
+        dormant.flush()
+
+        frame = self._frame
+        for enemy, since in self._sleeping.pop_due(frame):
+            enemy.advance(frame - since)
+            # Only their height was used to schedule them; one still beside the region keeps moving each frame
+            rect = enemy.get_rect()
+            if interest.colliderect(rect):
+                self._enemies.add(enemy)
+                self._unscheduled.append(enemy)
+            elif rect.top < interest.bottom:
+                dormant.add(enemy)
+
+    def _frames_to_interest(self, enemy):
+        """
+        Takes an enemy above the interest region whose movement pattern has a closed form.
+        Returns the number of frames until its rect first reaches the region's height.
+        Every closed form descends at least the enemy's speed each frame, so it is found by bisection.
+        """
+        # The enemy reaches the region once its y is below this
+        reach = self._interest.top - enemy.get_height()
+        low = 1
+        high = max(1, (reach - enemy.get_y()) // enemy.get_speed() + 1)
+        while low < high:
+            middle = (low + high) // 2
+            if enemy.get_state_after(middle)[1] > reach:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def fire_enemies(self):
+        """
+        Fires a laser from each active enemy whose fire frame is this frame, then schedules its next one.
+        Each frame a ready enemy fires with a chance of one in 3 * fps, so the frames until it next
+        fires are drawn once from that geometric distribution instead of being rolled every frame.
+        An enemy that fires is not ready again until its laser's cool down has passed.
+        Enemies destroyed or escaped since they were scheduled are dropped when they come due.
+        """
+        frame = self._frame
+        for enemy in self._unscheduled:
+            self._fire_schedule.add(frame + self._fire_wait(), enemy)
+        self._unscheduled.clear()
+        enemies = self._enemies
+        for enemy in self._fire_schedule.pop_due(frame):
+            if enemy in enemies:
+                ready = frame + max(enemy.fire(), 1)
+                self._fire_schedule.add(ready + self._fire_wait(), enemy)
+
+    def _fire_wait(self):
+        """
+        Returns the frames a ready enemy waits before firing: the number of failed one in 3 * fps rolls
+        before the first success, drawn from the game's "fire" random numbers.
+        """
+        miss = 1 - 1 / (3 * self._fps)
+        return int(math.log(1.0 - self._random["fire"].random()) / math.log(miss))
+
+    def move_lasers(self):
+        """Moves every player and enemy laser one frame according to its movement pattern."""
+        if self._movement is not None:
+            self._movement.move_lasers(self._player_lasers)
+            self._movement.move_lasers(self._enemy_lasers)
+        else:
+            for laser in self._player_lasers:
+                laser.mov()
+            for laser in self._enemy_lasers:
+                laser.mov()
+
     def amend_score(self, num):
         """Takes an integer value and adds it to the current score."""
         self._score += num
 
+    def flush_removals(self):
+        """Applies the enemy and laser removals queued during the frame."""
+        self._enemies.flush()
+        self._enemy_lasers.flush()
+        self._player_lasers.flush()
+
     def next_level(self):
         """Loads the next level in level_sequence and increments the current level."""
         if self._current_level < len(self._level_sequence) - 1:
@@ -110,7 +328,7 @@ class GarudaGame:
     def spawn_player(self):
         """Creates a new Player object in the lower center of the screen."""
         # Creates player ship at the center bottom of the screen
-        #   and passes player_lasers as array to store lasers fired.
+        #   and passes player_lasers as the pool to store lasers fired.
         player = Player(0, 0, self._player_lasers, 100)
         player.set_x(self._window_width / 2 - player.get_width() / 2)
         player.set_y(self._window_height - 100)
@@ -120,14 +338,115 @@ class GarudaGame:
 
     def spawn_enemy(self, x, y, species):
         """
-        Takes an x coordinate, y coordinate, and species.
+        Takes an x coordinate within the level layout, y coordinate, and species.
         Spawns a new enemy of that species at that location.
-        Passes the enemy the laser attay to store lasers fired.
-        Adds enemy to list of enemies.
+        Enemies that could be seen within the spawn margin are created now,
+        others are queued and created by release_spawns just before they could be seen.
+        """
+        x = self._layout_x(x, self._spawn_design(species)[2])
+        arrival = self._arrival(y, species)
+        if arrival is None:
+            self._create_enemy(x, y, species)
+        else:
+            self._spawns.add(arrival, SpawnRecord(x, y, species, self._frame))
+
+    def spawn_table(self, table):
+        """
+        Takes a compiled level's SpawnTable and spawns every enemy in it, in order.
+        Rows flagged RANDOM_X get a random x coordinate where the whole ship is within the level layout.
+        """
+        rng = self._random["spawn"]
+        frame = self._frame
+        names = table.get_species()
+        designs = [self._spawn_design(species) for species in names]
+        queued = []
+        for x, y, kind, flags in table.get_rows():
+            if flags & leveldata.RANDOM_X:
+                x = rng.randint(0, DESIGN_WIDTH - x)
+            x = self._layout_x(x, designs[kind][2])
+            # Pixels the enemy must descend before it is within the spawn margin of the screen
+            distance = -y - designs[kind][0]
+            if distance <= 0:
+                self._create_enemy(x, y, names[kind])
+            else:
+                queued.append((frame + int(distance // designs[kind][1]), SpawnRecord(x, y, names[kind], frame)))
+        # Queues the level's far-off enemies together rather than one at a time
+        self._spawns.extend(queued)
+
+    def spawn_enemy_at_random_x(self, ship_width, y, species):
+        """
+        Takes the width of the species' ship, a y coordinate, and a species.
+        Spawns a new enemy of that species at that height and a random x coordinate
+        where the whole ship is within the level layout.
+        """
+        self.spawn_enemy(self._random["spawn"].randint(0, DESIGN_WIDTH - ship_width), y, species)
+
+    def _spawn_design(self, species):
+        """
+        Takes a species and returns its (ship height + spawn margin, fastest descent while above the screen,
+        ship width)
+        """
+        design = self._spawn_designs.get(species)
+        if design is None:
+            prototype = Enemy.get_species(species)
+            image = prototype.get_image()
+            design = (image.get_height() + self._spawn_margin, prototype.get_max_descent(), image.get_width())
+            self._spawn_designs[species] = design
+        return design
+
+    def _layout_x(self, x, ship_width):
+        """
+        Takes an x coordinate within the level layout and the width of the ship placed there.
+        Returns the x coordinate in the world: the layout is centered in a world at least DESIGN_WIDTH wide,
+        and squeezed into a narrower one so ships at either edge of the layout are at the edges of the world.
+        """
+        if self._window_width >= DESIGN_WIDTH:
+            return x + self._margin
+        return x * (self._window_width - ship_width) // (DESIGN_WIDTH - ship_width)
+
+    def _arrival(self, y, species):
+        """
+        Takes a spawn y coordinate and a species.
+        Returns the frame an enemy spawned there should be created,
+        or None if it could be seen within the spawn margin and should be created now.
+        """
+        design = self._spawn_design(species)
+        # Pixels the enemy must descend before it is within the spawn margin of the screen
+        distance = -y - design[0]
+        if distance <= 0:
+            return None
+        return self._frame + int(distance // design[1])
+
+    def release_spawns(self):
+        """
+        Creates the queued enemies due this frame, moved to where they would be had they
+        been created when spawned, then counts the frame. Called once per frame.
+        """
+        for record in self._spawns.pop_due(self._frame):
+            self._create_enemy(record.x, record.y, record.species, self._frame - record.frame)
+        self._frame += 1
+
+    def _create_enemy(self, x, y, species, frames=0):
+        """
+        Takes an x coordinate, y coordinate, species, and an optional number of frames to move it.
+        Creates a new enemy of that species at that location and passes it the laser pool to store lasers fired.
+        Adds enemy to the pool of enemies, or of dormant enemies if outside the interest region;
+        dormant enemies above the region with a closed-form movement pattern sleep until they reach it.
         """
         enemy = Enemy(x, y, self._enemy_lasers, species)
         enemy.set_window(self._window_width, self._window_height)
-        self._enemies.append(enemy)
+        enemy.set_random(self._random["movement"])
+        if frames:
+            enemy.advance(frames)
+        rect = enemy.get_rect()
+        if self._interest.colliderect(rect):
+            self._enemies.add(enemy)
+            self._unscheduled.append(enemy)
+        elif rect.bottom <= self._interest.top and enemy.get_state_after(0) is not None:
+            # Moved for the first time next frame
+            self._sleeping.add(self._frame + self._frames_to_interest(enemy), (enemy, self._frame))
+        else:
+            self._dormant.add(enemy)
 
     # Collection of Spawn Patterns
     def spawn_row(self, distance, species, species2=None, adjust=None):
@@ -246,12 +565,11 @@ class GarudaGame:
         assigning them a random x coordinate.
         Starting distance of first enemy is specified distance.
         """
-        random.seed()
-        ship_width = Enemy(0, 0, [], species).get_width()
+        ship_width = Enemy.get_species(species).get_image().get_width()
         spacing = 800
         for spawn in range(waves):
             for duplicates in range(quantity):
-                self.spawn_enemy(random.randint(0, self.get_width()-ship_width), -distance-spacing*spawn, species)
+                self.spawn_enemy_at_random_x(ship_width, -distance-spacing*spawn, species)
 
     def spawn_centipede_left(self, distance, head, body1, body2, length=None):
         """ Takes a spawn distance, a head, and two body part enemies.
@@ -286,12 +604,12 @@ class GarudaGame:
         if length is not None:
             segments = length
 
-        self.spawn_enemy(self.get_width()-right_indent, -distance, head)
+        self.spawn_enemy(DESIGN_WIDTH-right_indent, -distance, head)
         for spawn in range(1, segments+1):
             if spawn % 2 == 0:
-                self.spawn_enemy(self.get_width()-right_indent - spacing * spawn, -distance, body1)
+                self.spawn_enemy(DESIGN_WIDTH-right_indent - spacing * spawn, -distance, body1)
             else:
-                self.spawn_enemy(self.get_width()-right_indent - spacing * spawn, -distance, body2)
+                self.spawn_enemy(DESIGN_WIDTH-right_indent - spacing * spawn, -distance, body2)
 
     # Collection of Game Levels
     # Waves should be spaced by a distance of 600 to 800
@@ -374,8 +692,16 @@ class GarudaGame:
 
     def load_levels(self):
         """Loads the order that the player will play through each level"""
-        self._level_sequence.append(self.level_one)
-        self._level_sequence.append(self.level_two)
-        self._level_sequence.append(self.level_three)
-        self._level_sequence.append(self.level_four)
-        self._level_sequence.append(self.level_heck)
+        for name in ("level_one", "level_two", "level_three", "level_four", "level_heck"):
+            self._level_sequence.append(self._compiled_level(name))
+
+    def _compiled_level(self, name):
+        """
+        Takes the name of a level file and returns a function that spawns that level's enemies
+        from its compiled spawn table.
+        """
+        def level():
+            self.spawn_table(leveldata.load(name))
+        level.__name__ = name
+        level.__doc__ = "spawns enemies for {} from its compiled level file".format(name)
+        return level
@@ -0,0 +1,521 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Process-wide registry of the game's images.
+#   Each image file is decoded from assets/ once, converted to the display's
+#   pixel format, and shared by Config, GarudaGame, Ships and Lasers.
+#   Keeps load counts and load times so repeat decoding can be spotted.
+#   Also builds each image's collision mask once, the first time it is needed.
+#   preload() decodes every image at startup on a pool of threads while a progress screen is drawn.
+#   Run "python assets.py" to print the total and per-image load times of a cold start.
+#   Every sprite (ships, enemies, lasers, explosions) is packed into one atlas surface, cached in
+#   ATLAS_IMAGE with an index of each sprite's rect; sprites are drawn as areas of that atlas.
+#   The atlas is rebuilt whenever a sprite file is added or changed.
+#   Images are drawn for a DESIGN_HEIGHT tall window; for any other window size every sprite
+#   and the background are scaled once, when the size is set, and never while a frame is drawn.
+#   Fonts are shared the same way; the file of each system font is looked up once and
+#   remembered in FONT_CACHE, so later runs do not scan the system's font folders.
+import os
+import json
+import time
+import pygame
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# File remembering the path of each system font between runs
+FONT_CACHE = os.path.join("assets", ".cache", "fonts.json")
+# Sprite atlas and the index of the files it was built from and each sprite's rect in it
+ATLAS_IMAGE = os.path.join("assets", ".cache", "atlas.png")
+ATLAS_INDEX = os.path.join("assets", ".cache", "atlas.json")
+
+# Window size the images and levels were made for; other windows scale every image by height / DESIGN_HEIGHT
+DESIGN_WIDTH = 800
+DESIGN_HEIGHT = 800
+
+
+class Assets:
+    """
+    Loads and stores every image used by the game.
+    All data is held on the class so every object in the process shares one cache.
+    """
+
+    # Dictionary of Image Files
+    _paths = {
+        # Backgrounds
+        "bg_default": "assets/starlight_bg.png",
+
+        # Player Images - image file should be 64x64 pixels
+        "main_ship": "assets/main_ship.png",
+
+        # Enemy Images - image file should be 32x32 pixels
+        "blue_baddy": "assets/baddy_1.png",
+        "red_baddy": "assets/baddy_2.png",
+        "ArrowBlue": "assets/ArrowBlue.png",
+        "ArrowGold": "assets/ArrowGold.png",
+        "ArrowPink": "assets/ArrowPink.png",
+        "ArrowRed": "assets/ArrowRed.png",
+        "ArrowStealth": "assets/ArrowStealth.png",
+        "Block": "assets/Block.png",
+        "BlueSquid": "assets/BlueSquid.png",
+        "blueSpark": "assets/blusSpark.png",
+        "CentiBlue": "assets/CentiBlue.png",
+        "CentiGreen": "assets/CentiGreen.png",
+        "CentiheadBlue": "assets/CentiheadBlue.png",
+        "CentiheadDud": "assets/CentiheadDud.png",
+        "CentiheadGreen": "assets/CentiheadGreen.png",
+        "CentiheadPanda": "assets/CentiheadPanda.png",
+        "CentiheadRed": "assets/CentiheadRed.png",
+        "CentiheadYellow": "assets/CentiheadYellow.png",
+        "CentiPurple": "assets/CentiPurple.png",
+        "CentiRed": "assets/CentiRed.png",
+        "FlappyBlue": "assets/Flappy Blue.png",
+        "FlappyGreen": "assets/FlappyGreen.png",
+        "FlappyRed": "assets/FlappyRed.png",
+        "FlappyStealth": "assets/FlappyStealth.png",
+        "FlappyWhite": "assets/FlappyWhite.png",
+        "GreenSpark": "assets/GreenSpark.png",
+        "hammer": "assets/hammer.png",
+        "metal_1": "assets/metal_1.png",
+        "MetalSquid": "assets/MetalSquid.png",
+        "RedMetalSquid": "assets/RedMetalSquid.png",
+
+        # Laser Images = image file should be 16 x 32 pixels
+        "explosion": "assets/simple_explosion.png",
+        "green_blast": "assets/green_blast.png",
+        "blank": "assets/Blank.png",
+        "green_laser": "assets/laser_green.png",
+        "lightning": "assets/lightning blue.png",
+        "blueShot": "assets/pellet blue.png",
+        "greenShot": "assets/pellet green.png",
+        "redShot": "assets/pellet red.png",
+        "yellowShot": "assets/pellet yellow.png",
+        "rayBlue": "assets/rayBlue.png",
+        "rayGreen": "assets/rayGreen.png",
+        "rayRed": "assets/rayRed.png",
+        "blasterGreen": "assets/blasterGreen.png",
+        "blasterRed": "assets/blasterRed.png"
+    }
+
+    # Decoded images by file path, and scaled copies by (image name, width, height)
+    _images = {}
+    _scaled = {}
+    _converted = set()
+
+    # Atlas holding every sprite, and each sprite's rect in it by file path
+    _atlas = None
+    _atlas_rects = {}
+
+    # Window size images are drawn for, and its scale relative to the design size
+    _window_size = (DESIGN_WIDTH, DESIGN_HEIGHT)
+    _scale = 1
+    # Atlas and rects of every sprite scaled by each scale used, and those of the current scale
+    _variants = {}
+    _sprite_atlas = None
+    _sprite_rects = {}
+
+    # Collision masks by image name, built the first time an entity with that image exists
+    _masks = {}
+
+    # Number of times each file was decoded and the seconds each decode took
+    _load_count = {}
+    _load_time = {}
+    # Seconds the last preload took from start to finish
+    _preload_time = None
+
+    # Fonts by (font name, size), and the file of each font name (None for pygame's default font)
+    _fonts = {}
+    _font_paths = None
+
+    @classmethod
+    def get_image(cls, image_name):
+        """
+        Takes an image name and returns the shared image of that name.
+        The file is only decoded the first time the image is requested.
+        """
+        path = cls._paths[image_name]
+        image = cls._images.get(path)
+        if image is None:
+            image = cls._load(path)
+        return image
+
+    @classmethod
+    def get_sprite(cls, image_name):
+        """
+        Takes an image name and returns the surface and area to blit to draw it at the current scale:
+        the scaled atlas and the image's rect in it, or the (scaled) image itself and None
+        if it is not in the atlas.
+        """
+        path = cls._paths[image_name]
+        area = cls._sprite_rects.get(path)
+        if area is None:
+            if cls._scale == 1:
+                return cls.get_image(image_name), None
+            image = cls.get_image(image_name)
+            return cls.get_scaled(image_name, *cls._scaled_size(image, cls._scale)), None
+        return cls._sprite_atlas, area
+
+    @classmethod
+    def get_background(cls, image_name):
+        """Takes an image name and returns that image scaled to fill the window, shared by every caller."""
+        return cls.get_scaled(image_name, *cls._window_size)
+
+    @classmethod
+    def get_scale(cls):
+        """Returns the scale sprites are drawn at: the window height over DESIGN_HEIGHT"""
+        return cls._scale
+
+    @classmethod
+    def set_resolution(cls, width, height):
+        """
+        Takes the window's width and height.
+        Sets the scale sprites are drawn at and scales every sprite in the atlas to it,
+        once per scale, so no image is scaled while a frame is drawn.
+        """
+        cls._window_size = (width, height)
+        cls._scale = 1 if height == DESIGN_HEIGHT else height / DESIGN_HEIGHT
+        cls._select_sprites()
+
+    @classmethod
+    def get_atlas(cls):
+        """Returns the atlas surface holding every sprite, or None if it has not been built or loaded."""
+        return cls._atlas
+
+    @classmethod
+    def get_scaled(cls, image_name, width, height):
+        """
+        Takes an image name, a width and a height.
+        Returns the shared image scaled to that size, scaling it only once.
+        """
+        key = (image_name, width, height)
+        image = cls._scaled.get(key)
+        if image is None:
+            image = pygame.transform.scale(cls.get_image(image_name), (width, height))
+            cls._scaled[key] = image
+        return image
+
+    @classmethod
+    def get_mask(cls, image_name):
+        """
+        Takes an image name and returns the shared collision mask of that image.
+        The mask is only built the first time it is requested.
+        """
+        mask = cls._masks.get(image_name)
+        if mask is None:
+            mask = pygame.mask.from_surface(cls.get_image(image_name))
+            cls._masks[image_name] = mask
+        return mask
+
+    @classmethod
+    def get_font(cls, font_name, size):
+        """
+        Takes a system font name and a size and returns the shared font of that name and size.
+        Starts pygame's font module the first time a font is requested.
+        """
+        key = (font_name, size)
+        font = cls._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(cls._font_path(font_name), size)
+            cls._fonts[key] = font
+        return font
+
+    @classmethod
+    def get_mask_count(cls):
+        """Returns the number of collision masks built so far."""
+        return len(cls._masks)
+
+    @classmethod
+    def get_path(cls, image_name):
+        """Takes an image name and returns the file it is loaded from."""
+        return cls._paths[image_name]
+
+    @classmethod
+    def get_names(cls):
+        """Returns the names of every registered image."""
+        return list(cls._paths)
+
+    @classmethod
+    def get_load_count(cls, image_name=None):
+        """
+        Takes an optional image name.
+        Returns the number of times that image's file has been decoded,
+        or the total number of decodes if no name is given.
+        """
+        if image_name is None:
+            return sum(cls._load_count.values())
+        return cls._load_count.get(cls._paths[image_name], 0)
+
+    @classmethod
+    def get_load_counts(cls):
+        """Returns a dictionary of file path to number of times it was decoded."""
+        return dict(cls._load_count)
+
+    @classmethod
+    def get_load_times(cls):
+        """Returns a dictionary of file path to seconds spent decoding it."""
+        return dict(cls._load_time)
+
+    @classmethod
+    def get_preload_time(cls):
+        """Returns the seconds the last preload took, or None if preload has not run."""
+        return cls._preload_time
+
+    @classmethod
+    def preload(cls, workers=None, progress=None):
+        """
+        Takes an optional number of threads and an optional function that takes
+        the number of images loaded and the total number of images.
+        Loads the sprite atlas if it is up to date, then decodes every registered image not yet
+        loaded on a pool of threads. Images are stored, and converted if the display exists,
+        on the calling thread as they finish; progress is called there after each one and
+        about 60 times a second while waiting. Builds the atlas if it could not be loaded.
+        Returns the seconds the preload took.
+        """
+        start = time.perf_counter()
+        atlas_loaded = cls._atlas is not None or cls.load_atlas()
+        paths = [path for path in dict.fromkeys(cls._paths.values()) if path not in cls._images]
+        total = len(paths)
+        loaded = 0
+        with ThreadPoolExecutor(workers) as pool:
+            pending = {pool.submit(cls._decode, path): path for path in paths}
+            while pending:
+                finished, _ = wait(pending, timeout=1/60, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    image, seconds = future.result()
+                    cls._store(pending.pop(future), image, seconds)
+                    loaded += 1
+                if progress is not None:
+                    progress(loaded, total)
+        if not atlas_loaded:
+            cls.build_atlas()
+        cls._preload_time = time.perf_counter() - start
+        return cls._preload_time
+
+    @classmethod
+    def convert_all(cls):
+        """
+        Converts every loaded image to the display's pixel format.
+        Images loaded before the window existed are converted here once it does.
+        """
+        if pygame.display.get_surface() is None:
+            return
+        if cls._atlas is not None and ATLAS_IMAGE not in cls._converted:
+            cls._use_atlas(cls._atlas, cls._atlas_rects)
+        for path, image in cls._images.items():
+            if path not in cls._converted:
+                cls._images[path] = cls._convert(image)
+                cls._converted.add(path)
+        # Scaled copies were made from unconverted images, so they are remade on request.
+        cls._scaled.clear()
+
+    @classmethod
+    def load_atlas(cls):
+        """
+        Loads the atlas from ATLAS_IMAGE if it was built from the current sprite files,
+        so every sprite is decoded at once. Returns True if it was loaded, else False.
+        """
+        try:
+            with open(ATLAS_INDEX) as file:
+                index = json.load(file)
+            if index["sources"] != cls._atlas_sources():
+                return False
+            image, seconds = cls._decode(ATLAS_IMAGE)
+        except (OSError, ValueError, KeyError, pygame.error):
+            return False
+        cls._load_time[ATLAS_IMAGE] = cls._load_time.get(ATLAS_IMAGE, 0) + seconds
+        cls._load_count[ATLAS_IMAGE] = cls._load_count.get(ATLAS_IMAGE, 0) + 1
+        cls._use_atlas(image, {path: pygame.Rect(rect) for path, rect in index["rects"].items()})
+        return True
+
+    @classmethod
+    def build_atlas(cls, width=512):
+        """
+        Takes an optional atlas width (widened to fit the widest sprite).
+        Packs every sprite into one atlas in rows, tallest first, uses it, and saves it
+        with its index to ATLAS_IMAGE and ATLAS_INDEX. Returns the atlas.
+        """
+        images = {path: cls._images.get(path) or cls._load(path) for path in cls._sprite_paths()}
+        atlas, rects = cls._pack(images, width)
+        # An atlas that cannot be saved only costs building it again next run
+        try:
+            os.makedirs(os.path.dirname(ATLAS_IMAGE), exist_ok=True)
+            pygame.image.save(atlas, ATLAS_IMAGE)
+            with open(ATLAS_INDEX, "w") as file:
+                json.dump({"sources": cls._atlas_sources(),
+                           "rects": {path: list(rect) for path, rect in rects.items()}}, file, indent=2)
+        except (OSError, pygame.error):
+            pass
+        return cls._use_atlas(atlas, rects)
+
+    @staticmethod
+    def _pack(images, width):
+        """
+        Takes a dictionary of file path -> image and a width (widened to fit the widest image).
+        Packs the images into one new surface in rows, tallest first.
+        Returns the surface and a dictionary of file path -> rect in it.
+        """
+        width = max([width] + [image.get_width() for image in images.values()])
+
+        # Shelf packing: sprites fill a row left to right, and a new row starts below the tallest one
+        rects = {}
+        x = y = row_height = 0
+        for path in sorted(images, key=lambda path: (-images[path].get_height(), path)):
+            image = images[path]
+            if x + image.get_width() > width:
+                x, y, row_height = 0, y + row_height, 0
+            rects[path] = pygame.Rect(x, y, image.get_width(), image.get_height())
+            x += image.get_width()
+            row_height = max(row_height, image.get_height())
+
+        atlas = pygame.Surface((width, max(y + row_height, 1)), pygame.SRCALPHA)
+        for path, rect in rects.items():
+            atlas.blit(images[path], rect)
+        return atlas, rects
+
+    @staticmethod
+    def _scaled_size(image, scale):
+        """Takes an image and a scale and returns the image's (width, height) at that scale, at least 1 pixel."""
+        return max(1, round(image.get_width() * scale)), max(1, round(image.get_height() * scale))
+
+    @classmethod
+    def _select_sprites(cls):
+        """
+        Makes the atlas at the current scale the one sprites are drawn from,
+        scaling every sprite of the atlas and packing them into a new atlas the first time a scale is used.
+        """
+        if cls._atlas is None or cls._scale == 1:
+            cls._sprite_atlas = cls._atlas
+            cls._sprite_rects = cls._atlas_rects
+            return
+        variant = cls._variants.get(cls._scale)
+        if variant is None:
+            images = {}
+            for path, rect in cls._atlas_rects.items():
+                image = cls._atlas.subsurface(rect)
+                images[path] = pygame.transform.smoothscale(image, cls._scaled_size(image, cls._scale))
+            atlas, rects = cls._pack(images, round(cls._atlas.get_width() * cls._scale))
+            if pygame.display.get_surface() is not None:
+                atlas = atlas.convert_alpha()
+            variant = (atlas, rects)
+            cls._variants[cls._scale] = variant
+        cls._sprite_atlas, cls._sprite_rects = variant
+
+    @classmethod
+    def _sprite_paths(cls):
+        """Returns the file of every registered image except the backgrounds."""
+        return list(dict.fromkeys(path for name, path in cls._paths.items() if not name.startswith("bg_")))
+
+    @classmethod
+    def _atlas_sources(cls):
+        """Returns a dictionary of sprite file -> [modification time, size], to tell if the atlas is out of date."""
+        sources = {}
+        for path in cls._sprite_paths():
+            stat = os.stat(path)
+            sources[path] = [stat.st_mtime_ns, stat.st_size]
+        return sources
+
+    @classmethod
+    def _use_atlas(cls, atlas, rects):
+        """
+        Takes an atlas and a dictionary of file path -> rect in it.
+        Converts the atlas if the display exists and makes each sprite's image an area of it.
+        Returns the atlas.
+        """
+        converted = pygame.display.get_surface() is not None
+        if converted:
+            atlas = atlas.convert_alpha()
+            cls._converted.add(ATLAS_IMAGE)
+        cls._atlas = atlas
+        cls._atlas_rects = rects
+        for path, rect in rects.items():
+            cls._images[path] = atlas.subsurface(rect)
+            if converted:
+                cls._converted.add(path)
+        # Scaled atlases were made from the previous atlas, so they are remade from this one
+        cls._variants.clear()
+        cls._select_sprites()
+        return atlas
+
+    @classmethod
+    def _load(cls, path):
+        """Takes a file path, decodes the image, and stores it in the cache."""
+        image, seconds = cls._decode(path)
+        return cls._store(path, image, seconds)
+
+    @staticmethod
+    def _decode(path):
+        """Takes a file path and returns its decoded image and the seconds decoding took. Safe to call on any thread."""
+        start = time.perf_counter()
+        image = pygame.image.load(path)
+        return image, time.perf_counter() - start
+
+    @classmethod
+    def _store(cls, path, image, seconds):
+        """
+        Takes a file path, its decoded image and the seconds decoding took.
+        Converts the image if the display exists, stores it in the cache, and returns it.
+        """
+        if pygame.display.get_surface() is not None:
+            start = time.perf_counter()
+            image = cls._convert(image)
+            cls._converted.add(path)
+            seconds += time.perf_counter() - start
+        cls._load_time[path] = cls._load_time.get(path, 0) + seconds
+        cls._load_count[path] = cls._load_count.get(path, 0) + 1
+        cls._images[path] = image
+        return image
+
+    @classmethod
+    def _font_path(cls, font_name):
+        """
+        Takes a system font name and returns its file, or None to use pygame's default font.
+        Reads the paths remembered in FONT_CACHE the first time; only scans the system's fonts
+        for a name not remembered (or whose file is gone), then remembers it.
+        A font that is not installed is not remembered, so it is found once it is installed.
+        """
+        if cls._font_paths is None:
+            try:
+                with open(FONT_CACHE) as file:
+                    cls._font_paths = json.load(file)
+            except (OSError, ValueError):
+                cls._font_paths = {}
+        path = cls._font_paths.get(font_name)
+        if path is not None and os.path.exists(path):
+            return path
+        path = pygame.font.match_font(font_name)
+        if path is None:
+            # Also forgets a missing font remembered by an older cache file
+            cls._font_paths.pop(font_name, None)
+            return None
+        cls._font_paths[font_name] = path
+        # A cache that cannot be written only costs scanning the fonts again next run
+        try:
+            os.makedirs(os.path.dirname(FONT_CACHE), exist_ok=True)
+            with open(FONT_CACHE, "w") as file:
+                json.dump(cls._font_paths, file, indent=2)
+        except OSError:
+            pass
+        return path
+
+    @staticmethod
+    def _convert(image):
+        """Takes an image and returns a copy in the display's pixel format."""
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Preloads every image of Garuda and prints the load times.")
+    parser.add_argument("--workers", type=int, help="decoding threads (default: chosen by Python, 1 = serial)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((800, 800))
+    total = Assets.preload(args.workers)
+    times = Assets.get_load_times()
+    for path, seconds in sorted(times.items(), key=lambda item: item[1], reverse=True):
+        print("{:<32} {:>8.2f} ms".format(path, seconds * 1000))
+    print("{} images: {:.2f} ms decoding and converting, {:.2f} ms from start to finish".format(
+        len(times), sum(times.values()) * 1000, total * 1000))
@@ -0,0 +1,95 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Compares drawing sprites from their own surfaces with drawing them as areas
+#   of the shared sprite atlas, at high sprite counts, and the time to load every sprite
+#   file against loading the atlas. Run from the project folder: python benchmarks/atlas.py
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from assets import Assets
+
+
+def best_time(function, repeats):
+    """Takes a function and a number of repeats. Returns the best time of one call in ms."""
+    best = None
+    for repeat in range(repeats):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best * 1000
+
+
+def measure_blits(surface, count, repeats=20, seed=0):
+    """
+    Takes the surface to draw on, a number of sprites, a number of repeats and a seed.
+    Draws that many sprites, chosen and placed at random, once from a separate surface per file
+    and once from the atlas. Returns the best time of each in ms.
+    """
+    rng = random.Random(seed)
+    names = [name for name in Assets.get_names() if not name.startswith("bg_")]
+    files = {name: Assets._convert(pygame.image.load(Assets.get_path(name))) for name in names}
+    chosen = [rng.choice(names) for _ in range(count)]
+    positions = [(rng.randrange(surface.get_width()), rng.randrange(surface.get_height())) for _ in range(count)]
+
+    file_sprites = [(files[name], position) for name, position in zip(chosen, positions)]
+    atlas_sprites = [Assets.get_sprite(name) + (position,) for name, position in zip(chosen, positions)]
+
+    def draw_files():
+        for image, position in file_sprites:
+            surface.blit(image, position)
+
+    def draw_atlas():
+        for image, area, position in atlas_sprites:
+            surface.blit(image, position, area)
+
+    return best_time(draw_files, repeats), best_time(draw_atlas, repeats)
+
+
+def measure_loads(repeats=10):
+    """
+    Takes a number of repeats. Returns the best time in ms to decode and convert every sprite file,
+    and to decode and convert the atlas.
+    """
+    paths = Assets._sprite_paths()
+    from assets import ATLAS_IMAGE
+
+    def load_files():
+        for path in paths:
+            Assets._convert(pygame.image.load(path))
+
+    def load_atlas():
+        pygame.image.load(ATLAS_IMAGE).convert_alpha()
+
+    return best_time(load_files, repeats), best_time(load_atlas, repeats)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Compares per-file sprite surfaces with the sprite atlas.")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 5000, 20000],
+                        help="numbers of sprites drawn per frame")
+    parser.add_argument("--repeats", type=int, default=20, help="frames drawn per count; the best is kept")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    window = pygame.display.set_mode((800, 800))
+    Assets.preload()
+    print("atlas: {}x{}, {} sprites".format(Assets.get_atlas().get_width(), Assets.get_atlas().get_height(),
+                                            len(Assets._sprite_paths())))
+    print("{:>8} {:>12} {:>12} {:>14} {:>8}".format("sprites", "files (ms)", "atlas (ms)", "atlas blits/s", "ratio"))
+    for count in args.counts:
+        files, atlas = measure_blits(window, count, args.repeats)
+        print("{:>8} {:>12.2f} {:>12.2f} {:>14,.0f} {:>7.2f}x".format(count, files, atlas, count / atlas * 1000,
+                                                                      files / atlas))
+    files, atlas = measure_loads()
+    print("loading every sprite: {:.2f} ms from {} files, {:.2f} ms from the atlas".format(
+        files, len(Assets._sprite_paths()), atlas))
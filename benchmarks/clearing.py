@@ -0,0 +1,60 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Checks that every level can be cleared at several window sizes, including windows
+#   narrower than they are tall, whose worlds are narrower than the levels were laid out for.
+#   Plays each level alone with scripted controls and a player that cannot die, and reports the
+#   frames each took to clear. Exits with status 1 if any level is not cleared within the frame limit.
+#   Run from the project folder: python benchmarks/clearing.py --sizes 800x800 600x800 1080x1920
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from Config import Config
+from engine import Engine, sweep_and_shoot
+
+
+def clear_level(level, width, height, seed=4, max_ticks=20000):
+    """
+    Takes a level index, the width and height of the world, a seed and a frame limit.
+    Plays that level alone with sweep_and_shoot controls and a player that cannot die.
+    Returns the number of frames it took to clear, or None if it was not cleared within the limit.
+    """
+    engine = Engine(width, height, seed=seed)
+    game = engine.get_game()
+    game.set_current_level(level)
+    # The first frame loads the level, which is cleared once the one after it is loaded
+    while engine.get_tick() < max_ticks:
+        engine.get_player().set_health(100)
+        engine.tick(sweep_and_shoot(engine))
+        if game.get_current_level() > level + 1:
+            return engine.get_tick()
+    return None
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Checks that every level of Garuda clears at several window sizes.")
+    parser.add_argument("--sizes", nargs="+", default=["800x800", "600x800", "1080x1920"],
+                        metavar="WIDTHxHEIGHT", help="window sizes to play at")
+    parser.add_argument("--ticks", type=int, default=20000, help="frames a level may take to clear")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    config = Config()
+    failures = 0
+    print("{:>10} {:>7} {:>6} {:>8}".format("size", "world", "level", "frames"))
+    for size in args.sizes:
+        width, height = (int(number) for number in size.lower().split("x"))
+        config.resize_window(width, height)
+        world = "{}x{}".format(config.get_world_width(), config.get_world_height())
+        levels = len(Engine().get_game().get_level_sequence())
+        for level in range(levels):
+            frames = clear_level(level, config.get_world_width(), config.get_world_height(), max_ticks=args.ticks)
+            if frames is None:
+                failures += 1
+            print("{:>10} {:>7} {:>6} {:>8}".format(size, world, level, "NOT CLEARED" if frames is None else frames))
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,162 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Plays Heck mode over and over with an invulnerable player, so enemies and lasers
+#   pile up, drawing every frame the way the game loop does with a FrameGovernor watching the
+#   frame budget. Prints each degradation step the governor applies or restores, and the mean
+#   time per game frame, entity counts and steps applied over each second of play.
+#   With --check, instead plays with enemy lasers halved and two game frames per drawn frame,
+#   and exits with status 1 if any enemy laser on screen goes undrawn for too many drawn frames in a row.
+#   Run from the project folder: python benchmarks/governor.py --budget 8
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from Config import Config
+from assets import Assets
+from engine import Engine, sweep_and_shoot
+from renderer import Renderer, DirtyRenderer
+from governor import FrameGovernor, DEGRADATIONS
+
+
+def play_heck(config, renderer, governor, ticks, seed=0):
+    """
+    Takes a Config, a renderer, a FrameGovernor (or None), a number of game frames and a seed.
+    Plays that many frames of Heck mode, running the governor's number of game frames per frame drawn.
+    Returns a list with one (mean ms per game frame, enemies, enemy lasers, steps applied) per second of play.
+    """
+    engine = Engine(config.get_world_width(), config.get_world_height(), seed=seed)
+    game = engine.get_game()
+    game.set_current_level(len(game.get_level_sequence()) - 1)
+    renderer.set_governor(governor)
+    window = config.get_window()
+    fps = game.get_fps()
+    seconds = []
+    elapsed = 0
+    counted = 0
+    while engine.get_tick() < ticks:
+        substeps = 1 if governor is None else governor.get_substeps()
+        start = time.perf_counter()
+        for substep in range(substeps):
+            engine.get_player().set_health(100)
+            engine.tick(sweep_and_shoot(engine))
+        renderer.draw(engine, window)
+        renderer.update_display()
+        frame = time.perf_counter() - start
+        if governor is not None:
+            governor.record(frame, substeps)
+        elapsed += frame
+        counted += substeps
+        if counted >= fps:
+            applied = [] if governor is None else governor.get_applied()
+            seconds.append((elapsed / counted * 1000, len(game.get_enemies()), len(game.get_enemy_lasers()),
+                            ", ".join(applied) or "-"))
+            elapsed = 0
+            counted = 0
+    return seconds
+
+
+class BlitRecorder(pygame.Surface):
+    """
+    A surface that keeps the positions of the images blitted onto it since it was last cleared.
+    """
+
+    def __init__(self, size):
+        """Takes the (width, height) of the surface."""
+        super().__init__(size)
+        self._positions = set()
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Takes the arguments of Surface.blit, keeps the position blitted to, and blits onto the surface."""
+        self._positions.add(tuple(dest[:2]))
+        return super().blit(source, dest, area, special_flags)
+
+    def get_positions(self):
+        """Returns the set of positions blitted to since the recorder was last cleared"""
+        return self._positions
+
+    def clear(self):
+        """Forgets the positions blitted to."""
+        self._positions = set()
+
+
+# Most drawn frames in a row an enemy laser on screen may go undrawn while they are halved.
+# Each laser is left out every other frame; a laser removed ahead of it can move it to the other half once.
+MOST_MISSED = 3
+
+
+def check_half_rate(config, renderer, ticks, seed=0):
+    """
+    Takes a Config, a renderer, a number of game frames and a seed. Plays that many frames of Heck mode
+    with a governor that halves the enemy lasers and runs two game frames per drawn frame.
+    Returns the most drawn frames in a row that an enemy laser on screen was not drawn.
+    """
+    engine = Engine(config.get_world_width(), config.get_world_height(), seed=seed)
+    game = engine.get_game()
+    game.set_current_level(len(game.get_level_sequence()) - 1)
+    # A budget of nothing applies both steps after the first two windows and never restores them
+    steps = ("enemy_lasers", "substeps")
+    governor = FrameGovernor(0, steps, log=None)
+    renderer.set_governor(governor)
+    recorder = BlitRecorder(config.get_window().get_size())
+    scale = Assets.get_scale()
+    height = config.get_world_height()
+    # Drawn frames in a row each enemy laser has not been drawn, by id while it stays in play
+    missed = {}
+    most = 0
+    while engine.get_tick() < ticks:
+        substeps = governor.get_substeps()
+        for substep in range(substeps):
+            engine.get_player().set_health(100)
+            engine.tick(sweep_and_shoot(engine))
+        recorder.clear()
+        renderer.draw(engine, recorder)
+        governor.record(1, substeps)
+        if governor.get_applied() != steps:
+            continue
+        drawn = recorder.get_positions()
+        counts = {}
+        for laser in game.get_enemy_lasers():
+            if 0 <= laser.get_y() < height:
+                if (laser.get_x() * scale, laser.get_y() * scale) in drawn:
+                    counts[id(laser)] = 0
+                else:
+                    counts[id(laser)] = missed.get(id(laser), 0) + 1
+                    most = max(most, counts[id(laser)])
+        missed = counts
+    return most
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Watches the frame governor keep an overloaded Heck mode in budget.")
+    parser.add_argument("--ticks", type=int, default=6000, help="game frames to play")
+    parser.add_argument("--budget", type=float, default=1000 / 60,
+                        help="ms a game frame may take; lower it to overload a fast machine")
+    parser.add_argument("--size", default="800x800", metavar="WIDTHxHEIGHT", help="window size")
+    parser.add_argument("--dirty", action="store_true", help="use the dirty-rect renderer")
+    parser.add_argument("--degrade", nargs="*", choices=DEGRADATIONS, default=DEGRADATIONS, metavar="STEP",
+                        help="degradation steps the governor may apply, in order (give none to compare without)")
+    parser.add_argument("--check", action="store_true",
+                        help="check that halved enemy lasers are all still drawn while two game frames run per drawn frame")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    width, height = (int(number) for number in args.size.lower().split("x"))
+    config = Config(width, height)
+    Assets.preload()
+    renderer = DirtyRenderer(config) if args.dirty else Renderer(config)
+    if args.check:
+        most = check_half_rate(config, renderer, args.ticks)
+        print("enemy lasers on screen went undrawn for at most {} drawn frames in a row (limit {})".format(
+            most, MOST_MISSED))
+        sys.exit(1 if most > MOST_MISSED else 0)
+    governor = FrameGovernor(args.budget / 1000, args.degrade) if args.degrade else None
+    seconds = play_heck(config, renderer, governor, args.ticks)
+    print("{:>6} {:>10} {:>8} {:>7}  {}".format("second", "ms/frame", "enemies", "lasers", "steps applied"))
+    for second, (milliseconds, enemies, lasers, applied) in enumerate(seconds, 1):
+        print("{:>6} {:>10.2f} {:>8} {:>7}  {}".format(second, milliseconds, enemies, lasers, applied))
@@ -0,0 +1,161 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Plays each level in GarudaGame.load_levels with a fixed seed and scripted
+#   controls, and reports per-frame p50/p95/p99 times for level spawning, movement,
+#   collision and drawing. Results can be saved as a JSON baseline, and later runs
+#   compared against it to flag regressions.
+#   Run from the project folder:
+#       python benchmarks/levels.py --save benchmarks/baseline.json
+#       python benchmarks/levels.py --compare benchmarks/baseline.json
+import os
+import sys
+import json
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from Config import Config
+from engine import Engine, sweep_and_shoot
+from renderer import Renderer
+
+# Phases reported for every level, in order
+PHASES = Engine.PHASES + ("drawing",)
+PERCENTILES = (50, 95, 99)
+
+
+def play_level(level, config, seed=1, max_ticks=20000, vectorized=False):
+    """
+    Takes a level index, the game's Config, a seed, a frame limit and whether to use the NumPy backend.
+    Plays that level alone with sweep_and_shoot controls and a player that cannot die,
+    drawing each frame onto an off-screen surface.
+    Returns the number of frames played and a dictionary of phase name -> list of frame times in ms.
+    """
+    engine = Engine(config.get_width(), config.get_height(), vectorized, seed)
+    engine.get_game().set_current_level(level)
+    engine.set_phase_timing(True)
+    renderer = Renderer(config)
+    surface = pygame.Surface((config.get_width(), config.get_height()))
+    player = engine.get_player()
+    game = engine.get_game()
+    samples = {phase: [] for phase in PHASES}
+
+    while engine.get_tick() < max_ticks:
+        # The level is cleared once its enemies are gone; the next tick would load another level
+        if engine.get_tick() > 0 and game.is_level_cleared():
+            break
+        player.recover_health(player.get_max_health())
+        engine.tick(sweep_and_shoot(engine))
+        for phase, seconds in engine.get_phase_times().items():
+            samples[phase].append(seconds * 1000)
+
+        start = time.perf_counter()
+        renderer.draw(engine, surface)
+        samples["drawing"].append((time.perf_counter() - start) * 1000)
+    return engine.get_tick(), samples
+
+
+def summarize(times):
+    """Takes a list of frame times in ms and returns a dictionary of their p50, p95, p99 and max."""
+    if len(times) < 2:
+        times = times * 2 or [0.0, 0.0]
+    cuts = statistics.quantiles(times, n=100, method="inclusive")
+    summary = {"p{}".format(percent): round(cuts[percent - 1], 4) for percent in PERCENTILES}
+    summary["max"] = round(max(times), 4)
+    return summary
+
+
+def run(seed=1, max_ticks=20000, vectorized=False, repeats=1):
+    """
+    Takes a seed, a per-level frame limit, whether to use the NumPy backend, and a number of repeats.
+    Benchmarks every level and returns the results as a JSON-ready dictionary.
+    Each percentile is the lowest of the repeats, which filters out noise from other processes.
+    """
+    config = Config()
+    results = {"seed": seed, "vectorized": vectorized, "repeats": repeats, "levels": {}}
+    level_names = [level.__name__ for level in _level_sequence()]
+    for index, name in enumerate(level_names):
+        best = None
+        for repeat in range(repeats):
+            frames, samples = play_level(index, config, seed, max_ticks, vectorized)
+            phases = {phase: summarize(samples[phase]) for phase in PHASES}
+            if best is None:
+                best = phases
+            else:
+                for phase, summary in phases.items():
+                    for key, value in summary.items():
+                        best[phase][key] = min(best[phase][key], value)
+        results["levels"][name] = {"frames": frames, "phases": best}
+    return results
+
+
+def compare(results, baseline, threshold=0.2, floor=0.05):
+    """
+    Takes new results, baseline results, the allowed fractional slowdown,
+    and a floor in ms below which differences are treated as noise.
+    Returns a list of messages, one per percentile that regressed beyond the threshold.
+    """
+    regressions = []
+    for name, level in results["levels"].items():
+        old_level = baseline["levels"].get(name)
+        if old_level is None:
+            continue
+        for phase, summary in level["phases"].items():
+            old_summary = old_level["phases"].get(phase, {})
+            for percent in PERCENTILES:
+                key = "p{}".format(percent)
+                new, old = summary[key], old_summary.get(key)
+                if old is None or new < floor:
+                    continue
+                if new > old * (1 + threshold) and new - old >= floor:
+                    regressions.append("{} {} {}: {:.3f} ms -> {:.3f} ms (+{:.0f}%)".format(
+                        name, phase, key, old, new, (new / max(old, 1e-9) - 1) * 100))
+    return regressions
+
+
+def report(results):
+    """Takes benchmark results and prints a table of every level and phase."""
+    print("{:<12} {:>7} {:<10} {:>9} {:>9} {:>9} {:>9}".format("level", "frames", "phase",
+                                                               "p50 ms", "p95 ms", "p99 ms", "max ms"))
+    for name, level in results["levels"].items():
+        for phase, summary in level["phases"].items():
+            print("{:<12} {:>7} {:<10} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f}".format(
+                name, level["frames"], phase, summary["p50"], summary["p95"], summary["p99"], summary["max"]))
+
+
+def _level_sequence():
+    """Returns the level methods of a new game, in the order load_levels plays them."""
+    from GarudaGame import GarudaGame
+    game = GarudaGame(0)
+    game.load_levels()
+    return game.get_level_sequence()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmarks every level of Garuda.")
+    parser.add_argument("--seed", type=int, default=1, help="seed for every level's random numbers")
+    parser.add_argument("--max-ticks", type=int, default=20000, help="frame limit per level")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy movement backend")
+    parser.add_argument("--repeats", type=int, default=1, help="plays of each level, keeping the fastest")
+    parser.add_argument("--save", metavar="PATH", help="write the results to this JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="flag regressions against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%")
+    args = parser.parse_args()
+
+    bench = run(args.seed, args.max_ticks, args.vectorized, args.repeats)
+    report(bench)
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(bench, file, indent=2)
+        print("Saved baseline to {}".format(args.save))
+    if args.compare:
+        with open(args.compare) as file:
+            slower = compare(bench, json.load(file), args.threshold)
+        if slower:
+            print("Regressions beyond {:.0f}%:".format(args.threshold * 100))
+            for line in slower:
+                print("  " + line)
+            raise SystemExit(1)
+        print("No regressions beyond {:.0f}%.".format(args.threshold * 100))
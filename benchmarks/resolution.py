@@ -0,0 +1,61 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Measures the time to draw and display a frame of the same seeded game
+#   at several window sizes, with the full and the dirty-rect renderers, and the one-time
+#   cost of scaling every sprite to each size.
+#   Run from the project folder: python benchmarks/resolution.py --sizes 800x800 2560x1440
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from Config import Config
+from assets import Assets
+from engine import Engine, sweep_and_shoot
+from renderer import Renderer, DirtyRenderer
+
+
+def measure(config, renderer_class, ticks=1500, seed=3):
+    """
+    Takes a Config, a renderer class, a number of frames and a seed.
+    Plays a scripted game in a world sized for the config's window and draws and displays every frame.
+    Returns the mean ms per frame spent drawing and displaying.
+    """
+    engine = Engine(config.get_world_width(), config.get_world_height(), seed=seed)
+    renderer = renderer_class(config)
+    window = config.get_window()
+    drawing = 0
+    for tick in range(ticks):
+        engine.tick(sweep_and_shoot(engine))
+        start = time.perf_counter()
+        renderer.draw(engine, window)
+        renderer.update_display()
+        drawing += time.perf_counter() - start
+    return drawing / ticks * 1000
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Compares frame cost of Garuda at several window sizes.")
+    parser.add_argument("--sizes", nargs="+", default=["800x800", "1920x1080", "2560x1440"],
+                        metavar="WIDTHxHEIGHT", help="window sizes to measure")
+    parser.add_argument("--ticks", type=int, default=1500, help="frames played at each size")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    config = Config()
+    Assets.preload()
+    print("{:>10} {:>6} {:>11} {:>11} {:>12}".format("size", "scale", "scaling ms", "full ms", "dirty ms"))
+    for size in args.sizes:
+        width, height = (int(number) for number in size.lower().split("x"))
+        start = time.perf_counter()
+        config.resize_window(width, height)
+        config.get_background()
+        scaling = (time.perf_counter() - start) * 1000
+        full = measure(config, Renderer, args.ticks)
+        dirty = measure(config, DirtyRenderer, args.ticks)
+        print("{:>10} {:>6.2f} {:>11.2f} {:>11.3f} {:>12.3f}".format(size, config.get_scale(), scaling, full, dirty))
@@ -0,0 +1,82 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Measures the memory and construction time of 100 enemies built directly,
+#   and of one spawn_block of 100 enemies as the game spawns it: the rows that could be seen
+#   are created as enemies and the rest are queued as spawn records until they come near.
+#   Run from the project folder: python benchmarks/spawn_block.py
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GarudaGame import GarudaGame
+from ships import Enemy
+from pools import LaserPool
+
+
+def best_time(setup, function, repeats):
+    """
+    Takes a function that returns the argument to time another with, that function and a number of repeats.
+    Returns the best time of one call in ms, not counting the setup.
+    """
+    best = None
+    for repeat in range(repeats):
+        argument = setup()
+        start = time.perf_counter()
+        function(argument)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best * 1000
+
+
+def allocated(setup, function):
+    """
+    Takes a function that returns the argument to call another with, and that function.
+    Returns the bytes allocated by the call and still held when it returns, not counting the setup.
+    """
+    argument = setup()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = function(argument)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del kept
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def build_enemies(lasers):
+    """Takes a laser pool and returns a list of 100 Squid enemies in a 10-wide block that fire into it."""
+    return [Enemy(64 * (number % 10), -64 * (number // 10), lasers, "Squid") for number in range(100)]
+
+
+def spawn_block(game):
+    """Takes a new game, spawns one block of 100 Squid enemies in it, and returns the game."""
+    game.spawn_block(64, "Squid")
+    return game
+
+
+def measure(repeats=50):
+    """
+    Takes a number of repeats.
+    Returns the best construction time in ms and the bytes allocated of 100 enemies built directly,
+    then of one spawn_block, and the numbers of enemies that spawn_block created and queued.
+    """
+    # Warms the asset and mask caches so only the enemies themselves are measured.
+    spawn_block(GarudaGame())
+    game = spawn_block(GarudaGame())
+    created = len(game.get_enemies()) + game.get_dormant_count()
+    queued = len(game.get_spawn_queue())
+    return (best_time(LaserPool, build_enemies, repeats), allocated(LaserPool, build_enemies),
+            best_time(GarudaGame, spawn_block, repeats), allocated(GarudaGame, spawn_block), created, queued)
+
+
+if __name__ == "__main__":
+    enemy_ms, enemy_size, block_ms, block_size, created, queued = measure()
+    print("100 enemies built directly")
+    print("  construction: {:.3f} ms".format(enemy_ms))
+    print("  memory:       {:,} bytes ({:.0f} bytes per enemy)".format(enemy_size, enemy_size / 100))
+    print("spawn_block of 100 enemies: {} created as enemies, {} queued as spawn records".format(created, queued))
+    print("  construction: {:.3f} ms".format(block_ms))
+    print("  memory:       {:,} bytes ({:.0f} bytes per enemy spawned)".format(block_size, block_size / 100))
@@ -0,0 +1,56 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Measures the time from starting the game's process to the first frame
+#   of the title screen, when the game first takes input. The first run is made with
+#   the on-disk font cache removed (cold), the rest with it in place (warm).
+#   Run from the project folder: python benchmarks/startup.py --runs 10
+import os
+import sys
+import time
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def measure_once(env):
+    """
+    Takes the environment to start the game with.
+    Starts main.py with --startup-probe and returns the seconds until its title screen was shown.
+    """
+    start = time.time()
+    output = subprocess.run([sys.executable, "main.py", "--startup-probe"], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    for line in output.splitlines():
+        if line.startswith("title screen shown at "):
+            return float(line.rsplit(" ", 1)[1]) - start
+    raise RuntimeError("main.py did not report its title screen:\n" + output)
+
+
+def run(runs=10):
+    """
+    Takes a number of runs. Returns a dictionary of the cold start time and the
+    median and best warm start times, in ms.
+    """
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    from assets import FONT_CACHE
+    cache = os.path.join(ROOT, FONT_CACHE)
+    if os.path.exists(cache):
+        os.remove(cache)
+    cold = measure_once(env)
+    warm = [measure_once(env) for run in range(max(runs - 1, 1))]
+    return {"cold": cold * 1000, "warm_median": statistics.median(warm) * 1000, "warm_best": min(warm) * 1000}
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Measures the start-up time of Garuda.")
+    parser.add_argument("--runs", type=int, default=10, help="number of times to start the game")
+    args = parser.parse_args()
+
+    result = run(args.runs)
+    print("Process start to title screen: cold {:.1f} ms, warm median {:.1f} ms, warm best {:.1f} ms".format(
+        result["cold"], result["warm_median"], result["warm_best"]))
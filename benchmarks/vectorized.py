@@ -0,0 +1,91 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Checks that the NumPy movement backend plays exactly the same games as the
+#   per-object movement methods, by comparing Engine checksums of both backends every few
+#   hundred frames over several seeds, and times both backends moving thousands of enemies
+#   and lasers with and without lasers being added and removed every frame.
+#   Exits with status 1 if any checksum differs.
+#   Run from the project folder: python benchmarks/vectorized.py
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+from engine import Engine, sweep_and_shoot, hunt_and_shoot
+from ships import Enemy
+from pools import EntityPool, LaserPool
+from vectorized import VectorMovement
+
+
+def compare_backends(seed, controls, ticks, every=250):
+    """
+    Takes a seed, a controls function, a number of frames and the frames between checks.
+    Plays the same game with both movement backends, keeping the player alive so the game
+    reaches the later levels. Returns the first frame their checksums differ, or None.
+    """
+    engines = [Engine(seed=seed), Engine(vectorized=True, seed=seed)]
+    for tick in range(1, ticks + 1):
+        for engine in engines:
+            engine.get_player().set_health(100)
+            engine.tick(controls(engine))
+        if tick % every == 0 and engines[0].get_checksum() != engines[1].get_checksum():
+            return tick
+    return None
+
+
+def time_movement(vectorized, enemies=3000, lasers=2000, churn=0, frames=300):
+    """
+    Takes whether to use the NumPy backend, the numbers of enemies and lasers, the number of
+    lasers added and removed each frame, and a number of frames.
+    Returns the mean ms per frame spent moving every enemy and laser.
+    """
+    laser_pool = LaserPool()
+    enemy_pool = EntityPool()
+    species = ("Metal1", "Squid", "Block", "ArrowStealth")
+    for number in range(enemies):
+        enemy_pool.add(Enemy(number % 736, -number, laser_pool, species[number % len(species)]))
+    for number in range(lasers):
+        laser_pool.new_laser(number % 784 + 0.5, number % 800, ("blasterRed", "blasterGreen")[number % 2])
+    movement = VectorMovement() if vectorized else None
+    elapsed = 0
+    for frame in range(frames):
+        start = time.perf_counter()
+        # Replaces the oldest lasers with new shots, as enemies firing and lasers hitting do in play
+        for number in range(churn):
+            laser_pool.discard(next(iter(laser_pool)))
+            laser_pool.new_laser(frame % 784 + 0.5, 0, "blasterRed")
+        laser_pool.flush()
+        if movement is None:
+            for enemy in enemy_pool:
+                enemy.move()
+            for laser in laser_pool:
+                laser.mov()
+        else:
+            movement.move_enemies(enemy_pool)
+            movement.move_lasers(laser_pool)
+        elapsed += time.perf_counter() - start
+    return elapsed / frames * 1000
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Compares the NumPy movement backend with per-object movement.")
+    parser.add_argument("--seeds", type=int, default=4, help="number of seeded games compared per controls")
+    parser.add_argument("--ticks", type=int, default=6000, help="frames played per game")
+    args = parser.parse_args()
+
+    mismatches = 0
+    for controls in (sweep_and_shoot, hunt_and_shoot):
+        for seed in range(args.seeds):
+            frame = compare_backends(seed, controls, args.ticks)
+            if frame is not None:
+                mismatches += 1
+                print("MISMATCH seed {} with {} from frame {}".format(seed, controls.__name__, frame))
+    print("{} games of {} frames compared, {} mismatches".format(2 * args.seeds, args.ticks, mismatches))
+
+    print("{:>6} {:>15} {:>15}".format("churn", "per-object ms", "vectorized ms"))
+    for churn in (0, 1, 10):
+        print("{:>6} {:>15.3f} {:>15.3f}".format(churn, time_movement(False, churn=churn),
+                                                 time_movement(True, churn=churn)))
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,364 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Steps a game of Garuda one fixed frame at a time without a window.
+#   The Engine holds the player's controls, movement, enemy fire, collisions, scoring
+#   and level progression that main.py's game loop runs each frame, so the same
+#   rules can be run headless (tests, balancing, load testing) as fast as possible.
+#   Run "python engine.py --ticks 10000" to play a scripted game with no display.
+import hashlib
+import time
+from GarudaGame import GarudaGame
+from spatial import SpatialHash
+
+
+class Engine:
+    """
+    Runs the rules of one game, one fixed timestep (frame) per call to tick().
+    Never opens a window, draws, or waits on a clock.
+    """
+
+    # Player controls for one frame, combined with | into a single integer
+    LEFT = 1
+    RIGHT = 2
+    UP = 4
+    DOWN = 8
+    SHOOT = 16
+
+    # Phases a frame's time is split into when phase timing is on
+    PHASES = ("spawning", "movement", "collision")
+
+    def __init__(self, width=800, height=800, vectorized=False, seed=None):
+        """
+        Takes an optional window width and height in pixels, whether to use
+        the NumPy movement backend, and a seed for the game's random numbers.
+        Creates a new game with its player and levels.
+        """
+        self._game = GarudaGame(seed)
+        self._game.resize_window(width, height)
+        self._game.set_vectorized(vectorized)
+        # Spawns a new player and loads the sequence of game levels
+        self._player = self._game.spawn_player()
+        self._game.load_levels()
+
+        # Defines the new game as running, and not lost.
+        self._running = True
+        self._lost = False
+        self._level_starting = False
+
+        # Counts for Game Over message duration, level message duration, and frames played
+        self._lost_count = 0
+        self._level_count = 0
+        self._tick = 0
+
+        # Broad phase grid so collisions are only tested between nearby objects.
+        self._grid = SpatialHash()
+
+        # Steps of one frame, in order, with the phase each step's time counts toward
+        self._controls = 0
+        self._steps = (("spawning", self._update_level),
+                       ("movement", self._update_player),
+                       ("movement", self._update_enemies),
+                       ("collision", self._collide_enemies),
+                       ("movement", self._game.move_lasers),
+                       ("collision", self._collide_lasers),
+                       ("collision", self._game.flush_removals))
+        # Seconds spent in each phase during the last frame, or None if phase timing is off
+        self._phase_times = None
+
+    # Get Methods
+    def get_game(self):
+        """Returns the GarudaGame being played"""
+        return self._game
+
+    def get_player(self):
+        """Returns the player's ship"""
+        return self._player
+
+    def get_tick(self):
+        """Returns the number of frames played"""
+        return self._tick
+
+    def get_checksum(self):
+        """
+        Returns a hex digest of the game's state (player, enemies, lasers, score and level).
+        Two runs with the same seed and controls have the same checksum.
+        """
+        game = self._game
+        player = self._player
+        state = [self._tick, game.get_current_level(), game.get_score(),
+                 player.get_x(), player.get_y(), player.get_health()]
+        for enemy in game.get_enemies():
+            state.extend((enemy.get_x(), enemy.get_y(), enemy.get_health()))
+        for enemy in game.get_dormant_enemies():
+            state.extend((enemy.get_x(), enemy.get_y(), enemy.get_health()))
+        for enemy, (x, y, counter) in game.get_sleeping_enemies():
+            state.extend((x, y, enemy.get_health()))
+        for laser in game.get_player_lasers():
+            state.extend((laser.get_x(), laser.get_y()))
+        for laser in game.get_enemy_lasers():
+            state.extend((laser.get_x(), laser.get_y()))
+        return hashlib.blake2b(repr(state).encode(), digest_size=16).hexdigest()
+
+    def get_phase_times(self):
+        """
+        Returns a dictionary of phase name -> seconds spent in that phase during the last frame,
+        or None if phase timing is off.
+        """
+        return self._phase_times
+
+    def is_running(self):
+        """Returns True until the game ends, else False"""
+        return self._running
+
+    def is_lost(self):
+        """Returns True once the player has lost, else False"""
+        return self._lost
+
+    def is_level_starting(self):
+        """Returns True while the new level message should be shown, else False"""
+        return self._level_starting
+
+    # Set Methods
+    def set_phase_timing(self, enabled):
+        """Takes True or False. Times each phase of every frame if True."""
+        self._phase_times = dict.fromkeys(Engine.PHASES, 0.0) if enabled else None
+
+    # Other Methods
+    def stop(self):
+        """Ends the game"""
+        self._running = False
+
+    @staticmethod
+    def read_keys(keys):
+        """Takes the result of pygame.key.get_pressed() and returns the matching controls."""
+        import pygame
+        controls = 0
+        if keys[pygame.K_LEFT]:
+            controls |= Engine.LEFT
+        if keys[pygame.K_RIGHT]:
+            controls |= Engine.RIGHT
+        if keys[pygame.K_UP]:
+            controls |= Engine.UP
+        if keys[pygame.K_DOWN]:
+            controls |= Engine.DOWN
+        if keys[pygame.K_SPACE]:
+            controls |= Engine.SHOOT
+        return controls
+
+    def tick(self, controls=0):
+        """
+        Takes the player's controls for this frame (Engine.LEFT | Engine.SHOOT, etc.)
+        and advances the game by one frame.
+        """
+        self._controls = controls
+        if self._phase_times is None:
+            for phase, step in self._steps:
+                step()
+        else:
+            clock = time.perf_counter
+            times = dict.fromkeys(Engine.PHASES, 0.0)
+            for phase, step in self._steps:
+                start = clock()
+                step()
+                times[phase] += clock() - start
+            self._phase_times = times
+        self._tick += 1
+
+    def run(self, ticks, controls=0):
+        """
+        Takes a number of frames and the player's controls, either a fixed value
+        or a function that takes the engine and returns the controls for each frame.
+        Plays until that many frames have passed or the game ends.
+        Returns the number of frames played.
+        """
+        played = 0
+        while self._running and played < ticks:
+            if callable(controls):
+                self.tick(controls(self))
+            else:
+                self.tick(controls)
+            played += 1
+        return played
+
+    def _update_level(self):
+        """
+        Loads the next level when enemies are depleted, creates queued enemies as they approach,
+        and applies the lose conditions.
+        """
+        game = self._game
+        if game.is_level_cleared():
+            game.next_level()
+            self._level_starting = True
+            self._level_count = 120
+        # Creates the queued enemies about to come into view
+        game.release_spawns()
+
+        # Defines player lose conditions
+        if self._player.get_health() <= 0:
+            if self._lost_count == 0:
+                self._player.explode()
+            self._lost = True
+            self._lost_count += 1
+        # Shows Game Over for five seconds, then ends game
+        if self._lost_count > game.get_fps() * 5:
+            self._running = False
+
+    def _update_player(self):
+        """Moves the player and fires the player's lasers with this frame's controls."""
+        game = self._game
+        player = self._player
+        controls = self._controls
+        # Moves Player with arrow keys
+        if controls & Engine.LEFT:
+            player.horizontal_move(-player.get_speed())
+        if controls & Engine.RIGHT:
+            player.horizontal_move(player.get_speed())
+        if controls & Engine.UP:
+            player.vertical_move(-player.get_speed())
+        if controls & Engine.DOWN:
+            player.vertical_move(player.get_speed())
+
+        # Shoots player lasers
+        if controls & Engine.SHOOT:
+            player.shoot()
+
+        # Controls display of new level message.
+        if self._level_count > 0:
+            self._level_count -= 1
+            if self._level_count == 0:
+                self._level_starting = False
+
+        # Prevents player from moving off-screen
+        if player.get_x() < 0:
+            player.set_x(0)
+        if player.get_x() > game.get_width() - player.get_width():
+            player.set_x(game.get_width() - player.get_width())
+        if player.get_y() < 0:
+            player.set_y(0)
+        if player.get_y() > game.get_height() - 20 - player.get_height():
+            player.set_y(game.get_height() - 20 - player.get_height())
+
+        # Decrements player's laser cool down timer each frame
+        if not self._lost:
+            player.cool_down()
+
+    def _update_enemies(self):
+        """Moves enemies, fires their lasers, and removes enemies that are destroyed or escape."""
+        game = self._game
+        enemies = game.get_enemies()
+        game.move_enemies()
+        # Fires the enemies scheduled to fire this frame; their cool downs are part of the schedule
+        game.fire_enemies()
+        for enemy in enemies:
+            # enemies disappear when health reaches zero
+            if enemy.get_health() <= 0:
+                game.amend_score(enemy.get_value())
+                enemies.discard(enemy)
+            # explodes enemies that reach end of screen
+            elif enemy.get_y() > game.get_height() - enemy.get_height():
+                enemy.explode()
+                enemies.discard(enemy)
+
+    def _collide_enemies(self):
+        """Explodes enemies that collide with the player."""
+        enemies = self._game.get_enemies()
+        player = self._player
+        # Buckets the remaining enemies by position for this frame's collision tests
+        self._grid.rebuild(enemies.active())
+        crashed = [enemy for enemy in self._grid.query(player) if enemy.collision(player)]
+        for enemy in crashed:
+            enemy.explode()
+            enemies.discard(enemy)
+        if crashed:
+            self._grid.rebuild(enemies.active())
+
+    def _collide_lasers(self):
+        """Damages ships hit by lasers and removes lasers that hit or leave the screen."""
+        game = self._game
+        player = self._player
+        height = game.get_height()
+        # Player Lasers, only testing enemies near each laser
+        player_lasers = game.get_player_lasers()
+        for laser in player_lasers:
+            for enemy in self._grid.query(laser):
+                if laser.collision(enemy):
+                    enemy.deplete_health(laser.get_damage())
+                    player_lasers.discard(laser)
+            if laser.off_screen(height):
+                player_lasers.discard(laser)
+        # Enemy Lasers
+        enemy_lasers = game.get_enemy_lasers()
+        for laser in enemy_lasers:
+            if laser.collision(player):
+                player.deplete_health(laser.get_damage())
+                enemy_lasers.discard(laser)
+            if laser.off_screen(height):
+                enemy_lasers.discard(laser)
+
+
+def sweep_and_shoot(engine):
+    """
+    Takes an engine and returns scripted controls for its next frame:
+    always shoots and sweeps the player left and right across the screen.
+    """
+    if (engine.get_tick() // 120) % 2 == 0:
+        return Engine.SHOOT | Engine.LEFT
+    return Engine.SHOOT | Engine.RIGHT
+
+
+def hunt_and_shoot(engine):
+    """
+    Takes an engine and returns simple AI controls for its next frame:
+    always shoots, dodges enemies and enemy lasers falling towards the player,
+    and otherwise moves under the lowest enemy on screen.
+    """
+    game = engine.get_game()
+    player = engine.get_player()
+    left = player.get_x()
+    right = left + player.get_width()
+    center = (left + right) / 2
+
+    # Dodges away from the nearest enemy or laser about to fall onto the player
+    threat = None
+    for obj in list(game.get_enemies()) + list(game.get_enemy_lasers()):
+        above = player.get_y() - (obj.get_y() + obj.get_height())
+        overlaps = obj.get_x() < right + 16 and obj.get_x() + obj.get_width() > left - 16
+        if overlaps and -player.get_height() < above < 200:
+            if threat is None or obj.get_y() > threat.get_y():
+                threat = obj
+    if threat is not None:
+        if threat.get_x() + threat.get_width() / 2 > center and left > player.get_speed():
+            return Engine.SHOOT | Engine.LEFT
+        if right < game.get_width() - player.get_speed():
+            return Engine.SHOOT | Engine.RIGHT
+        return Engine.SHOOT | Engine.LEFT
+
+    enemies = game.get_enemies()
+    if len(enemies) == 0:
+        return Engine.SHOOT
+    target = max(enemies, key=lambda enemy: enemy.get_y())
+    aim = target.get_x() + target.get_width() / 2 - center
+    if aim < -player.get_speed():
+        return Engine.SHOOT | Engine.LEFT
+    if aim > player.get_speed():
+        return Engine.SHOOT | Engine.RIGHT
+    return Engine.SHOOT
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Plays Garuda headless with scripted controls.")
+    parser.add_argument("--ticks", type=int, default=10000, help="maximum number of frames to play")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy movement backend")
+    parser.add_argument("--seed", type=int, help="seed for the game's random numbers")
+    args = parser.parse_args()
+
+    engine = Engine(vectorized=args.vectorized, seed=args.seed)
+    start = time.perf_counter()
+    played = engine.run(args.ticks, sweep_and_shoot)
+    elapsed = time.perf_counter() - start
+    print("Played {} frames in {:.2f} s ({:.0f} frames per second)".format(played, elapsed, played / elapsed))
+    print("Level {}, score {}, player health {}".format(engine.get_game().get_current_level(),
+                                                        engine.get_game().get_score(),
+                                                        engine.get_player().get_health()))
+    print("Seed {}, checksum {}".format(engine.get_game().get_seed(), engine.get_checksum()))
@@ -0,0 +1,219 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Plays thousands of headless games across every CPU core to balance the game.
+#   Each session is an Engine with its own seed and scripted or AI controls, played in a
+#   worker process. Every session sends back what happened in each level it reached, and
+#   the per-level totals (survival rate, score, frames to clear, peak entity counts)
+#   are merged as the sessions finish.
+#   Run "python fleet.py --sessions 2000 --controls hunt" to simulate 2000 games.
+import os
+import json
+import time
+import multiprocessing
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+from engine import Engine, sweep_and_shoot, hunt_and_shoot
+
+# Scripted and AI controls a session can be played with
+CONTROLS = {
+    "sweep": sweep_and_shoot,
+    "hunt": hunt_and_shoot
+}
+
+
+class FleetStats:
+    """
+    Per-level totals of many sessions.
+    Totals from different processes or batches can be merged in any order.
+    """
+
+    # Counters kept for each level, added together when merging
+    _sums = ("sessions", "cleared", "died", "score", "clear_frames")
+    # Counters kept for each level, merged by keeping the largest
+    _peaks = ("peak_enemies", "peak_lasers")
+
+    def __init__(self):
+        """Creates empty totals."""
+        self._levels = {}
+        self._sessions = 0
+        self._frames = 0
+
+    def get_sessions(self):
+        """Returns the number of sessions added"""
+        return self._sessions
+
+    def get_frames(self):
+        """Returns the number of frames played by every session added"""
+        return self._frames
+
+    def add(self, session):
+        """Takes the result of play_session and adds it to the totals."""
+        self._sessions += 1
+        self._frames += session["frames"]
+        for level in session["levels"]:
+            totals = self._level(level["level"])
+            totals["sessions"] += 1
+            totals["cleared"] += level["cleared"]
+            totals["died"] += level["died"]
+            totals["score"] += level["score"]
+            if level["cleared"]:
+                totals["clear_frames"] += level["frames"]
+            for name in FleetStats._peaks:
+                totals[name] = max(totals[name], level[name])
+
+    def merge(self, other):
+        """Takes another FleetStats and adds its totals to these."""
+        self._sessions += other._sessions
+        self._frames += other._frames
+        for name, level in other._levels.items():
+            totals = self._level(name)
+            for key in FleetStats._sums:
+                totals[key] += level[key]
+            for key in FleetStats._peaks:
+                totals[key] = max(totals[key], level[key])
+
+    def summary(self):
+        """
+        Returns a dictionary of level name -> survival rate, clear rate, mean score,
+        mean frames to clear, and peak enemy and laser counts, in the order levels were reached.
+        """
+        results = {}
+        for name, level in self._levels.items():
+            sessions = max(level["sessions"], 1)
+            results[name] = {
+                "sessions": level["sessions"],
+                "survival_rate": round(1 - level["died"] / sessions, 4),
+                "clear_rate": round(level["cleared"] / sessions, 4),
+                "mean_score": round(level["score"] / sessions, 1),
+                "mean_clear_frames": round(level["clear_frames"] / level["cleared"], 1) if level["cleared"] else None,
+                "peak_enemies": level["peak_enemies"],
+                "peak_lasers": level["peak_lasers"]
+            }
+        return results
+
+    def _level(self, name):
+        """Takes a level name and returns its totals, creating them the first time."""
+        totals = self._levels.get(name)
+        if totals is None:
+            totals = dict.fromkeys(FleetStats._sums + FleetStats._peaks, 0)
+            self._levels[name] = totals
+        return totals
+
+
+def play_session(task):
+    """
+    Takes a tuple of (seed, controls name, frame limit, whether to use the NumPy backend).
+    Plays one headless game until it ends or reaches the frame limit.
+    Returns a dictionary of the frames played and a list with one entry per level reached:
+    its name, whether it was cleared or the player died in it, the score gained,
+    the frames spent in it, and its peak enemy and laser counts.
+    """
+    seed, controls, max_ticks, vectorized = task
+    controls = CONTROLS[controls]
+    engine = Engine(vectorized=vectorized, seed=seed)
+    game = engine.get_game()
+    names = [level.__name__ for level in game.get_level_sequence()]
+    levels = []
+    current = None
+    while engine.is_running() and engine.get_tick() < max_ticks:
+        engine.tick(controls(engine))
+
+        # A new level was loaded this frame; the previous one was cleared.
+        # Checked before the player's death so a death on the same frame counts toward the new level.
+        if current is None or game.get_current_level() != current["index"]:
+            if current is not None:
+                current["cleared"] = True
+            index = game.get_current_level()
+            current = {"index": index, "level": names[min(index, len(names)) - 1], "start": engine.get_tick(),
+                       "start_score": game.get_score(), "cleared": False, "died": False,
+                       "peak_enemies": 0, "peak_lasers": 0}
+            levels.append(current)
+
+        if engine.is_lost():
+            current["died"] = True
+            break
+
+        enemies = len(game.get_enemies()) + game.get_dormant_count()
+        lasers = len(game.get_enemy_lasers()) + len(game.get_player_lasers())
+        if enemies > current["peak_enemies"]:
+            current["peak_enemies"] = enemies
+        if lasers > current["peak_lasers"]:
+            current["peak_lasers"] = lasers
+        current["end"] = engine.get_tick()
+        current["end_score"] = game.get_score()
+
+    results = []
+    for level in levels:
+        results.append({"level": level["level"], "cleared": level["cleared"], "died": level["died"],
+                        "score": level.get("end_score", level["start_score"]) - level["start_score"],
+                        "frames": level.get("end", level["start"]) - level["start"],
+                        "peak_enemies": level["peak_enemies"], "peak_lasers": level["peak_lasers"]})
+    return {"seed": seed, "frames": engine.get_tick(), "levels": results}
+
+
+def run_fleet(sessions, seed=0, controls="sweep", max_ticks=20000, vectorized=False,
+              processes=None, callback=None):
+    """
+    Takes a number of sessions, the seed of the first session (each next session uses the next seed),
+    a controls name, a per-session frame limit, whether to use the NumPy backend, an optional
+    number of worker processes (default: every core), and an optional function that takes the
+    FleetStats so far, called each time a session finishes.
+    Plays every session across a pool of processes and returns the merged FleetStats.
+    """
+    processes = processes or os.cpu_count() or 1
+    tasks = [(seed + number, controls, max_ticks, vectorized) for number in range(sessions)]
+    stats = FleetStats()
+    if processes == 1:
+        for task in tasks:
+            stats.add(play_session(task))
+            if callback is not None:
+                callback(stats)
+        return stats
+    # Small chunks keep every worker busy until the end; sessions are long, so the overhead is small.
+    chunksize = max(1, sessions // (processes * 16))
+    with multiprocessing.Pool(processes) as pool:
+        for session in pool.imap_unordered(play_session, tasks, chunksize):
+            stats.add(session)
+            if callback is not None:
+                callback(stats)
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Plays many headless games of Garuda across every core.")
+    parser.add_argument("--sessions", type=int, default=100, help="number of games to play")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game; each next game adds one")
+    parser.add_argument("--controls", choices=sorted(CONTROLS), default="sweep", help="scripted or AI controls")
+    parser.add_argument("--max-ticks", type=int, default=20000, help="frame limit per game")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy movement backend")
+    parser.add_argument("--processes", type=int, help="worker processes (default: every core)")
+    parser.add_argument("--json", metavar="PATH", help="write the per-level results to this JSON file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+
+    def progress(stats):
+        """Prints the sessions finished so far every tenth of the way."""
+        done = stats.get_sessions()
+        if done == args.sessions or done % max(1, args.sessions // 10) == 0:
+            elapsed = time.perf_counter() - start
+            print("{}/{} sessions, {:.1f} sessions/s, {:.0f} frames/s".format(
+                done, args.sessions, done / elapsed, stats.get_frames() / elapsed))
+
+    fleet = run_fleet(args.sessions, args.seed, args.controls, args.max_ticks, args.vectorized,
+                      args.processes, progress)
+    summary = fleet.summary()
+    print("{:<12} {:>8} {:>9} {:>7} {:>10} {:>11} {:>8} {:>7}".format(
+        "level", "sessions", "survival", "clear", "score", "clear time", "enemies", "lasers"))
+    for name, level in summary.items():
+        clear_frames = level["mean_clear_frames"]
+        print("{:<12} {:>8} {:>8.1%} {:>6.1%} {:>10.1f} {:>11} {:>8} {:>7}".format(
+            name, level["sessions"], level["survival_rate"], level["clear_rate"], level["mean_score"],
+            "-" if clear_frames is None else "{:.0f}".format(clear_frames),
+            level["peak_enemies"], level["peak_lasers"]))
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump({"sessions": args.sessions, "seed": args.seed, "controls": args.controls,
+                       "levels": summary}, file, indent=2)
+        print("Saved results to {}".format(args.json))
@@ -0,0 +1,111 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Keeps an overloaded game running at full speed by lowering its drawing quality.
+#   The FrameGovernor compares the time each game frame takes with the budget of one frame
+#   at the game's fps. While frames run over budget it applies degradation steps one at a time,
+#   in order; once frames are comfortably under budget again it restores them, the last one
+#   applied first. Every step applied or restored is logged.
+from collections import deque
+
+# Degradation steps a governor can apply, in the order they are applied:
+#   "explosions"   - explosions are not drawn (they still damage what they touch)
+#   "enemy_lasers" - each enemy laser is drawn every other frame, half of them each frame
+#   "decorations"  - the background image is replaced with a plain fill
+#   "substeps"     - the game runs two frames for each frame drawn
+DEGRADATIONS = ("explosions", "enemy_lasers", "decorations", "substeps")
+
+
+class FrameGovernor:
+    """
+    Watches frame times against a budget and applies or restores degradation steps.
+    A step is only applied or restored after a full window of frames measured since the last change,
+    so each change is judged by frames that were run with it. The frames right after a step is applied
+    show how much it saves, and it is only restored once frames would be under budget without it,
+    so a step that saves a lot is not restored and applied again over and over.
+    """
+
+    def __init__(self, budget=1/60, steps=DEGRADATIONS, window=30, overload=1.0, recovery=0.6, log=print):
+        """
+        Takes the seconds one game frame may take, the degradation steps to apply in order,
+        the number of frames averaged before each decision, the fraction of the budget above which
+        the next step is applied, the fraction below which the last step is restored,
+        and a function that takes a message, called for every step applied or restored (or None).
+        """
+        for step in steps:
+            if step not in DEGRADATIONS:
+                raise ValueError("unknown degradation step: {}".format(step))
+        self._budget = budget
+        self._steps = tuple(steps)
+        self._overload = overload
+        self._recovery = recovery
+        self._log = log
+        self._applied = 0
+        self._frames = 0
+        # Seconds per game frame of the frames measured since the last change
+        self._times = deque(maxlen=window)
+        # [mean seconds per game frame before, ratio saved or None until measured] of each applied step
+        self._costs = []
+        # (frame, step, True if applied or False if restored, mean ms per game frame) of every change
+        self._transitions = []
+
+    # Get Methods
+    def get_budget(self):
+        """Returns the seconds one game frame may take"""
+        return self._budget
+
+    def get_steps(self):
+        """Returns the degradation steps the governor may apply, in order"""
+        return self._steps
+
+    def get_applied(self):
+        """Returns the degradation steps applied now, in the order they were applied"""
+        return self._steps[:self._applied]
+
+    def is_applied(self, step):
+        """Takes a degradation step name and returns True if it is applied now, else False"""
+        return step in self._steps[:self._applied]
+
+    def get_substeps(self):
+        """Returns the number of game frames to run for each frame drawn"""
+        return 2 if self.is_applied("substeps") else 1
+
+    def get_transitions(self):
+        """
+        Returns a list of (frame, step, True if applied or False if restored, mean ms per game frame)
+        of every change, oldest first
+        """
+        return self._transitions
+
+    # Other Methods
+    def record(self, seconds, frames=1):
+        """
+        Takes the seconds spent running and drawing the last drawn frame and the number of game frames run
+        for it. Applies the next degradation step if the frames since the last change ran over budget,
+        or restores the last step applied if they ran well under it.
+        """
+        self._frames += frames
+        self._times.append(seconds / frames)
+        if len(self._times) < self._times.maxlen:
+            return
+        mean = sum(self._times) / len(self._times)
+        if self._costs and self._costs[-1][1] is None:
+            self._costs[-1][1] = max(self._costs[-1][0] / mean, 1.0)
+        if mean > self._budget * self._overload and self._applied < len(self._steps):
+            self._applied += 1
+            self._costs.append([mean, None])
+            self._change(self._steps[self._applied - 1], True, mean)
+        elif self._applied > 0 and mean * self._costs[-1][1] < self._budget * self._recovery:
+            self._applied -= 1
+            self._costs.pop()
+            self._change(self._steps[self._applied], False, mean)
+
+    def _change(self, step, applied, mean):
+        """
+        Takes the step just applied or restored, True if it was applied, and the mean seconds per
+        game frame that caused it. Keeps and logs the change and starts measuring anew.
+        """
+        self._times.clear()
+        self._transitions.append((self._frames, step, applied, mean * 1000))
+        if self._log is not None:
+            self._log("frame {}: {:.2f} ms per frame against a {:.2f} ms budget, {} {}".format(
+                self._frames, mean * 1000, self._budget * 1000, "applied" if applied else "restored", step))
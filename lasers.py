@@ -1,20 +1,78 @@
 # Author: Justin David Todd
-# Last Modified: 02/04/2021
+# Last Modified: 10/17/2026
 # Description: Defines collisions, designs the laser objects to be fired by the ships
 #   including a dictionary of all the laser varieties and explosions.
 
 import pygame
+from collections import namedtuple
+from assets import Assets
+
+
+class CollisionStats:
+    """
+    Counts how collision tests end, so the pixel-mask path can be confirmed to be rare.
+    "rect_rejected" tests stop at the bounding rects, "pixel_miss" and "pixel_hit" reach the masks.
+    """
+    _counts = {"rect_rejected": 0, "pixel_miss": 0, "pixel_hit": 0}
+
+    @classmethod
+    def get_counts(cls):
+        """Returns a dictionary of how many collision tests ended at each stage."""
+        return dict(cls._counts)
+
+    @classmethod
+    def get_total(cls):
+        """Returns the total number of collision tests counted."""
+        return sum(cls._counts.values())
+
+    @classmethod
+    def reset(cls):
+        """Sets every counter back to zero."""
+        for stage in cls._counts:
+            cls._counts[stage] = 0
 
 
 def collide(obj1, obj2):
     """
-    Takes two objects with masks and x/y coordinates.
-    Compares the masks of the two objects;
+    Takes two objects with masks, bounding rects and x/y coordinates.
+    Rejects objects whose bounding rects do not overlap,
+    otherwise compares the masks of the two objects;
     returns True if they have overlap, else returns False.
     """
-    offset_x = obj2.get_x() - obj1.get_x()
-    offset_y = obj2.get_y() - obj1.get_y()
-    return obj1.get_mask().overlap(obj2.get_mask(), (int(offset_x), int(offset_y))) is not None
+    counts = CollisionStats._counts
+    rect1 = obj1.get_rect()
+    rect2 = obj2.get_rect()
+    offset_x = int(obj2.get_x() - obj1.get_x())
+    offset_y = int(obj2.get_y() - obj1.get_y())
+    # Rects are compared at the same integer offset the masks use, so both tests always agree.
+    if not (-rect2.width < offset_x < rect1.width and -rect2.height < offset_y < rect1.height):
+        counts["rect_rejected"] += 1
+        return False
+    if obj1.get_mask().overlap(obj2.get_mask(), (offset_x, offset_y)) is None:
+        counts["pixel_miss"] += 1
+        return False
+    counts["pixel_hit"] += 1
+    return True
+
+
+class LaserType(namedtuple("LaserType", "damage velocity cool_down image_name move_pattern")):
+    """
+    Immutable design shared by every laser of one type.
+    Built once at import time; lasers keep a reference to it instead of copying its fields.
+    """
+    __slots__ = ()
+
+    def get_image(self):
+        """returns the shared image of this laser type"""
+        return Assets.get_image(self.image_name)
+
+    def get_sprite(self):
+        """returns the surface and area to blit to draw this laser type (see Assets.get_sprite)"""
+        return Assets.get_sprite(self.image_name)
+
+    def get_mask(self):
+        """returns the shared collision mask of this laser type"""
+        return Assets.get_mask(self.image_name)
 
 
 class Laser:
@@ -23,52 +81,24 @@ class Laser:
     Cause damage and disappear upon impact.
     """
 
+    # Laser instances only store their position, timers and type.
+    __slots__ = ("_x", "_y", "_move_timer", "_direction", "_prototype", "_rect")
+
     def __init__(self, x, y, laser_type):
         """
-        takes a starting x and y coordinates and a laser image
+        takes a starting x and y coordinates and a laser type
         creates a laser object that propels at a set speed until colliding with the end of the screen
         or an opposing ship.
         """
-        # Dictionary of Laser Images
-        self._image = {
-            # Laser Images = image file should be 16 x 32 pixels
-            "green_blast": pygame.image.load("assets/green_blast.png"),
-            "blank": pygame.image.load("assets/Blank.png"),
-            "explosion": pygame.image.load("assets/simple_explosion.png"),
-            "green_laser": pygame.image.load("assets/laser_green.png"),
-            "lightning": pygame.image.load("assets/lightning blue.png"),
-            "blueShot": pygame.image.load("assets/pellet blue.png"),
-            "greenShot": pygame.image.load("assets/pellet green.png"),
-            "redShot": pygame.image.load("assets/pellet red.png"),
-            "yellowShot": pygame.image.load("assets/pellet yellow.png"),
-            "rayBlue": pygame.image.load("assets/rayBlue.png"),
-            "rayGreen": pygame.image.load("assets/rayGreen.png"),
-            "rayRed": pygame.image.load("assets/rayRed.png"),
-            "blasterGreen": pygame.image.load("assets/blasterGreen.png"),
-            "blasterRed": pygame.image.load("assets/blasterRed.png")
-        }
-
-        # Dictionary of Laser Types
-        self._laser_type = {
-            # "laser_type" : (damage, velocity, cool_down, laser_img, move_pattern)
-            "green": (10, 10, 15, self._image["green_laser"], self.normal),
-            "player_green": (100, -10, 15, self._image["green_blast"], self.normal),
-            "explosion": (30, 10, 15, self._image["explosion"], self.delayed),
-            "explosion_zero": (0, 10, 15, self._image["explosion"], self.delayed),
-            "lightning": (30, 30, 5, self._image["lightning"], self.normal),
-            "blueShot": (10, 10, 15, self._image["blueShot"], self.normal),
-            "greenShot": (10, 10, 15, self._image["greenShot"], self.normal),
-            "redShot": (10, 10, 15, self._image["redShot"], self.normal),
-            "yellowShot": (10, 10, 15, self._image["yellowShot"], self.normal),
-            "rayBlue": (30, 10, 15, self._image["rayBlue"], self.normal),
-            "rayGreen": (10, 10, 15, self._image["rayGreen"], self.normal),
-            "rayRed": (20, 10, 15, self._image["rayRed"], self.normal),
-            "blasterGreen": (10, 10, 15, self._image["blasterGreen"], self.weave),
-            "blasterGreen2": (10, 10, 15, self._image["blasterGreen"], self.weave2),
-            "blasterRed": (10, 10, 15, self._image["blasterRed"], self.normal),
-            "blank": (0, 1000, 1000, self._image["blank"], self.normal)
-
-        }
+        # Bounding rect, brought up to date whenever it is requested
+        self._rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, laser_type)
+
+    def reset(self, x, y, laser_type):
+        """
+        takes x and y coordinates and a laser type
+        returns the laser to its just-fired state so it can be reused for a new shot
+        """
         self._x = x
         self._y = y
 
@@ -76,15 +106,8 @@ class Laser:
         self._move_timer = 0
         self._direction = 0
 
-        # Define Laser Attributes based on type
-        self._damage = self._laser_type[laser_type][0]         # Damage
-        self._velocity = self._laser_type[laser_type][1]       # Velocity
-        self._cool_down = self._laser_type[laser_type][2]      # Cool Down Time
-        self._laser_img = self._laser_type[laser_type][3]      # Image
-        self.move_pattern = self._laser_type[laser_type][4]     # Movement Pattern
-
-        # Define Mask for collisions
-        self._mask = pygame.mask.from_surface(self._laser_img)
+        # Damage, velocity, cool down, image and movement pattern are shared by the laser type
+        self._prototype = self._laser_type[laser_type]
 
     # Get Methods
     def get_x(self):
@@ -97,39 +120,81 @@ class Laser:
 
     def get_width(self):
         """returns width of laser's image"""
-        return self._laser_img.get_width()
+        return self._prototype.get_image().get_width()
+
+    def get_height(self):
+        """returns height of laser's image"""
+        return self._prototype.get_image().get_height()
 
     def get_damage(self):
         """returns laser's damage value"""
-        return self._damage
+        return self._prototype.damage
 
     def get_velocity(self):
         """returns laser's rate of travel"""
-        return self._velocity
+        return self._prototype.velocity
 
     def get_cool_down(self):
         """returns laser's cool_down length"""
-        return self._cool_down
+        return self._prototype.cool_down
 
     def get_mask(self):
         """returns the laser's image mask"""
-        return self._mask
+        return self._prototype.get_mask()
+
+    def get_rect(self):
+        """returns the laser's bounding rect at its current coordinates"""
+        image = self._prototype.get_image()
+        self._rect.update(self._x, self._y, image.get_width(), image.get_height())
+        return self._rect
 
     def get_move_timer(self):
         """returns the laser's move_timer"""
         return self._move_timer
 
+    def get_move_pattern(self):
+        """returns the laser's movement pattern function"""
+        return self._prototype.move_pattern
+
+    def get_image_name(self):
+        """returns the name of the laser's image in the asset registry"""
+        return self._prototype.image_name
+
+    def get_motion(self):
+        """returns the state used by movement patterns as a tuple of (x, y, velocity, move_timer)"""
+        return self._x, self._y, self._prototype.velocity, self._move_timer
+
+    # Set Methods
+    @staticmethod
+    def set_motions(lasers, columns):
+        """
+        takes a list of lasers and a dictionary holding a list of "y" values,
+        and optionally lists of "x" and "timer" values.
+        stores each laser's new movement state (used by the vectorized movement backend)
+        """
+        if "x" not in columns:
+            for laser, y in zip(lasers, columns["y"]):
+                laser._y = y
+            return
+        for laser, x, y, timer in zip(lasers, columns["x"], columns["y"], columns["timer"]):
+            laser._x = x
+            laser._y = y
+            laser._move_timer = timer
+
     # Other Methods
     def draw(self, surface):
         """
         takes a surface
-        draws the laser at its current coordinates on that surface
+        draws the laser at its current coordinates, scaled to the window, on that surface
+        from the shared sprite atlas; returns the rect drawn over
         """
-        surface.blit(self._laser_img, (self._x, self._y))
+        image, area = self._prototype.get_sprite()
+        scale = Assets.get_scale()
+        return surface.blit(image, (self._x * scale, self._y * scale), area)
 
     def mov(self):
         """moves the laser according to its movement pattern once fired"""
-        self.move_pattern()
+        self._prototype.move_pattern(self)
 
     def off_screen(self, height):
         """
@@ -156,7 +221,7 @@ class Laser:
     # Collection of Laser Movement Patterns
     def normal(self):
         """shoots laser in straight line"""
-        self._y += self._velocity
+        self._y += self._prototype.velocity
 
     def weave(self):
         """shoots laser in straight line"""
@@ -167,7 +232,7 @@ class Laser:
         self._move_timer += 1
         if self._move_timer > 60:
             self._move_timer = 0
-        self._y += self._velocity
+        self._y += self._prototype.velocity
 
     def weave2(self):
         """shoots laser in straight line"""
@@ -178,7 +243,7 @@ class Laser:
         self._move_timer += 1
         if self._move_timer > 60:
             self._move_timer = 0
-        self._y += self._velocity
+        self._y += self._prototype.velocity
 
     def delayed(self):
         """holds blast in place for .5 seconds, then moves below the screen (disappears)"""
@@ -186,3 +251,109 @@ class Laser:
             self._move_timer += 1
         else:
             self._y = 10000
+
+    # Closed Forms of the Laser Movement Patterns
+    # Each takes a number of frames and returns the laser's (x, y, move_timer) after that many
+    # frames of the pattern of the same name, without moving the laser.
+    def normal_after(self, frames):
+        """position of normal after a number of frames"""
+        return self._x, self._y + self._prototype.velocity * frames, self._move_timer
+
+    def weave_after(self, frames):
+        """position of weave after a number of frames, or None if move_timer is outside its cycle"""
+        return self._weave_after(frames, 1)
+
+    def weave2_after(self, frames):
+        """position of weave2 after a number of frames, or None if move_timer is outside its cycle"""
+        return self._weave_after(frames, -1)
+
+    def _weave_after(self, frames, sign):
+        """
+        position of weave (sign 1) or weave2 (sign -1) after a number of frames.
+        move_timer counts 0 to 60 and the laser moves sideways one way while it is below 30,
+        so the sideways steps are the difference of two counts of whole and partial cycles.
+        """
+        timer = self._move_timer
+        if not 0 <= timer <= 60:
+            return None
+        steps = self._weave_steps(timer + frames) - self._weave_steps(timer)
+        return self._x + sign * 3 * steps, self._y + self._prototype.velocity * frames, (timer + frames) % 61
+
+    @staticmethod
+    def _weave_steps(count):
+        """takes a number of frames from the start of a weave cycle; returns the right steps minus left steps in them"""
+        cycles, count = divmod(count, 61)
+        return -cycles + (count if count <= 30 else 60 - count)
+
+    def delayed_after(self, frames):
+        """position of delayed after a number of frames"""
+        timer = self._move_timer
+        waiting = max(0, min(frames, 30 - timer))
+        y = 10000 if frames > waiting else self._y
+        return self._x, y, timer + waiting
+
+    # Closed form of each movement pattern
+    _trajectories = {
+        normal: normal_after,
+        weave: weave_after,
+        weave2: weave2_after,
+        delayed: delayed_after
+    }
+
+    @classmethod
+    def get_trajectory(cls, move_pattern):
+        """takes a movement pattern and returns its closed form, or None if it must be stepped"""
+        return cls._trajectories.get(move_pattern)
+
+    def get_state_after(self, frames):
+        """
+        takes a number of frames
+        returns the laser's (x, y, move_timer) after that many frames of its movement pattern
+        without moving it, or None if its pattern has no closed form
+        """
+        trajectory = Laser.get_trajectory(self._prototype.move_pattern)
+        return None if trajectory is None else trajectory(self, frames)
+
+    def advance(self, frames):
+        """
+        takes a number of frames and moves the laser that many frames at once,
+        with the closed form of its movement pattern if it has one, else one frame at a time.
+        """
+        state = self.get_state_after(frames)
+        if state is None:
+            pattern = self._prototype.move_pattern
+            for frame in range(frames):
+                pattern(self)
+        else:
+            self._x, self._y, self._move_timer = state
+
+    # Dictionary of Laser Types, built once when the module is imported
+    _laser_type = {
+        # "laser_type" : LaserType(damage, velocity, cool_down, image name, move_pattern)
+        "green": LaserType(10, 10, 15, "green_laser", normal),
+        "player_green": LaserType(100, -10, 15, "green_blast", normal),
+        "explosion": LaserType(30, 10, 15, "explosion", delayed),
+        "explosion_zero": LaserType(0, 10, 15, "explosion", delayed),
+        "lightning": LaserType(30, 30, 5, "lightning", normal),
+        "blueShot": LaserType(10, 10, 15, "blueShot", normal),
+        "greenShot": LaserType(10, 10, 15, "greenShot", normal),
+        "redShot": LaserType(10, 10, 15, "redShot", normal),
+        "yellowShot": LaserType(10, 10, 15, "yellowShot", normal),
+        "rayBlue": LaserType(30, 10, 15, "rayBlue", normal),
+        "rayGreen": LaserType(10, 10, 15, "rayGreen", normal),
+        "rayRed": LaserType(20, 10, 15, "rayRed", normal),
+        "blasterGreen": LaserType(10, 10, 15, "blasterGreen", weave),
+        "blasterGreen2": LaserType(10, 10, 15, "blasterGreen", weave2),
+        "blasterRed": LaserType(10, 10, 15, "blasterRed", normal),
+        "blank": LaserType(0, 1000, 1000, "blank", normal)
+    }
+
+    @classmethod
+    def get_laser_type(cls, laser_type):
+        """takes a laser type name and returns its shared LaserType"""
+        return cls._laser_type[laser_type]
+
+    @classmethod
+    def get_laser_type_names(cls):
+        """returns the name of every laser type"""
+        return list(cls._laser_type)
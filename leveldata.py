@@ -0,0 +1,245 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Declarative level files and their compiled spawn tables.
+#   A level file (levels/<name>.json) lists waves of spawn patterns. Compiling a level
+#   runs each pattern once and keeps every enemy it spawns as one row of a flat table,
+#   which is cached in levels/.cache as a compact binary file next to a hash of its source.
+#   Loading a level then reads that file in one go instead of running any pattern code.
+#   Run "python leveldata.py --convert" to write the Python level methods of GarudaGame as level files.
+import hashlib
+import json
+import os
+import random
+import struct
+
+LEVEL_DIR = "levels"
+CACHE_DIR = os.path.join(LEVEL_DIR, ".cache")
+
+# Compiled files start with the magic, the format version and the SHA-256 of their source
+_MAGIC = b"GLVL"
+_VERSION = 1
+_HEADER = struct.Struct("<4sH32sHI")        # magic, version, source hash, species count, row count
+_ROW = struct.Struct("<iiHB")               # x, y, species index, flags
+
+# Flag of rows whose x is drawn from the game's spawn random numbers when loaded;
+# x then holds the width of the ship
+RANDOM_X = 1
+
+
+class SpawnTable:
+    """
+    Flat list of every enemy a level spawns, in the order the level's patterns spawn them.
+    Each row is a tuple of (x, y, species index, flags); the species names are stored once.
+    """
+
+    def __init__(self, species, rows, source_hash=b"\0" * 32):
+        """
+        Takes a list of species names, a list of (x, y, species index, flags) rows,
+        and the SHA-256 digest of the level file they were compiled from.
+        """
+        self._species = species
+        self._rows = rows
+        self._source_hash = source_hash
+
+    def __len__(self):
+        """Returns the number of rows."""
+        return len(self._rows)
+
+    def get_species(self):
+        """Returns the list of species names the rows' species indexes refer to"""
+        return self._species
+
+    def get_rows(self):
+        """Returns the list of (x, y, species index, flags) rows in spawn order"""
+        return self._rows
+
+    def get_source_hash(self):
+        """Returns the SHA-256 digest of the level file the table was compiled from"""
+        return self._source_hash
+
+    def to_bytes(self):
+        """Returns the table packed into the compiled level format."""
+        parts = [_HEADER.pack(_MAGIC, _VERSION, self._source_hash, len(self._species), len(self._rows))]
+        for name in self._species:
+            encoded = name.encode("utf-8")
+            parts.append(struct.pack("<B", len(encoded)) + encoded)
+        parts.extend(_ROW.pack(*row) for row in self._rows)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Takes bytes in the compiled level format and returns their SpawnTable, or None if they are not valid."""
+        if len(data) < _HEADER.size:
+            return None
+        magic, version, source_hash, species_count, row_count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            return None
+        offset = _HEADER.size
+        species = []
+        for _ in range(species_count):
+            length = data[offset]
+            species.append(data[offset + 1:offset + 1 + length].decode("utf-8"))
+            offset += 1 + length
+        if len(data) - offset != row_count * _ROW.size:
+            return None
+        return cls(species, list(_ROW.iter_unpack(data[offset:])), source_hash)
+
+
+def _recorder_class():
+    """Returns a GarudaGame subclass that records the enemies its spawn patterns create."""
+    from GarudaGame import GarudaGame, DESIGN_WIDTH
+
+    class SpawnRecorder(GarudaGame):
+        """
+        GarudaGame whose spawn patterns add rows to a list instead of creating enemies.
+        Random x coordinates are drawn from the level's seed if it has one, else left to be drawn on load.
+        """
+
+        def __init__(self, seed=None):
+            super().__init__(0)
+            self.species = []
+            self.rows = []
+            self._level_random = None if seed is None else random.Random(seed)
+
+        def spawn_enemy(self, x, y, species):
+            self.rows.append((int(x), int(y), self._species_index(species), 0))
+
+        def spawn_enemy_at_random_x(self, ship_width, y, species):
+            if self._level_random is None:
+                self.rows.append((int(ship_width), int(y), self._species_index(species), RANDOM_X))
+            else:
+                self.spawn_enemy(self._level_random.randint(0, DESIGN_WIDTH - ship_width), y, species)
+
+        def _species_index(self, species):
+            if species not in self.species:
+                self.species.append(species)
+            return self.species.index(species)
+
+    return SpawnRecorder
+
+
+def compile_level(description, source_hash=b"\0" * 32):
+    """
+    Takes a level description (the parsed contents of a level file) and an optional source hash.
+    Runs each spawn of each wave once and returns the SpawnTable of the enemies they spawn.
+    Each spawn's distance is measured from its wave's offset.
+    """
+    recorder = _recorder_class()(description.get("seed"))
+    for wave in description["waves"]:
+        offset = wave.get("offset", 0)
+        for spawn in wave["spawns"]:
+            args = dict(spawn)
+            pattern = args.pop("pattern")
+            args["distance"] = args.get("distance", 0) + offset
+            if pattern == "enemy":
+                recorder.spawn_enemy(args["x"], -args["distance"], args["species"])
+            else:
+                getattr(recorder, "spawn_" + pattern)(**args)
+    return SpawnTable(recorder.species, recorder.rows, source_hash)
+
+
+def load(name, level_dir=LEVEL_DIR, cache_dir=CACHE_DIR):
+    """
+    Takes a level name and optional level and cache directories.
+    Returns the level's SpawnTable, read from the cache if it was compiled from the current
+    level file, else compiled from the level file and written to the cache.
+    """
+    with open(os.path.join(level_dir, name + ".json"), "rb") as file:
+        source = file.read()
+    source_hash = hashlib.sha256(source).digest()
+
+    cache_path = os.path.join(cache_dir, name + ".bin")
+    try:
+        with open(cache_path, "rb") as file:
+            table = SpawnTable.from_bytes(file.read())
+        if table is not None and table.get_source_hash() == source_hash:
+            return table
+    except OSError:
+        pass
+
+    table = compile_level(json.loads(source), source_hash)
+    # A cache that cannot be written (read-only install) only costs compiling again next time
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, "wb") as file:
+            file.write(table.to_bytes())
+    except OSError:
+        pass
+    return table
+
+
+def convert_level(level):
+    """
+    Takes a GarudaGame level method (such as GarudaGame.level_one) and returns its level description.
+    A new wave starts whenever a spawn is 600 or more pixels beyond the current wave's offset.
+    """
+    import inspect
+    from GarudaGame import GarudaGame
+
+    class PatternRecorder:
+        """Stands in for the game, keeping each spawn pattern call a level method makes."""
+
+        def __init__(self):
+            self.calls = []
+
+        def __getattr__(self, name):
+            method = getattr(GarudaGame, name)
+
+            def record(*args, **kwargs):
+                arguments = inspect.signature(method).bind(None, *args, **kwargs).arguments
+                arguments.pop("self")
+                self.calls.append((name[len("spawn_"):], arguments))
+            return record
+
+    recorder = PatternRecorder()
+    level(recorder)
+
+    waves = []
+    for pattern, arguments in recorder.calls:
+        if pattern == "enemy":
+            spawn = {"pattern": pattern, "x": arguments["x"], "distance": -arguments["y"],
+                     "species": arguments["species"]}
+        else:
+            spawn = {"pattern": pattern}
+            spawn.update((key, value) for key, value in arguments.items() if value is not None)
+        if not waves or spawn["distance"] >= waves[-1]["offset"] + 600:
+            waves.append({"offset": spawn["distance"], "spawns": []})
+        spawn["distance"] -= waves[-1]["offset"]
+        waves[-1]["spawns"].append(spawn)
+    return {"name": level.__name__, "seed": None, "waves": waves}
+
+
+def _write_description(description, path):
+    """Takes a level description and writes it to a level file, one spawn per line."""
+    lines = ["{",
+             '    "name": {},'.format(json.dumps(description["name"])),
+             '    "seed": {},'.format(json.dumps(description["seed"])),
+             '    "waves": [']
+    for number, wave in enumerate(description["waves"]):
+        lines.append('        {{"offset": {}, "spawns": ['.format(wave["offset"]))
+        spawns = ["            " + json.dumps(spawn) for spawn in wave["spawns"]]
+        lines.append(",\n".join(spawns))
+        lines.append("        ]}" + ("," if number < len(description["waves"]) - 1 else ""))
+    lines.extend(["    ]", "}", ""])
+    with open(path, "w") as file:
+        file.write("\n".join(lines))
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Converts and compiles Garuda level files.")
+    parser.add_argument("--convert", action="store_true",
+                        help="write each Python level method of GarudaGame as a level file")
+    args = parser.parse_args()
+
+    from GarudaGame import GarudaGame
+    game = GarudaGame(0)
+    game.load_levels()
+    names = [level.__name__ for level in game.get_level_sequence()]
+    if args.convert:
+        os.makedirs(LEVEL_DIR, exist_ok=True)
+        for name in names:
+            _write_description(convert_level(getattr(GarudaGame, name)), os.path.join(LEVEL_DIR, name + ".json"))
+            print("Wrote", os.path.join(LEVEL_DIR, name + ".json"))
+    for name in names:
+        print("{:<12} {:>5} enemies".format(name, len(load(name))))
@@ -1,199 +1,170 @@
 # Author: Justin David Todd
 # Date: 02/04/2021
+# Last Modified: 10/17/2026
 # Description: This is a space ship vs aliens shooting game.
-# This main function holds the game loop with internal functions for the title screen,
-# creating a new game, and updating the window display.
+# This main function holds the game loop with internal functions for the title screen
+# and creating a new game. The game's rules run in engine.py and are drawn by renderer.py.
 # A ship at the bottom of the screen shoots enemies and scores points based on the number
 # of ships defeated.
 # The project is still ongoing with a focus on making the ships, player, and lasers
 # more modular so their attributes can be easily adapted, adjusted, and generated.
 # The current design uses no global variables with all attributes encapsulated in classes and
 # aims to use pre-constructed levels rather than merely randomly generating enemies.
+import os
+import time
 import pygame
 from Config import Config
-from GarudaGame import GarudaGame
-import random
+from assets import Assets
+from profiler import FrameProfiler, ProfilerOverlay, MemoryProfiler
+from governor import FrameGovernor, DEGRADATIONS
 
 
-def main():
+def main(record=None, replay=None, profiler=None, dirty=False, startup_probe=False, size=(800, 800),
+         degradations=DEGRADATIONS, memory_profile=None):
     """
+    Takes an optional file path to record each new game to,
+    an optional recorded game to replay instead of reading the keyboard,
+    an optional FrameProfiler to record every frame's stats to,
+    whether to update only the regions of the window drawn over each frame,
+    whether to print the time the title screen is first shown and quit (used by benchmarks/startup.py),
+    an optional window (width, height),
+    the degradation steps applied in order while frames run over budget (see governor.py),
+    and an optional file path to save memory snapshots of each new game to, numbered by game
+    (see profiler.MemoryProfiler).
     Loads System configurations.
     Creates the game window opened to title screen
     Current Title Menu options:
         New Game
         Quit
     """
+    # Number of new games started, which numbers their memory profiles
+    games = 0
+
     def new_game():
         """Runs a new game of player ship shooting enemy ships"""
-        game = GarudaGame()
+        nonlocal games
+        games += 1
+        # Imported on the first game so they do not delay the title screen
+        from engine import Engine
+        from renderer import Renderer, DirtyRenderer
+        from replay import Replay
         # Configures Game settings to match sys/Config settings.
-        game.resize_window(sys.get_width(), sys.get_height())
-        # Spawns a new player and loads the sequence of game levels
-        player = game.spawn_player()
-        game.load_levels()
-
-        # Defines the new game as running, and not lost.
-        running = True
-        lost = False
-        level_starting = False
+        # The engine runs the game's rules; the renderer draws each frame.
+        if replay is None:
+            engine = Engine(sys.get_world_width(), sys.get_world_height(), sys.get_vectorized())
+            recording = Replay.start(engine)
+            replay_controls = None
+        else:
+            # Plays back the recorded game with its seed and controls
+            engine = replay.new_engine(sys.get_vectorized())
+            recording = None
+            replay_controls = iter(replay.get_controls())
+        renderer = DirtyRenderer(sys) if sys.get_dirty_rendering() else Renderer(sys)
+        # Times each phase of every frame; F3 shows the timings over the game
+        profiler.attach(engine)
+        overlay = ProfilerOverlay(sys, profiler, 1 / engine.get_game().get_fps())
+        # Snapshots the game's memory at each level and every 1800 frames when asked to
+        memory = None
+        if memory_profile is not None:
+            memory = MemoryProfiler()
+            memory.attach(engine)
+        # Lowers drawing quality while frames run over budget, and restores it when they do not
+        governor = FrameGovernor(1 / engine.get_game().get_fps(), degradations)
+        renderer.set_governor(governor)
 
-        # Creates a count for Game Over message duration and creates a clock to track FPS.
-        lost_count = 0
-        level_count = 0
+        # Creates a clock to track FPS.
         clock = pygame.time.Clock()
 
-        def update_window():
-            """
-            Draws the images to be displayed in each frame, then updates the display.
-            Displays GAME OVER at loss
-            Controls Player/Enemy/Laser coundaries and actions each frame.
-            """
-            # Draws Background
-            sys.get_window().blit(game.get_background(), (0, 0))
-
-            """Controls Player actions each frame"""
-            # Prevents player from moving off-screen
-            if player.get_x() < 0:
-                player.set_x(0)
-            if player.get_x() > game.get_width() - player.get_width():
-                player.set_x(game.get_width() - player.get_width())
-            if player.get_y() < 0:
-                player.set_y(0)
-            if player.get_y() > game.get_height() - 20 - player.get_height():
-                player.set_y(game.get_height() - 20 - player.get_height())
-
-            # Draws player and decrements player's laser cool down timer each frame
-            if not lost:
-                player.draw(sys.get_window())
-                player.cool_down()
-
-            """ Controls Enemy actions each frame"""
-            for enemy in game.get_enemies()[:]:
-                enemy.move()
-                # controls how often enemies randomly fire
-                if random.randrange(0, 3*game.get_fps()) == 1:
-                    enemy.shoot()
-                enemy.cool_down()
-                # enemies disappear when health reaches zero
-                if enemy.get_health() <= 0:
-                    game.amend_score(enemy.get_value())
-                    game.get_enemies().remove(enemy)
-                # explodes enemies that reach end of screen or collide with the player
-                if enemy.get_y() > game.get_height() - enemy.get_height() or enemy.collision(player):
-                    enemy.explode()
-                    game.get_enemies().remove(enemy)
-                # draws enemy
-                enemy.draw(sys.get_window())
-
-            """ Controls Laser Movements each frame."""
-            # Moves Player Lasers and removes off-screen lasers
-            for laser in game.get_player_lasers()[:]:
-                laser.mov()
-                # damages enemies hit by player lasers
-                for enemy in game.get_enemies()[:]:
-                    if laser.collision(enemy):
-                        enemy.deplete_health(laser.get_damage())
-                        if laser in game.get_player_lasers():
-                            game.get_player_lasers().remove(laser)
-                if laser.off_screen(game.get_height()):
-                    if laser in game.get_player_lasers():
-                        game.get_player_lasers().remove(laser)
-                laser.draw(sys.get_window())
-            # Moves Enemy Lasers and removes off-screen lasers
-            for laser in game.get_enemy_lasers()[:]:
-                laser.mov()
-                # damages player when hit by enemy lasers
-                if laser.collision(player):
-                    player.deplete_health(laser.get_damage())
-                    if laser in game.get_enemy_lasers():
-                        game.get_enemy_lasers().remove(laser)
-                if laser.off_screen(game.get_height()):
-                    if laser in game.get_enemy_lasers():
-                        game.get_enemy_lasers().remove(laser)
-                laser.draw(sys.get_window())
-
-            # Displays GAME OVER when player loses
-            if lost:
-                lost_label = sys.font("lost").render("GAME OVER", True, (255, 255, 255))
-                temp_width = game.get_width() / 2 - lost_label.get_width() / 2
-                sys.get_window().blit(lost_label, (temp_width, game.get_height() / 2 - 50))
-
-            # Displays Level Number at start of new level
-            if level_starting:
-                if game.get_current_level() < len(game.get_level_sequence()):
-                    level_label = sys.font("lost").render("Level " + str(game.get_current_level()), True, (255, 255, 255))
-                    temp_width = game.get_width() / 2 - level_label.get_width() / 2
-                    sys.get_window().blit(level_label, (temp_width, game.get_height() / 2 - 50))
-                elif game.get_current_level() == len(game.get_level_sequence()):
-                    level_label = sys.font("lost").render("Welcome to Heck.", True, (255, 255, 255))
-                    temp_width = game.get_width() / 2 - level_label.get_width() / 2
-                    sys.get_window().blit(level_label, (temp_width, game.get_height() / 2 - 50))
-                else:
-                    level_label = sys.font("lost").render("So, You Want More???", True, (255, 255, 255))
-                    temp_width = game.get_width() / 2 - level_label.get_width() / 2
-                    sys.get_window().blit(level_label, (temp_width, game.get_height() / 2 - 50))
-
-            # Displays the current Score in top-left corner
-            current_score = sys.font("main").render("Score: " + str(game.get_score()).rjust(7, "0"),
-                                                    True, (255, 255, 255))
-            sys.get_window().blit(current_score, (10, 10))
-
-            pygame.display.update()
-
-        """Defines Lose conditions, FPS restrictions, Player Controls"""
-        # Restricts game speed to config FPS
-        while running:
-            clock.tick(game.get_fps())
-
-            # Loads next level when are enemies depleted.
-            if len(game.get_enemies()) == 0:
-                game.next_level()
-                level_starting = True
-                level_count = 120
-
-            # Defines player lose conditions
-            if player.get_health() <= 0:
-                if lost_count == 0:
-                    player.explode()
-                lost = True
-                lost_count += 1
-            # Displays Game Over for five seconds, then ends game
-            if lost_count > game.get_fps() * 5:
-                running = False
+        """Defines FPS restrictions, Player Controls"""
+        # Restricts game speed to config FPS; each frame drawn runs the governor's number of game frames
+        while engine.is_running():
+            substeps = governor.get_substeps()
+            clock.tick(engine.get_game().get_fps() / substeps)
+            start = time.perf_counter()
 
             # Quits game by clicking close button
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    running = False
+                    engine.stop()
                     sys.off()
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    overlay.toggle()
+
+            # Advances the game a frame per substep with the keys pressed (or recorded) this frame,
+            # adding up the time each phase took over the substeps
+            times = dict.fromkeys(Engine.PHASES, 0.0)
+            for substep in range(substeps):
+                if replay_controls is None:
+                    controls = Engine.read_keys(pygame.key.get_pressed())
+                    recording.record(controls)
+                else:
+                    controls = next(replay_controls, None)
+                    if controls is None:
+                        engine.stop()
+                        break
+                engine.tick(controls)
+                for phase, seconds in engine.get_phase_times().items():
+                    times[phase] += seconds
+                if memory is not None:
+                    # Time spent taking snapshots is not counted against the frame budget
+                    snapshot = time.perf_counter()
+                    memory.record(engine)
+                    start += time.perf_counter() - snapshot
+            if replay_controls is not None and controls is None:
+                break
 
-            """Defines Player Controls"""
-            # Logs keys pressed each frame
-            keys = pygame.key.get_pressed()
-            # Moves Player by with arrow keys
-            if keys[pygame.K_LEFT]:
-                player.horizontal_move(-player.get_speed())
-            if keys[pygame.K_RIGHT]:
-                player.horizontal_move(player.get_speed())
-            if keys[pygame.K_UP]:
-                player.vertical_move(-player.get_speed())
-            if keys[pygame.K_DOWN]:
-                player.vertical_move(player.get_speed())
+            # Draws the frame, then updates the display.
+            drawing = time.perf_counter()
+            renderer.draw(engine, sys.get_window())
+            renderer.mark(overlay.draw(sys.get_window()))
+            display = time.perf_counter()
+            renderer.update_display()
+            times["drawing"] = display - drawing
+            times["display"] = time.perf_counter() - display
+            profiler.record(engine, times, renderer.get_pixels_pushed())
+            governor.record(time.perf_counter() - start, substeps)
 
-            # Defines keys for Shooting player lasers
-            if keys[pygame.K_SPACE]:
-                player.shoot()
+        if memory is not None:
+            memory.snapshot(engine, "end")
+            # Each game is saved to its own file, "game.json" becoming "game-1.json", "game-2.json", ...
+            root, extension = os.path.splitext(memory_profile)
+            memory.save("{}-{}{}".format(root, games, extension), game=games,
+                        seed=engine.get_game().get_seed(), ticks=engine.get_tick())
+            memory.detach()
 
-            # Controls display of new level message.
-            if level_count > 0:
-                level_count -= 1
-                if level_count == 0:
-                    level_starting = False
+        # Saves the recorded game, or checks the replayed game ended where the recording did
+        if record is not None and recording is not None:
+            recording.finish(engine)
+            recording.save(record)
+        elif replay is not None and replay.get_checksum() is not None:
+            print("Replay matches the recording." if replay.verify(engine)
+                  else "Replay does NOT match the recording.")
 
-            update_window()
+    def loading_screen():
+        """Decodes every image on a pool of threads while drawing a progress bar."""
+        label = sys.font("sub title").render("Loading...", True, (255, 255, 255))
+        bar = pygame.Rect(sys.get_width() // 6, sys.get_height() // 2, sys.get_width() * 2 // 3, 20)
+
+        def progress(loaded, total):
+            """Takes the number of images loaded and the total, and draws the progress bar."""
+            # Keeps the window responsive while images decode
+            pygame.event.pump()
+            window = sys.get_window()
+            window.fill((0, 0, 0))
+            window.blit(label, (sys.get_width() // 2 - label.get_width() // 2, bar.y - label.get_height() - 10))
+            pygame.draw.rect(window, (255, 255, 255), bar, 2)
+            pygame.draw.rect(window, (255, 255, 100),
+                             (bar.x + 4, bar.y + 4, (bar.width - 8) * loaded // max(total, 1), bar.height - 8))
+            pygame.display.update()
+
+        Assets.preload(progress=progress)
 
     def title_screen():
-        """Runs the title screen menu."""
+        """
+        Runs the title screen menu.
+        The menu is rendered once and only redrawn when the selection changes;
+        between redraws the loop sleeps until the next input event.
+        """
         display_title = True
         # Defines Menu Screen options
         menu_options = ["new game", "quit"]
@@ -201,46 +172,70 @@ def main():
 
         sys.display_decor()
 
-        while display_title:
-            # Defines contents displayed on Title Screen
-            game_title = sys.font("title").render("Garuda", True, (255, 255, 100))
-            game_title2 = sys.font("sub menu").render("New Game", True, (255, 255, 255))
-            game_title3 = sys.font("sub menu").render("Quit", True, (255, 255, 255))
-            game_title4 = sys.font("sub title").render("SpaceBar to Shoot. Arrow Keys to Move.", True, (255, 255, 255))
-            game_title5 = sys.font("sub title").render("Created by Justin David Todd", True, (255, 255, 255))
-            cursor = sys.get_image("main_ship")
-            cursor_position = sys.get_height()*3//4 - sys.get_height()//10 + select_option*sys.get_height()//8
+        # Renders the background and every label of the Title Screen once
+        menu = sys.get_background().copy()
+        game_title = sys.font("title").render("Garuda", True, (255, 255, 100))
+        game_title2 = sys.font("sub menu").render("New Game", True, (255, 255, 255))
+        game_title3 = sys.font("sub menu").render("Quit", True, (255, 255, 255))
+        game_title4 = sys.font("sub title").render("SpaceBar to Shoot. Arrow Keys to Move.", True, (255, 255, 255))
+        game_title5 = sys.font("sub title").render("Created by Justin David Todd", True, (255, 255, 255))
+        menu.blit(game_title, (sys.get_width() // 2 - game_title.get_width() // 2,
+                               sys.get_height()//3))
+        menu.blit(game_title2, (sys.get_width() // 2 - game_title2.get_width() // 2,
+                                sys.get_height()*3//4 - sys.get_height()//10))
+        menu.blit(game_title3, (sys.get_width() // 2 - game_title2.get_width() // 2,
+                                sys.get_height() * 3 // 4))
+        menu.blit(game_title4, (sys.get_width() // 2 - game_title4.get_width() // 2,
+                                sys.get_height()-100))
+        menu.blit(game_title5, (sys.get_width() // 2 - game_title5.get_width() // 2,
+                                20))
+        cursor, cursor_area = Assets.get_sprite("main_ship")
 
-            # Draws Title Screen and Menu
-            sys.get_window().blit(sys.get_background(), (0, 0))
-            sys.get_window().blit(game_title, (sys.get_width() // 2 - game_title.get_width() // 2,
-                                               sys.get_height()//3))
-            sys.get_window().blit(game_title2, (sys.get_width() // 2 - game_title2.get_width() // 2,
-                                                sys.get_height()*3//4 - sys.get_height()//10))
-            sys.get_window().blit(game_title3, (sys.get_width() // 2 - game_title2.get_width() // 2,
-                                                sys.get_height() * 3 // 4))
-            sys.get_window().blit(game_title4, (sys.get_width() // 2 - game_title4.get_width() // 2,
-                                                sys.get_height()-100))
-            sys.get_window().blit(game_title5, (sys.get_width() // 2 - game_title5.get_width() // 2,
-                                                20))
-            sys.get_window().blit(cursor, (sys.get_width()//2 - game_title2.get_width()*11//14,
-                                           cursor_position))
-            pygame.display.update()
+        # Caps redraws at config FPS when keys are pressed faster than that
+        clock = pygame.time.Clock()
+        redraw = True
+        first_frame = True
+
+        while display_title:
+            # Draws Title Screen and Menu with the cursor beside the selected option
+            if redraw:
+                cursor_position = sys.get_height()*3//4 - sys.get_height()//10 + select_option*sys.get_height()//8
+                sys.get_window().blit(menu, (0, 0))
+                sys.get_window().blit(cursor, (sys.get_width()//2 - game_title2.get_width()*11//14,
+                                               cursor_position), cursor_area)
+                pygame.display.update()
+                redraw = False
+                # The first frame is shown as soon as it is drawn
+                if first_frame:
+                    first_frame = False
+                else:
+                    clock.tick(sys.get_fps())
+                # The title screen now takes input; reports the wall-clock time and quits
+                if startup_probe:
+                    print("title screen shown at {:.6f}".format(time.time()), flush=True)
+                    sys.off()
+                    return
 
             """Title Menu Controls"""
-            for event in pygame.event.get():
+            # Sleeps until an event arrives, then handles it and any others queued behind it
+            for event in [pygame.event.wait()] + pygame.event.get():
                 # Quits game by clicking close button
                 if event.type == pygame.QUIT:
                     display_title = False
                     sys.off()
+                # Redraws the menu when the window is uncovered
+                if event.type == pygame.WINDOWEXPOSED:
+                    redraw = True
                 # Navigates Menu with UP/LEFT and DOWN/RIGHT keys
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_UP or event.key == pygame.K_LEFT:
                         select_option -= 1
+                        redraw = True
                         if select_option < 0:
                             select_option = len(menu_options) - 1
                     if event.key == pygame.K_DOWN or event.key == pygame.K_RIGHT:
                         select_option += 1
+                        redraw = True
                         if select_option >= len(menu_options):
                             select_option = 0
                     # Select menu option with SPACE/RETURN/ENTER
@@ -254,7 +249,13 @@ def main():
     Defaults to title_screen on start or when a new_game ends.
     System turns off and program exits if window is closed or "QUIT" is selected from title_screen. 
     """
-    sys = Config()
+    sys = Config(*size)
+    # Windows larger than the design size only push the regions drawn over, so a frame costs
+    # about as much to display as at the design size
+    sys.set_dirty_rendering(dirty or sys.get_scale() > 1)
+    loading_screen()
+    if profiler is None:
+        profiler = FrameProfiler()
     while sys.on():
         title_screen()
         if sys.on() and sys.get_destination() == "new game":
@@ -262,4 +263,29 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Garuda, a space ship vs aliens shooting game.")
+    parser.add_argument("--record", metavar="PATH", help="record each new game to this replay file")
+    parser.add_argument("--replay", metavar="PATH", help="watch a recorded game instead of playing")
+    parser.add_argument("--dirty", action="store_true", help="update only the regions drawn over each frame")
+    parser.add_argument("--size", default="800x800", metavar="WIDTHxHEIGHT",
+                        help="window size; every image is scaled to it once at startup")
+    parser.add_argument("--degrade", nargs="*", choices=DEGRADATIONS, default=DEGRADATIONS, metavar="STEP",
+                        help="degradation steps applied in order while frames run over budget: " +
+                             ", ".join(DEGRADATIONS) + " (default: all; give none to always draw at full quality)")
+    parser.add_argument("--memory-profile", metavar="PATH",
+                        help="save tracemalloc snapshots of each new game, taken at every level and "
+                             "every 1800 frames, to this JSON file numbered by game (game.json is saved as "
+                             "game-1.json, game-2.json, ...; see profiler.py --compare); tracing slows every "
+                             "frame, so the F3 frame times and the frame governor are skewed while profiling")
+    parser.add_argument("--startup-probe", action="store_true",
+                        help="print the time the title screen is first shown, then quit")
+    args = parser.parse_args()
+    replay = None
+    if args.replay:
+        from replay import Replay
+        replay = Replay.load(args.replay)
+    width, height = (int(number) for number in args.size.lower().split("x"))
+    main(args.record, replay, dirty=args.dirty,
+         startup_probe=args.startup_probe, size=(width, height), degradations=args.degrade,
+         memory_profile=args.memory_profile)
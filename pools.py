@@ -0,0 +1,232 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Containers for the game's enemies and lasers.
+#   Entities get stable handles, are removed by swapping with the last entry,
+#   and removals requested during a frame are queued and applied once at its end.
+#   A listener can mirror the pool's dense storage (see vectorized.MotionStore).
+#   Lasers removed from a LaserPool are kept on a free list and reused for later shots.
+#   A TimerQueue holds items ordered by the frame they are due: a SpawnQueue holds enemies
+#   that are not yet near the screen, and the game's fire schedule holds when enemies next fire.
+import heapq
+from collections import namedtuple
+from lasers import Laser
+
+
+class EntityPool:
+    """
+    Stores entities in a dense list with O(1) removal.
+    Removals are queued with discard() and applied together by flush().
+    """
+
+    def __init__(self):
+        """Creates an empty pool."""
+        self._items = []            # Dense storage iterated each frame
+        self._index = {}            # Entity -> position in _items
+        self._handle_of = {}        # Entity -> stable handle
+        self._by_handle = {}        # Stable handle -> entity
+        self._next_handle = 0
+        self._pending = {}          # Entities queued for removal, in the order they were queued
+        self._version = 0           # Changes whenever entities are added or removed
+        self._listener = None       # Told of every entity added, moved or removed
+
+    def __len__(self):
+        """Returns the number of stored entities, including ones queued for removal."""
+        return len(self._items)
+
+    def __iter__(self):
+        """Iterates over every stored entity, including ones queued for removal."""
+        return iter(self._items)
+
+    def __contains__(self, entity):
+        """Returns True if the entity is stored and not queued for removal, else False."""
+        return entity in self._index and entity not in self._pending
+
+    def add(self, entity):
+        """Takes an entity, stores it, and returns its stable handle."""
+        handle = self._next_handle
+        self._next_handle += 1
+        self._index[entity] = len(self._items)
+        self._items.append(entity)
+        self._handle_of[entity] = handle
+        self._by_handle[handle] = entity
+        self._version += 1
+        if self._listener is not None:
+            self._listener.added(entity)
+        return handle
+
+    def get_version(self):
+        """Returns a number that changes whenever entities are added or removed."""
+        return self._version
+
+    def get_listener(self):
+        """Returns the object told of every change to the pool's storage, or None."""
+        return self._listener
+
+    def set_listener(self, listener):
+        """
+        Takes an object (or None) to tell of every change to the pool's storage, in storage order:
+        listener.added(entity) after an entity is appended, listener.removed(position) after the entity
+        at that position is removed and the last entity moved into its place, and listener.cleared().
+        """
+        self._listener = listener
+
+    def get(self, handle):
+        """Takes a handle and returns its entity, or None if that entity was removed."""
+        return self._by_handle.get(handle)
+
+    def get_handle(self, entity):
+        """Takes a stored entity and returns its handle."""
+        return self._handle_of[entity]
+
+    def active(self):
+        """Returns a list of the stored entities not queued for removal."""
+        if not self._pending:
+            return list(self._items)
+        pending = self._pending
+        return [entity for entity in self._items if entity not in pending]
+
+    def discard(self, entity):
+        """
+        Takes an entity and queues it for removal at the end of the frame.
+        Queuing the same entity more than once removes it only once.
+        """
+        if entity in self._index:
+            self._pending[entity] = None
+
+    def flush(self):
+        """Removes every queued entity and returns a list of the removed entities."""
+        removed = list(self._pending)
+        for entity in removed:
+            self._remove(entity)
+        if removed:
+            self._pending.clear()
+            self._version += 1
+        return removed
+
+    def clear(self):
+        """Removes every entity immediately."""
+        self._items.clear()
+        self._index.clear()
+        self._handle_of.clear()
+        self._by_handle.clear()
+        self._pending.clear()
+        self._version += 1
+        if self._listener is not None:
+            self._listener.cleared()
+
+    def _remove(self, entity):
+        """Takes a stored entity and removes it by moving the last entity into its place."""
+        position = self._index.pop(entity)
+        last = self._items.pop()
+        if last is not entity:
+            self._items[position] = last
+            self._index[last] = position
+        del self._by_handle[self._handle_of.pop(entity)]
+        if self._listener is not None:
+            self._listener.removed(position)
+
+
+class LaserPool(EntityPool):
+    """
+    EntityPool of lasers that recycles removed Laser objects for later shots.
+    """
+
+    def __init__(self, max_free=512):
+        """Takes an optional limit on the number of lasers kept for reuse."""
+        super().__init__()
+        self._free = []
+        self._max_free = max_free
+
+    def get_free_count(self):
+        """Returns the number of lasers waiting to be reused."""
+        return len(self._free)
+
+    def new_laser(self, x, y, laser_type):
+        """
+        Takes x and y coordinates and a laser type.
+        Reuses a removed laser if one is free, else creates one, and stores it.
+        Returns the laser.
+        """
+        if self._free:
+            laser = self._free.pop()
+            laser.reset(x, y, laser_type)
+        else:
+            laser = Laser(x, y, laser_type)
+        self.add(laser)
+        return laser
+
+    def flush(self):
+        """Removes every queued laser, keeps them for reuse, and returns a list of them."""
+        removed = super().flush()
+        room = self._max_free - len(self._free)
+        if room > 0:
+            self._free.extend(removed[:room])
+        return removed
+
+
+class SpawnRecord(namedtuple("SpawnRecord", "x y species frame")):
+    """
+    An enemy waiting to be created: its spawn coordinates, its species,
+    and the frame it was spawned on.
+    """
+    __slots__ = ()
+
+
+class TimerQueue:
+    """
+    Stores items ordered by the frame they are due, so each frame only the items due are touched.
+    Items due on the same frame come out in the order they were added.
+    """
+
+    def __init__(self):
+        """Creates an empty queue."""
+        self._heap = []
+        self._count = 0             # Breaks ties between items due on the same frame
+
+    def __len__(self):
+        """Returns the number of items waiting."""
+        return len(self._heap)
+
+    def __iter__(self):
+        """Iterates over the items waiting in the order they are due, without removing them."""
+        return (item for due, count, item in sorted(self._heap))
+
+    def add(self, due, item):
+        """Takes the frame an item is due and the item, and stores it."""
+        heapq.heappush(self._heap, (due, self._count, item))
+        self._count += 1
+
+    def extend(self, timers):
+        """Takes a list of (due frame, item) pairs and stores them all at once."""
+        heap = self._heap
+        for due, item in timers:
+            heap.append((due, self._count, item))
+            self._count += 1
+        heapq.heapify(heap)
+
+    def get_next_due(self):
+        """Returns the frame the next item is due, or None if the queue is empty."""
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, frame):
+        """Takes a frame and removes and returns a list of the items due on or before it."""
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= frame:
+            due.append(heapq.heappop(heap)[2])
+        return due
+
+    def clear(self):
+        """Removes every item."""
+        self._heap.clear()
+
+
+class SpawnQueue(TimerQueue):
+    """
+    Stores SpawnRecords ordered by the frame they should become real enemies.
+    Records due on the same frame come out in the order they were added.
+    """
+
+    def get_next_arrival(self):
+        """Returns the frame the next record is due, or None if the queue is empty."""
+        return self.get_next_due()
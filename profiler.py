@@ -0,0 +1,406 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Records how long each phase of a frame takes.
+#   The FrameProfiler keeps the phase times, entity counts and collision tests of recent
+#   frames in a ring buffer and passes each frame's stats to any subscribed functions.
+#   The ProfilerOverlay draws those frames as graphs in the corner of the game window.
+#   The MemoryProfiler takes tracemalloc snapshots each time a level is loaded and at fixed
+#   intervals, and saves them to a JSON file that can be compared with another build's.
+#   Run "python profiler.py --memory --ticks 20000 --json new.json" to profile a headless game,
+#   and "python profiler.py --compare old.json new.json" to compare two builds.
+import gc
+import os
+import sys
+import json
+import tracemalloc
+import pygame
+from collections import deque, namedtuple
+from lasers import CollisionStats, Laser
+from ships import Ship
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Folder of the project; source lines inside it are reported relative to it so builds in
+# different folders can be compared
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+class FrameStats(namedtuple("FrameStats", "tick times enemies dormant enemy_lasers player_lasers "
+                                           "collision_tests pixels")):
+    """
+    Stats of one frame: the engine tick, a dictionary of phase name -> seconds,
+    the number of active enemies, dormant enemies, enemy lasers and player lasers,
+    the collision tests run, and the pixels sent to the display.
+    """
+    __slots__ = ()
+
+    def get_total(self):
+        """Returns the seconds spent in every phase of the frame"""
+        return sum(self.times.values())
+
+
+class FrameProfiler:
+    """
+    Ring buffer of the stats of the most recent frames, with subscriber hooks.
+    """
+
+    def __init__(self, size=240):
+        """Takes the number of frames to keep."""
+        self._frames = deque(maxlen=size)
+        self._subscribers = []
+        self._collision_total = CollisionStats.get_total()
+
+    # Get Methods
+    def get_size(self):
+        """Returns the number of frames the profiler keeps"""
+        return self._frames.maxlen
+
+    def get_frames(self):
+        """Returns the stats of the kept frames, oldest first"""
+        return self._frames
+
+    def get_last(self):
+        """Returns the stats of the most recent frame, or None if no frame was recorded"""
+        return self._frames[-1] if self._frames else None
+
+    def get_average(self, phase=None):
+        """Takes an optional phase name and returns the average seconds per kept frame in it (or in all phases)"""
+        if not self._frames:
+            return 0.0
+        if phase is None:
+            return sum(frame.get_total() for frame in self._frames) / len(self._frames)
+        return sum(frame.times.get(phase, 0.0) for frame in self._frames) / len(self._frames)
+
+    # Subscriber Hooks
+    def subscribe(self, callback):
+        """Takes a function that takes a FrameStats; calls it after every recorded frame."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Takes a subscribed function and stops calling it."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    # Other Methods
+    def attach(self, engine):
+        """Takes an Engine and turns on the timing of its phases."""
+        engine.set_phase_timing(True)
+
+    def record(self, engine, times=None, pixels=0):
+        """
+        Takes the Engine that just ran a frame, an optional dictionary of
+        phase name -> seconds for phases run outside the engine (drawing, display, etc.)
+        and the number of pixels sent to the display.
+        Stores the frame's stats and passes them to every subscriber.
+        """
+        game = engine.get_game()
+        frame_times = dict(engine.get_phase_times() or {})
+        if times:
+            frame_times.update(times)
+        collision_total = CollisionStats.get_total()
+        stats = FrameStats(engine.get_tick(), frame_times, len(game.get_enemies()),
+                           game.get_dormant_count(), len(game.get_enemy_lasers()),
+                           len(game.get_player_lasers()),
+                           collision_total - self._collision_total, pixels)
+        self._collision_total = collision_total
+        self._frames.append(stats)
+        for callback in self._subscribers:
+            callback(stats)
+        return stats
+
+
+class ProfilerOverlay:
+    """
+    Draws a FrameProfiler's recent frame times as graphs, with entity and collision counts.
+    Hidden until toggled on.
+    """
+
+    # Graph line color of each phase, and of the whole frame
+    _colors = {
+        "spawning": (255, 100, 255),
+        "movement": (100, 200, 255),
+        "collision": (255, 200, 50),
+        "drawing": (100, 255, 100),
+        "display": (255, 100, 100),
+        "frame": (255, 255, 255)
+    }
+
+    def __init__(self, config, profiler, budget=1/60):
+        """Takes the game's Config, the FrameProfiler to draw, and the frame time at the top of the graph."""
+        self._config = config
+        self._profiler = profiler
+        self._budget = budget
+        self._visible = False
+        self._panel = pygame.Surface((config.get_width() * 3 // 8, config.get_height() // 4), pygame.SRCALPHA)
+
+    def is_visible(self):
+        """Returns True if the overlay is drawn, else False"""
+        return self._visible
+
+    def toggle(self):
+        """Shows the overlay if hidden, else hides it."""
+        self._visible = not self._visible
+
+    def draw(self, surface):
+        """
+        Takes a surface and draws the overlay in its top-right corner if visible;
+        returns the rect drawn over, or None if hidden.
+        """
+        if not self._visible:
+            return None
+        panel = self._panel
+        width, height = panel.get_size()
+        panel.fill((0, 0, 0, 160))
+        frames = self._profiler.get_frames()
+        step = width / max(self._profiler.get_size() - 1, 1)
+        graph_top = height // 3
+
+        # Draws one line per phase, with the frame budget at the top of the graph
+        if len(frames) > 1:
+            for phase, color in self._colors.items():
+                points = []
+                for index, frame in enumerate(frames):
+                    seconds = frame.get_total() if phase == "frame" else frame.times.get(phase, 0.0)
+                    fraction = min(seconds / self._budget, 1.0)
+                    points.append((index * step, height - 1 - fraction * (height - 1 - graph_top)))
+                pygame.draw.lines(panel, color, False, points)
+
+        # Writes the last frame's time and counts above the graph
+        last = self._profiler.get_last()
+        if last is not None:
+            font = self._config.font("overlay")
+            lines = ("frame {:.2f} ms  avg {:.2f} ms".format(last.get_total() * 1000,
+                                                             self._profiler.get_average() * 1000),
+                     "enemies {} (+{} dormant)  lasers {}/{}  tests {}".format(
+                         last.enemies, last.dormant, last.enemy_lasers, last.player_lasers, last.collision_tests),
+                     "pixels pushed {}".format(last.pixels))
+            for row, text in enumerate(lines):
+                panel.blit(font.render(text, True, (255, 255, 255)), (4, 2 + row * font.get_linesize()))
+        return surface.blit(panel, (surface.get_width() - width - 10, 10))
+
+
+class MemoryProfiler:
+    """
+    Snapshots of a game's memory each time a level is loaded and every fixed number of frames:
+    Python memory traced by tracemalloc, peak resident memory, the objects alive by type,
+    the source lines holding the most memory and the lines that grew most since the last snapshot,
+    and the number of live Ship and Laser objects. Lasers are split into those in play and those
+    kept on the laser pools' free lists for reuse.
+    """
+
+    def __init__(self, interval=1800, top=15):
+        """Takes the number of frames between snapshots and the number of types and source lines kept per snapshot."""
+        self._interval = interval
+        self._top = top
+        self._snapshots = []
+        self._level = None
+        self._last = None
+        # True while tracing that attach started, which detach stops
+        self._tracing = False
+
+    # Get Methods
+    def get_interval(self):
+        """Returns the number of frames between snapshots"""
+        return self._interval
+
+    def get_snapshots(self):
+        """Returns the list of snapshots taken, oldest first, each a dictionary (see snapshot)"""
+        return self._snapshots
+
+    # Other Methods
+    def attach(self, engine):
+        """Takes an Engine, starts tracing memory allocations if they are not traced yet, and takes the first snapshot."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        self._level = engine.get_game().get_current_level()
+        self.snapshot(engine, "start")
+
+    def detach(self):
+        """Stops tracing memory allocations if attach started it, so later frames do not pay for tracing."""
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def record(self, engine):
+        """
+        Takes the Engine that just ran a frame.
+        Takes a snapshot if the frame loaded a level or ends an interval.
+        """
+        level = engine.get_game().get_current_level()
+        if level != self._level:
+            self._level = level
+            self.snapshot(engine, "level {}".format(level))
+        elif engine.get_tick() % self._interval == 0:
+            self.snapshot(engine, "tick {}".format(engine.get_tick()))
+
+    def snapshot(self, engine, label):
+        """
+        Takes an Engine and a label for the snapshot. Returns and keeps a dictionary of the label,
+        frame, level, traced and peak traced bytes, peak resident bytes (None where unknown),
+        live Ship counts by class, the lasers in play, on the pools' free lists, and alive in all
+        (a total above the other two means lasers are kept somewhere else), the types with the most live objects as
+        [name, count, bytes], the source lines holding the most memory as [line, bytes, blocks],
+        and the source lines that grew most since the last snapshot as [line, bytes, blocks].
+        """
+        gc.collect()
+        traced, peak = tracemalloc.get_traced_memory()
+        current = tracemalloc.take_snapshot().filter_traces((
+            # Leaves out the memory of the kept snapshots themselves
+            tracemalloc.Filter(False, os.path.abspath(__file__)),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>")))
+
+        # Counts the objects the garbage collector tracks by type, and the ships and lasers among them
+        types = {}
+        ships = {}
+        laser_objects = 0
+        for obj in gc.get_objects():
+            kind = type(obj)
+            entry = types.get(kind)
+            if entry is None:
+                entry = types[kind] = [kind.__name__, 0, 0]
+            entry[1] += 1
+            entry[2] += sys.getsizeof(obj)
+            if isinstance(obj, Ship):
+                ships[kind.__name__] = ships.get(kind.__name__, 0) + 1
+            elif isinstance(obj, Laser):
+                laser_objects += 1
+        game = engine.get_game()
+        laser_pools = (game.get_player_lasers(), game.get_enemy_lasers())
+
+        lines = [[self._line(stat.traceback), stat.size, stat.count]
+                 for stat in current.statistics("lineno")[:self._top]]
+        growth = []
+        if self._last is not None:
+            growth = [[self._line(stat.traceback), stat.size_diff, stat.count_diff]
+                      for stat in current.compare_to(self._last, "lineno")[:self._top] if stat.size_diff > 0]
+        self._last = current
+
+        result = {"label": label, "tick": engine.get_tick(), "level": game.get_current_level(),
+                  "traced": traced, "traced_peak": peak, "resident_peak": self._resident_peak(),
+                  "ships": ships, "lasers": sum(len(pool) for pool in laser_pools),
+                  "free_lasers": sum(pool.get_free_count() for pool in laser_pools), "laser_objects": laser_objects,
+                  "types": sorted(types.values(), key=lambda entry: entry[1], reverse=True)[:self._top],
+                  "lines": lines, "growth": growth}
+        self._snapshots.append(result)
+        return result
+
+    def save(self, path, **details):
+        """Takes a file path and any details of the run (seed, frames, etc.) and saves every snapshot there as JSON."""
+        with open(path, "w") as file:
+            json.dump(dict(details, interval=self._interval, snapshots=self._snapshots), file, indent=1)
+
+    @staticmethod
+    def _line(traceback):
+        """Takes a tracemalloc traceback and returns its newest frame as "file:line", relative to the project."""
+        frame = traceback[0]
+        filename = frame.filename
+        if filename.startswith(_ROOT + os.sep):
+            filename = os.path.relpath(filename, _ROOT)
+        return "{}:{}".format(filename, frame.lineno)
+
+    @staticmethod
+    def _resident_peak():
+        """Returns the peak resident memory of the process in bytes, or None where it cannot be read"""
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def compare_memory(old, new):
+    """
+    Takes the contents of two files saved by MemoryProfiler.save (an older and a newer build).
+    Returns a list with one row per snapshot label found in both: the label, then the older and newer
+    traced bytes, peak traced bytes, peak resident bytes, live ships, lasers in play and free lasers.
+    """
+    older = {snapshot["label"]: snapshot for snapshot in old["snapshots"]}
+    rows = []
+    for snapshot in new["snapshots"]:
+        before = older.get(snapshot["label"])
+        if before is None:
+            continue
+        row = [snapshot["label"]]
+        for name in ("traced", "traced_peak", "resident_peak"):
+            row.extend((before[name], snapshot[name]))
+        row.extend((sum(before["ships"].values()), sum(snapshot["ships"].values()),
+                    before["lasers"], snapshot["lasers"], before["free_lasers"], snapshot["free_lasers"]))
+        rows.append(row)
+    return rows
+
+
+def print_snapshots(snapshots):
+    """
+    Takes a list of MemoryProfiler snapshots and prints a table of their memory and entity counts,
+    then the types with the most live objects and the source lines holding the most memory in the last.
+    """
+    print("{:<12} {:>6} {:>10} {:>9} {:>12} {:>6} {:>7} {:>5} {:>8}".format(
+        "snapshot", "tick", "traced MB", "peak MB", "resident MB", "ships", "lasers", "free", "objects"))
+    for snapshot in snapshots:
+        print("{:<12} {:>6} {:>10} {:>9} {:>12} {:>6} {:>7} {:>5} {:>8}".format(
+            snapshot["label"], snapshot["tick"], _megabytes(snapshot["traced"]),
+            _megabytes(snapshot["traced_peak"]), _megabytes(snapshot["resident_peak"]),
+            sum(snapshot["ships"].values()), snapshot["lasers"], snapshot["free_lasers"],
+            snapshot["laser_objects"]))
+    last = snapshots[-1]
+    print("Most live objects by type:")
+    for name, count, size in last["types"]:
+        print("  {:<24} {:>8} {:>10} bytes".format(name, count, size))
+    print("Source lines holding the most memory:")
+    for line, size, count in last["lines"]:
+        print("  {:<40} {:>10} bytes {:>7} blocks".format(line, size, count))
+
+
+def _megabytes(size):
+    """Takes a number of bytes (or None) and returns it as text in megabytes"""
+    return "-" if size is None else "{:.2f}".format(size / 2 ** 20)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Profiles the memory of a headless game of Garuda, "
+                                                 "or compares the profiles of two builds.")
+    parser.add_argument("--memory", action="store_true", help="play a headless game and snapshot its memory")
+    parser.add_argument("--ticks", type=int, default=20000, help="maximum number of frames to play")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the game's random numbers")
+    parser.add_argument("--interval", type=int, default=1800, help="frames between snapshots")
+    parser.add_argument("--invulnerable", action="store_true",
+                        help="keep the player alive so the game reaches every level and Heck mode")
+    parser.add_argument("--json", metavar="PATH", help="save the snapshots to this JSON file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two saved profiles")
+    args = parser.parse_args()
+
+    if args.memory:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        from engine import Engine, sweep_and_shoot
+        engine = Engine(seed=args.seed)
+        memory = MemoryProfiler(args.interval)
+        memory.attach(engine)
+        while engine.is_running() and engine.get_tick() < args.ticks:
+            if args.invulnerable:
+                engine.get_player().set_health(100)
+            engine.tick(sweep_and_shoot(engine))
+            memory.record(engine)
+        memory.snapshot(engine, "end")
+        memory.detach()
+        print_snapshots(memory.get_snapshots())
+        if args.json:
+            memory.save(args.json, seed=args.seed, ticks=engine.get_tick())
+            print("Saved snapshots to {}".format(args.json))
+
+    if args.compare:
+        profiles = []
+        for path in args.compare:
+            with open(path) as file:
+                profiles.append(json.load(file))
+        print("{:<12} {:>17} {:>17} {:>17} {:>11} {:>11} {:>11}".format(
+            "snapshot", "traced MB", "peak MB", "resident MB", "ships", "lasers", "free lasers"))
+        for row in compare_memory(*profiles):
+            print("{:<12} {:>8} {:>8} {:>8} {:>8} {:>8} {:>8} {:>5} {:>5} {:>5} {:>5} {:>5} {:>5}".format(
+                row[0], *(_megabytes(size) for size in row[1:7]), *row[7:]))
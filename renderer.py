@@ -0,0 +1,230 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Draws the state of an Engine onto a surface each frame.
+#   Kept apart from the Engine so the game's rules can run without a window.
+#   The Renderer redraws and pushes the whole window every frame; the DirtyRenderer
+#   only restores and pushes the regions its ships, lasers and labels covered.
+#   Either can be given a FrameGovernor, whose degradation steps leave out explosions,
+#   half of the enemy lasers or the background image while the game is overloaded.
+import pygame
+
+
+class Renderer:
+    """
+    Draws the background, ships, lasers and messages of a game in progress.
+    """
+
+    # Color drawn instead of the background image while decorations are dropped
+    PLAIN = (0, 0, 0)
+
+    def __init__(self, config):
+        """Takes the game's Config, used for its fonts."""
+        self._config = config
+        self._pixels = 0
+        self._governor = None
+        # Frames drawn so far, whose parity picks the half of the enemy lasers drawn
+        self._frames = 0
+
+    def get_pixels_pushed(self):
+        """Returns the number of pixels sent to the display by the last update_display()"""
+        return self._pixels
+
+    def get_governor(self):
+        """Returns the FrameGovernor whose degradation steps are followed, or None"""
+        return self._governor
+
+    def set_governor(self, governor):
+        """Takes a FrameGovernor (or None) whose degradation steps are followed when drawing."""
+        self._governor = governor
+
+    def draw(self, engine, surface):
+        """
+        Takes an Engine and a surface.
+        Draws the current frame of the engine's game onto that surface.
+        """
+        self._frames += 1
+        # Draws Background
+        background = self.get_background(engine)
+        if background is None:
+            surface.fill(Renderer.PLAIN)
+        else:
+            surface.blit(background, (0, 0))
+        self.draw_scene(engine, surface)
+
+    def get_background(self, engine):
+        """
+        Takes an Engine and returns its game's background image,
+        or None while the governor has dropped decorations and the plain fill is drawn instead
+        """
+        if self._governor is not None and self._governor.is_applied("decorations"):
+            return None
+        return engine.get_game().get_background()
+
+    def draw_scene(self, engine, surface):
+        """
+        Takes an Engine and a surface.
+        Draws the ships, lasers and messages of the engine's game onto that surface;
+        returns a list of the rects drawn over.
+        """
+        game = engine.get_game()
+        governor = self._governor
+        rects = []
+
+        # Draws player while the game is not lost
+        if not engine.is_lost():
+            rects.append(engine.get_player().draw(surface))
+
+        # Draws enemies and lasers
+        for enemy in game.get_enemies():
+            rects.append(enemy.draw(surface))
+        if governor is None or not governor.get_applied():
+            for laser in game.get_player_lasers():
+                rects.append(laser.draw(surface))
+            for laser in game.get_enemy_lasers():
+                rects.append(laser.draw(surface))
+        else:
+            rects.extend(self._draw_lasers_degraded(engine, surface))
+
+        rects.extend(self.draw_messages(engine, surface))
+        return rects
+
+    def draw_messages(self, engine, surface):
+        """
+        Takes an Engine and a surface.
+        Draws GAME OVER, the level start message and the score onto that surface;
+        returns a list of the rects drawn over.
+        """
+        game = engine.get_game()
+        rects = []
+
+        # Displays GAME OVER when player loses
+        if engine.is_lost():
+            rects.append(self._draw_centered("GAME OVER", game, surface))
+
+        # Displays Level Number at start of new level
+        if engine.is_level_starting():
+            if game.get_current_level() < len(game.get_level_sequence()):
+                rects.append(self._draw_centered("Level " + str(game.get_current_level()), game, surface))
+            elif game.get_current_level() == len(game.get_level_sequence()):
+                rects.append(self._draw_centered("Welcome to Heck.", game, surface))
+            else:
+                rects.append(self._draw_centered("So, You Want More???", game, surface))
+
+        # Displays the current Score in top-left corner
+        current_score = self._config.font("main").render("Score: " + str(game.get_score()).rjust(7, "0"),
+                                                         True, (255, 255, 255))
+        rects.append(surface.blit(current_score, (10, 10)))
+        return rects
+
+    def _draw_lasers_degraded(self, engine, surface):
+        """
+        Takes an Engine and a surface. Draws the lasers of the engine's game onto that surface,
+        leaving out explosions and every other enemy laser as the governor's degradation steps say;
+        returns a list of the rects drawn over.
+        """
+        game = engine.get_game()
+        skip_explosions = self._governor.is_applied("explosions")
+        # Draws the enemy lasers at even positions on even drawn frames and the others on odd ones;
+        # drawn frames are counted rather than game frames, as two game frames run per drawn frame with substeps
+        half = self._governor.is_applied("enemy_lasers")
+        parity = self._frames % 2
+        rects = []
+        for laser in game.get_player_lasers():
+            if not (skip_explosions and laser.get_image_name() == "explosion"):
+                rects.append(laser.draw(surface))
+        for index, laser in enumerate(game.get_enemy_lasers()):
+            if half and index % 2 != parity:
+                continue
+            if not (skip_explosions and laser.get_image_name() == "explosion"):
+                rects.append(laser.draw(surface))
+        return rects
+
+    def mark(self, rect):
+        """
+        Takes a rect drawn over outside the renderer (or None) so it is updated this frame.
+        The whole window is updated every frame, so nothing needs to be kept.
+        """
+        pass
+
+    def update_display(self):
+        """Sends the whole window to the display."""
+        pygame.display.update()
+        window = pygame.display.get_surface()
+        self._pixels = window.get_width() * window.get_height()
+
+    def _draw_centered(self, text, game, surface):
+        """
+        Takes a message, a game, and a surface. Draws the message in the middle of the surface;
+        returns the rect drawn over.
+        """
+        label = self._config.font("lost").render(text, True, (255, 255, 255))
+        temp_width = surface.get_width() / 2 - label.get_width() / 2
+        return surface.blit(label, (temp_width, surface.get_height() / 2 - 50 * self._config.get_scale()))
+
+
+class DirtyRenderer(Renderer):
+    """
+    Draws a game like the Renderer, but each frame only restores the background under
+    what was drawn the frame before and only sends those regions and the new ones to the display.
+    """
+
+    def __init__(self, config):
+        """Takes the game's Config, used for its fonts."""
+        super().__init__(config)
+        # Rects drawn over last frame, which must be covered with background this frame
+        self._previous = []
+        # Rects to send to the display, or None to send the whole window
+        self._dirty = None
+        self._background = None
+        self._surface = None
+
+    def draw(self, engine, surface):
+        """
+        Takes an Engine and a surface.
+        Covers last frame's ships, lasers and labels with background, then draws the current frame.
+        Redraws the whole surface on the first frame or when the background changes.
+        """
+        self._frames += 1
+        background = self.get_background(engine)
+        if background is not self._background or surface is not self._surface:
+            self._background = background
+            self._surface = surface
+            if background is None:
+                surface.fill(Renderer.PLAIN)
+            else:
+                surface.blit(background, (0, 0))
+            self._dirty = None
+        elif background is None:
+            for rect in self._previous:
+                surface.fill(Renderer.PLAIN, rect)
+            self._dirty = self._previous
+        else:
+            for rect in self._previous:
+                surface.blit(background, rect, rect)
+            self._dirty = self._previous
+
+        self._previous = self.draw_scene(engine, surface)
+        if self._dirty is not None:
+            self._dirty.extend(self._previous)
+
+    def mark(self, rect):
+        """
+        Takes a rect drawn over outside the renderer (or None) so it is updated this frame
+        and covered with background next frame.
+        """
+        if rect is not None:
+            self._previous.append(rect)
+            if self._dirty is not None:
+                self._dirty.append(rect)
+
+    def update_display(self):
+        """Sends the regions drawn over this frame and last frame to the display."""
+        window = pygame.display.get_surface()
+        if self._dirty is None:
+            pygame.display.update()
+            self._pixels = window.get_width() * window.get_height()
+            return
+        bounds = window.get_rect()
+        dirty = [bounds.clip(rect) for rect in self._dirty]
+        pygame.display.update(dirty)
+        self._pixels = sum(rect.width * rect.height for rect in dirty)
@@ -0,0 +1,147 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Records and replays games of Garuda.
+#   A replay stores the game's seed, window size and the player's controls for every
+#   frame, run-length encoded in a small binary file, plus a checksum of the final state.
+#   Replaying it, in a window or headless at full speed, reproduces the game exactly.
+#   Run "python replay.py FILE" to replay a recording headless and verify its checksum.
+import struct
+import time
+from engine import Engine
+
+
+class Replay:
+    """
+    The seed, window size and per-frame controls of one recorded game.
+    """
+
+    # File layout: header, then (frame count, controls) runs, then the final frame and checksum
+    _MAGIC = b"GRPL"
+    # Version 2: enemy fire times are drawn once per shot, so version 1 games play out differently
+    # Version 3: enemies sleeping above the screen wake in a different order than they were scanned
+    _VERSION = 3
+    _HEADER = struct.Struct("<4sHQHHI")     # magic, version, seed, width, height, number of runs
+    _RUN = struct.Struct("<HB")             # frames held, controls held
+    _FOOTER = struct.Struct("<I16s")        # frames played, checksum of the final state
+
+    def __init__(self, seed, width=800, height=800):
+        """Takes the game's seed and window width and height, and creates an empty recording."""
+        self._seed = seed
+        self._width = width
+        self._height = height
+        self._runs = []             # [frames, controls] pairs
+        self._ticks = 0
+        self._checksum = None
+
+    # Get Methods
+    def get_seed(self):
+        """Returns the recorded game's seed"""
+        return self._seed
+
+    def get_size(self):
+        """Returns the recorded game's window (width, height)"""
+        return self._width, self._height
+
+    def get_ticks(self):
+        """Returns the number of frames recorded"""
+        return self._ticks
+
+    def get_checksum(self):
+        """Returns the checksum of the recorded game's final state, or None if not finished"""
+        return self._checksum
+
+    def get_controls(self):
+        """Returns a list of the controls for every recorded frame, in order."""
+        controls = []
+        for frames, held in self._runs:
+            controls.extend([held] * frames)
+        return controls
+
+    # Recording
+    @classmethod
+    def start(cls, engine):
+        """Takes a new Engine and returns an empty replay for recording its game."""
+        game = engine.get_game()
+        return cls(game.get_seed(), game.get_width(), game.get_height())
+
+    def record(self, controls):
+        """Takes the controls played for one frame and adds them to the recording."""
+        if self._runs and self._runs[-1][1] == controls and self._runs[-1][0] < 0xFFFF:
+            self._runs[-1][0] += 1
+        else:
+            self._runs.append([1, controls])
+        self._ticks += 1
+
+    def finish(self, engine):
+        """Takes the recorded Engine and stores the checksum of its final state."""
+        self._checksum = engine.get_checksum()
+
+    # Playback
+    def new_engine(self, vectorized=False):
+        """Takes whether to use the NumPy movement backend and returns an Engine set up for this replay."""
+        return Engine(self._width, self._height, vectorized, self._seed)
+
+    def play(self, vectorized=False):
+        """
+        Takes whether to use the NumPy movement backend.
+        Replays the recording headless at full speed and returns the finished Engine.
+        """
+        engine = self.new_engine(vectorized)
+        for frames, held in self._runs:
+            for frame in range(frames):
+                engine.tick(held)
+        return engine
+
+    def verify(self, engine):
+        """Takes a replayed Engine and returns True if its final state matches the recording."""
+        return self._checksum is not None and engine.get_checksum() == self._checksum
+
+    # Files
+    def save(self, path):
+        """Takes a file path and writes the replay to it."""
+        with open(path, "wb") as file:
+            file.write(self._HEADER.pack(self._MAGIC, self._VERSION, self._seed,
+                                         self._width, self._height, len(self._runs)))
+            for frames, held in self._runs:
+                file.write(self._RUN.pack(frames, held))
+            checksum = bytes.fromhex(self._checksum) if self._checksum else bytes(16)
+            file.write(self._FOOTER.pack(self._ticks, checksum))
+
+    @classmethod
+    def load(cls, path):
+        """Takes a file path and returns the replay stored in it."""
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, version, seed, width, height, count = cls._HEADER.unpack_from(data, 0)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise ValueError("{} is not a Garuda replay (version {})".format(path, cls._VERSION))
+        replay = cls(seed, width, height)
+        offset = cls._HEADER.size
+        for run in range(count):
+            frames, held = cls._RUN.unpack_from(data, offset)
+            replay._runs.append([frames, held])
+            offset += cls._RUN.size
+        replay._ticks, checksum = cls._FOOTER.unpack_from(data, offset)
+        if checksum != bytes(16):
+            replay._checksum = checksum.hex()
+        return replay
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Replays a recorded game of Garuda headless.")
+    parser.add_argument("path", help="replay file recorded with main.py --record")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy movement backend")
+    args = parser.parse_args()
+
+    recording = Replay.load(args.path)
+    start = time.perf_counter()
+    result = recording.play(args.vectorized)
+    elapsed = time.perf_counter() - start
+    print("Replayed {} frames in {:.2f} s ({:.0f} frames per second)".format(
+        recording.get_ticks(), elapsed, recording.get_ticks() / max(elapsed, 1e-9)))
+    if recording.verify(result):
+        print("Final state matches the recording.")
+    else:
+        print("Final state does NOT match the recording.")
+        raise SystemExit(1)
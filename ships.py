@@ -1,9 +1,38 @@
 # Author: Justin David Todd
-# Last Modified: 02/04/2021
+# Last Modified: 10/17/2026
 # Description: Imports assets for and defines Player and Enemy Ships.
 import pygame
 import random
-from lasers import collide, Laser
+from collections import namedtuple
+from lasers import collide
+from assets import Assets
+
+
+class Species(namedtuple("Species", "speed move_pattern image_name laser_type health point_value")):
+    """
+    Immutable design shared by every enemy of one species.
+    Built once at import time; enemies keep a reference to it instead of copying its fields.
+    """
+    __slots__ = ()
+
+    def get_image(self):
+        """returns the shared image of this species"""
+        return Assets.get_image(self.image_name)
+
+    def get_sprite(self):
+        """returns the surface and area to blit to draw this species (see Assets.get_sprite)"""
+        return Assets.get_sprite(self.image_name)
+
+    def get_mask(self):
+        """returns the shared collision mask of this species"""
+        return Assets.get_mask(self.image_name)
+
+    def get_max_descent(self):
+        """returns the most pixels a ship of this species can descend in one frame while above the screen"""
+        # Crawling ships only descend 2 pixels a frame, when they reach a wall
+        if self.move_pattern in (Ship.crawl_left, Ship.crawl_right, Ship.crawl_drop):
+            return 2
+        return self.speed
 
 
 class Ship:
@@ -11,6 +40,11 @@ class Ship:
     Abstract class for objects piloting through space
     """
 
+    # Ship instances only store their own position, health, timers and shared references.
+    __slots__ = ("_x", "_y", "_ship_img", "_image_name", "_mask", "_health", "_max_health", "_laser_type",
+                 "_cool_down_counter", "_speed", "_lasers", "_move_counter", "_direction",
+                 "_scr_width", "_scr_height", "_rect", "_random")
+
     def __init__(self, x, y, laser_array, health=10):
         """
         creates a ship at the x, y coordinate with
@@ -22,47 +56,10 @@ class Ship:
         - a laser cool_down_counter
         _ a movement speed
         """
-        self._image = {
-            # Player Images - image file should be 64x64 pixels
-            "main_ship": pygame.image.load("assets/main_ship.png"),
-
-            # Enemy Images - image file should be 32x32 pixels
-            # TODO diversify enemy images
-            "blue_baddy": pygame.image.load("assets/baddy_1.png"),
-            "red_baddy": pygame.image.load("assets/baddy_2.png"),
-            "explosion": pygame.image.load("assets/simple_explosion.png"),
-            "ArrowBlue": pygame.image.load("assets/ArrowBlue.png"),
-            "ArrowGold": pygame.image.load("assets/ArrowGold.png"),
-            "ArrowPink": pygame.image.load("assets/ArrowPink.png"),
-            "ArrowRed": pygame.image.load("assets/ArrowRed.png"),
-            "ArrowStealth": pygame.image.load("assets/ArrowStealth.png"),
-            "Block": pygame.image.load("assets/Block.png"),
-            "BlueSquid": pygame.image.load("assets/BlueSquid.png"),
-            "blueSpark": pygame.image.load("assets/blusSpark.png"),
-            "CentiBlue": pygame.image.load("assets/CentiBlue.png"),
-            "CentiGreen": pygame.image.load("assets/CentiGreen.png"),
-            "CentiheadBlue": pygame.image.load("assets/CentiheadBlue.png"),
-            "CentiheadDud": pygame.image.load("assets/CentiheadDud.png"),
-            "CentiheadGreen": pygame.image.load("assets/CentiheadGreen.png"),
-            "CentiheadPanda": pygame.image.load("assets/CentiheadPanda.png"),
-            "CentiheadRed": pygame.image.load("assets/CentiheadRed.png"),
-            "CentiheadYellow": pygame.image.load("assets/CentiheadYellow.png"),
-            "CentiPurple": pygame.image.load("assets/CentiPurple.png"),
-            "CentiRed": pygame.image.load("assets/CentiRed.png"),
-            "FlappyBlue": pygame.image.load("assets/Flappy Blue.png"),
-            "FlappyGreen": pygame.image.load("assets/FlappyGreen.png"),
-            "FlappyRed": pygame.image.load("assets/FlappyRed.png"),
-            "FlappyStealth": pygame.image.load("assets/FlappyStealth.png"),
-            "FlappyWhite": pygame.image.load("assets/FlappyWhite.png"),
-            "GreenSpark": pygame.image.load("assets/GreenSpark.png"),
-            "hammer": pygame.image.load("assets/hammer.png"),
-            "metal_1": pygame.image.load("assets/metal_1.png"),
-            "MetalSquid": pygame.image.load("assets/MetalSquid.png"),
-            "RedMetalSquid": pygame.image.load("assets/RedMetalSquid.png")
-        }
         self._x = x
         self._y = y
         self._ship_img = None
+        self._image_name = None
         self._mask = None
         self._health = health
         self._max_health = health
@@ -79,6 +76,12 @@ class Ship:
         self._scr_width = 800
         self._scr_height = 800
 
+        # Bounding rect, brought up to date whenever it is requested
+        self._rect = pygame.Rect(0, 0, 0, 0)
+
+        # Random number stream used by random movement patterns
+        self._random = random
+
     # Get Methods
     def get_x(self):
         """returns value of ship's x coordinate"""
@@ -112,6 +115,11 @@ class Ship:
         """returns the ship's image mask"""
         return self._mask
 
+    def get_rect(self):
+        """returns the ship's bounding rect at its current coordinates"""
+        self._rect.update(self._x, self._y, self._ship_img.get_width(), self._ship_img.get_height())
+        return self._rect
+
     def get_width(self):
         """returns width of ship image"""
         return self._ship_img.get_width()
@@ -120,7 +128,33 @@ class Ship:
         """returns width of ship image"""
         return self._ship_img.get_height()
 
+    def get_motion(self):
+        """
+        returns the state used by movement patterns as a tuple of
+        (x, y, speed, move_counter, direction, screen width, screen height, ship width)
+        """
+        return (self._x, self._y, self._speed, self._move_counter, self._direction,
+                self._scr_width, self._scr_height, self._ship_img.get_width())
+
     # Set Methods
+    @staticmethod
+    def set_motions(ships, columns):
+        """
+        takes a list of ships and a dictionary holding a list of "y" values,
+        and optionally lists of "x", "counter" and "direction" values.
+        stores each ship's new movement state (used by the vectorized movement backend)
+        """
+        if "x" not in columns:
+            for ship, y in zip(ships, columns["y"]):
+                ship._y = y
+            return
+        for ship, x, y, counter, direction in zip(ships, columns["x"], columns["y"],
+                                                  columns["counter"], columns["direction"]):
+            ship._x = x
+            ship._y = y
+            ship._move_counter = counter
+            ship._direction = direction
+
     def set_x(self, num):
         """takes a number and sets the x coordinate to that value"""
         self._x = num
@@ -139,6 +173,10 @@ class Ship:
         self._scr_width = width
         self._scr_height = height
 
+    def set_random(self, stream):
+        """takes a random.Random and uses it for random movement patterns"""
+        self._random = stream
+
     def set_laser_type(self, laser_type):
         """
         takes a laser type
@@ -173,17 +211,26 @@ class Ship:
     def draw(self, surface):
         """
         takes a surface and on that surface
-        draws the ship at its current coordinates
+        draws the ship at its current coordinates, scaled to the window, from the shared sprite atlas;
+        returns the rect drawn over
         """
-        surface.blit(self._ship_img, (self._x, self._y))
+        image, area = Assets.get_sprite(self._image_name)
+        scale = Assets.get_scale()
+        return surface.blit(image, (self._x * scale, self._y * scale), area)
 
     def shoot(self):
         """if the cool_down_counter is zero, fires a laser object from the front of the ship."""
         if self._cool_down_counter <= 0:
-            laser = Laser(self._x + self.get_width()/2, self._y - 10, self._laser_type)
-            laser.horizontal_move(-(laser.get_width()//2))
-            self._lasers.append(laser)
-            self._cool_down_counter = laser.get_cool_down()
+            self._cool_down_counter = self.fire()
+
+    def fire(self):
+        """
+        fires a laser object from the front of the ship whatever its cool_down_counter;
+        returns the fired laser's cool down length
+        """
+        laser = self._lasers.new_laser(self._x + self.get_width()/2, self._y - 10, self._laser_type)
+        laser.horizontal_move(-(laser.get_width()//2))
+        return laser.get_cool_down()
 
     def cool_down(self):
         if self._cool_down_counter < 0:
@@ -253,8 +300,8 @@ class Ship:
             self._x = 0
             self._move_counter += 70
             self._direction = 1
-        if self._x > self._scr_width - 64:
-            self._x = self._scr_width - 64
+        if self._x > self._scr_width - self.get_width():
+            self._x = self._scr_width - self.get_width()
             self._move_counter += 70
             self._direction = 0
 
@@ -274,8 +321,8 @@ class Ship:
             self._x = 0
             self._move_counter += 70
             self._direction = 0
-        if self._x > self._scr_width - 64:
-            self._x = self._scr_width - 64
+        if self._x > self._scr_width - self.get_width():
+            self._x = self._scr_width - self.get_width()
             self._move_counter += 70
             self._direction = 1
 
@@ -293,7 +340,7 @@ class Ship:
         """Enemy descends the screen by descending at the end of each row. Starts left."""
         # Randomly drops the ship after reaching halfway down the screen.
         if self._move_counter == 0 and self._y > self._scr_height//2:
-            self._move_counter = random.randint(-250, -1)
+            self._move_counter = self._random.randint(-250, -1)
         if self._move_counter < 0:
             if self._move_counter == -1:
                 self._y += self._speed*3
@@ -306,8 +353,8 @@ class Ship:
             self._x = 0
             self._move_counter += 70
             self._direction = 0
-        if self._x > self._scr_width - 64:
-            self._x = self._scr_width - 64
+        if self._x > self._scr_width - self.get_width():
+            self._x = self._scr_width - self.get_width()
             self._move_counter += 70
             self._direction = 1
 
@@ -321,45 +368,106 @@ class Ship:
         else:
             self._x += self._speed
 
+    # Closed Forms of the Deterministic Movement Patterns
+    # Each takes a number of frames and returns the ship's (x, y, move_counter) after that many
+    # frames of the pattern of the same name, without moving the ship. Crawl patterns bounce off
+    # the walls or use random numbers, so they have none and are always stepped one frame at a time.
+    def move_down_after(self, frames):
+        """position of move_down after a number of frames"""
+        return self._x, self._y + self._speed * frames, self._move_counter
+
+    def sneak_sprint_after(self, frames):
+        """position of sneak_sprint after a number of frames"""
+        threshold = self._scr_height // 3
+        # Frames spent at normal speed before reaching a third of the way down the screen
+        slow = 0 if self._y >= threshold else min(frames, -(-(threshold - self._y) // self._speed))
+        return self._x, self._y + self._speed * slow + self._speed * 3 * (frames - slow), self._move_counter
+
+    def zig_after(self, frames):
+        """position of zig after a number of frames, or None if move_counter is outside its cycle"""
+        return self._weave_after(frames, 1)
+
+    def zag_after(self, frames):
+        """position of zag after a number of frames, or None if move_counter is outside its cycle"""
+        return self._weave_after(frames, -1)
+
+    def _weave_after(self, frames, sign):
+        """
+        position of zig (sign 1) or zag (sign -1) after a number of frames.
+        move_counter counts 0 to 120 and the ship moves sideways one way while it is at most 60,
+        so the sideways steps are the difference of two counts of whole and partial cycles.
+        """
+        counter = self._move_counter
+        if not 0 <= counter <= 120:
+            return None
+        steps = self._weave_steps(counter + frames) - self._weave_steps(counter)
+        return (self._x + sign * self._speed * 2 * steps, self._y + self._speed * frames,
+                (counter + frames) % 121)
+
+    @staticmethod
+    def _weave_steps(count):
+        """takes a number of frames from the start of a zig cycle; returns the right steps minus left steps in them"""
+        cycles, count = divmod(count, 121)
+        return cycles + (count if count <= 61 else 122 - count)
+
+    # Closed form of each movement pattern that has one
+    _trajectories = {
+        move_down: move_down_after,
+        sneak_sprint: sneak_sprint_after,
+        zig: zig_after,
+        zag: zag_after
+    }
+
+    @classmethod
+    def get_trajectory(cls, move_pattern):
+        """takes a movement pattern and returns its closed form, or None if it must be stepped"""
+        return cls._trajectories.get(move_pattern)
+
 
 class Player(Ship):
     """
     Ship controlled by the user
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y, laser_array, health):
         super().__init__(x, y, laser_array, health)
-        self._ship_img = self._image["main_ship"]
+        self._ship_img = Assets.get_image("main_ship")
+        self._image_name = "main_ship"
         self._laser_type = "player_green"
-        self._mask = pygame.mask.from_surface(self._ship_img)
+        self._mask = Assets.get_mask("main_ship")
 
     def set_image(self, ship_image):
         """Takes an image name and sets player ship to that image"""
-        self._ship_img = self._image[ship_image]
+        self._ship_img = Assets.get_image(ship_image)
+        self._image_name = ship_image
 
     def shoot(self):
         """if the cool_down_counter is zero, fires a laser object from the front of the ship."""
         if self._cool_down_counter == 0:
-            laser = Laser(self._x + self.get_width()/2-8, self._y - 10, self._laser_type)
-            self._lasers.append(laser)
+            laser = self._lasers.new_laser(self._x + self.get_width()/2-8, self._y - 10, self._laser_type)
             self._cool_down_counter = laser.get_cool_down()
 
     def health_bar(self, surface):
         """
         draws two overlapping rectangles, a red one the representing size of max health
-        and a green one on top the size of health relative to max health"""
-        pygame.draw.rect(surface, (255, 0, 0), (self._x, self._y + self.get_height() + 10, self.get_width(), 10))
-        pygame.draw.rect(surface, (0, 255, 0), (self._x, self._y + self.get_height() + 10,
-                                                self.get_width() * self._health / self._max_health, 10))
+        and a green one on top the size of health relative to max health;
+        returns the rect drawn over"""
+        scale = Assets.get_scale()
+        x = self._x * scale
+        y = (self._y + self.get_height() + 10) * scale
+        bar = pygame.draw.rect(surface, (255, 0, 0), (x, y, self.get_width() * scale, 10 * scale))
+        pygame.draw.rect(surface, (0, 255, 0), (x, y, self.get_width() * scale * self._health / self._max_health,
+                                                10 * scale))
+        return bar
 
     def draw(self, surface):
-        super().draw(surface)
-        self.health_bar(surface)
+        return super().draw(surface).union(self.health_bar(surface))
 
     def explode(self):
         """explodes the ship"""
-        laser = Laser(self._x - 64 + self.get_width()/2, self._y - 64, "explosion_zero")
-        self._lasers.append(laser)
+        self._lasers.new_laser(self._x - 64 + self.get_width()/2, self._y - 64, "explosion_zero")
 
 
 class Enemy(Ship):
@@ -367,64 +475,102 @@ class Enemy(Ship):
     Automated ships attacking the player
     """
 
+    __slots__ = ("_prototype",)
+
     def __init__(self, x, y, laser_array, enemy_type):
         super().__init__(x, y, laser_array)
 
-        # Dictionary of Enemy Species
-        self._species = {
-            # "Species": (Speed, Movement Pattern, Image, Laser Type, Health, Point Value)
-            "Squid": (1, self.move_down, self._image["BlueSquid"], "blueShot", 10, 10),
-            "ArrowBlue": (1, self.move_down, self._image["ArrowBlue"], "blueShot", 10, 10),
-            "ArrowGold": (1, self.move_down, self._image["ArrowGold"], "blueShot", 10, 10),
-            "ArrowPink": (1, self.move_down, self._image["ArrowPink"], "blueShot", 10, 10),
-            "ArrowRed": (1, self.move_down, self._image["ArrowRed"], "blueShot", 10, 10),
-            "ArrowStealth": (2, self.move_down, self._image["ArrowStealth"], "lightning", 30, 100),
-            "Block": (1, self.sneak_sprint, self._image["Block"], "blank", 20, 10),
-            "BlueSquid": (1, self.move_down, self._image["BlueSquid"], "blueShot", 10, 10),
-            "BlueSpark": (1, self.move_down, self._image["blueSpark"], "blueShot", 10, 10),
-            "CentiBlue": (3, self.crawl_left, self._image["CentiBlue"], "blasterGreen", 60, 10),
-            "CentiGreen": (3, self.crawl_left, self._image["CentiGreen"], "blank", 60, 10),
-            "CentiheadBlue": (3, self.move_down, self._image["CentiheadBlue"], "blank", 60, 10),
-            "CentiheadDud": (3, self.crawl_drop, self._image["CentiheadDud"], "blank", 60, 40),
-            "CentiheadGreen": (3, self.move_down, self._image["CentiheadGreen"], "blank", 60, 10),
-            "CentiheadPanda": (3, self.crawl_left, self._image["CentiheadPanda"], "blank", 60, 10),
-            "CentiheadRed": (3, self.crawl_right, self._image["CentiheadRed"], "blasterRed", 10, 60),
-            "CentiheadYellow": (3, self.move_down, self._image["CentiheadYellow"], "blank", 10, 60),
-            "CentiPurple": (3, self.crawl_right, self._image["CentiPurple"], "blank", 10, 60),
-            "CentiRed": (3, self.crawl_right, self._image["CentiRed"], "blank", 10, 60),
-            "FlappyBlue": (1, self.move_down, self._image["FlappyBlue"], "blueShot", 10, 10),
-            "FlappyGreen": (1, self.move_down, self._image["FlappyGreen"], "blueShot", 10, 10),
-            "FlappyRed": (1, self.move_down, self._image["FlappyRed"], "blueShot", 10, 10),
-            "FlappyStealth": (1, self.move_down, self._image["FlappyStealth"], "blueShot", 10, 10),
-            "FlappyWhite": (2, self.move_down, self._image["FlappyWhite"], "blasterGreen", 20, 15),
-            "FlappyWhite2": (2, self.move_down, self._image["FlappyWhite"], "blasterGreen2", 20, 15),
-            "GreenSpark": (1, self.move_down, self._image["GreenSpark"], "blueShot", 10, 10),
-            "Hammer": (3, self.move_down, self._image["hammer"], "explosion", 10, 10),
-            "Metal1": (1, self.zig, self._image["metal_1"], "rayGreen", 10, 10),
-            "MetalSquid": (1, self.move_down, self._image["MetalSquid"], "blueShot", 10, 10),
-            "RedMetalSquid": (1, self.move_down, self._image["RedMetalSquid"], "blueShot", 10, 10)
-        }
-
-        # Defines Enemy Attributes based on type
-        self._speed = self._species[enemy_type][0]                    # Speed
-        self._movement_type = self._species[enemy_type][1]            # Movement Pattern
-        self._ship_img = self._species[enemy_type][2]                 # Image
-        self._laser_type = self._species[enemy_type][3]               # Laser Type
-        self._health = self._species[enemy_type][4]                   # Health
-        self._point_value = self._species[enemy_type][5]              # Point Value
-
-        # Creates mask for collisions
-        self._mask = pygame.mask.from_surface(self._ship_img)
+        # Defines Enemy Attributes based on the shared species design
+        species = self._species[enemy_type]
+        self._prototype = species
+        self._speed = species.speed
+        self._ship_img = species.get_image()
+        self._image_name = species.image_name
+        self._laser_type = species.laser_type
+        self._health = species.health
+
+        # Mask for collisions is built once per image and shared by every enemy using it
+        self._mask = species.get_mask()
 
     def get_value(self):
         """Returns the enemy's point value"""
-        return self._point_value
+        return self._prototype.point_value
+
+    def get_move_pattern(self):
+        """Returns the enemy's movement pattern function"""
+        return self._prototype.move_pattern
 
     def move(self):
         """moves enemy according to movement_type"""
-        self._movement_type()
+        self._prototype.move_pattern(self)
+
+    def get_state_after(self, frames):
+        """
+        takes a number of frames
+        returns the enemy's (x, y, move_counter) after that many frames of its movement pattern
+        without moving it, or None if its pattern has no closed form
+        """
+        trajectory = Ship.get_trajectory(self._prototype.move_pattern)
+        return None if trajectory is None else trajectory(self, frames)
+
+    def advance(self, frames):
+        """
+        takes a number of frames and moves the enemy that many frames at once,
+        with the closed form of its movement pattern if it has one, else one frame at a time.
+        """
+        state = self.get_state_after(frames)
+        if state is None:
+            pattern = self._prototype.move_pattern
+            for frame in range(frames):
+                pattern(self)
+        else:
+            self._x, self._y, self._move_counter = state
 
     def explode(self):
         """explodes the ship"""
-        laser = Laser(self._x - 64 + self.get_width()/2, self._y - 64, "explosion")
-        self._lasers.append(laser)
+        self._lasers.new_laser(self._x - 64 + self.get_width()/2, self._y - 64, "explosion")
+
+    # Dictionary of Enemy Species, built once when the module is imported
+    _species = {
+        # "Species": Species(Speed, Movement Pattern, Image Name, Laser Type, Health, Point Value)
+        "Squid": Species(1, Ship.move_down, "BlueSquid", "blueShot", 10, 10),
+        "ArrowBlue": Species(1, Ship.move_down, "ArrowBlue", "blueShot", 10, 10),
+        "ArrowGold": Species(1, Ship.move_down, "ArrowGold", "blueShot", 10, 10),
+        "ArrowPink": Species(1, Ship.move_down, "ArrowPink", "blueShot", 10, 10),
+        "ArrowRed": Species(1, Ship.move_down, "ArrowRed", "blueShot", 10, 10),
+        "ArrowStealth": Species(2, Ship.move_down, "ArrowStealth", "lightning", 30, 100),
+        "Block": Species(1, Ship.sneak_sprint, "Block", "blank", 20, 10),
+        "BlueSquid": Species(1, Ship.move_down, "BlueSquid", "blueShot", 10, 10),
+        "BlueSpark": Species(1, Ship.move_down, "blueSpark", "blueShot", 10, 10),
+        "CentiBlue": Species(3, Ship.crawl_left, "CentiBlue", "blasterGreen", 60, 10),
+        "CentiGreen": Species(3, Ship.crawl_left, "CentiGreen", "blank", 60, 10),
+        "CentiheadBlue": Species(3, Ship.move_down, "CentiheadBlue", "blank", 60, 10),
+        "CentiheadDud": Species(3, Ship.crawl_drop, "CentiheadDud", "blank", 60, 40),
+        "CentiheadGreen": Species(3, Ship.move_down, "CentiheadGreen", "blank", 60, 10),
+        "CentiheadPanda": Species(3, Ship.crawl_left, "CentiheadPanda", "blank", 60, 10),
+        "CentiheadRed": Species(3, Ship.crawl_right, "CentiheadRed", "blasterRed", 10, 60),
+        "CentiheadYellow": Species(3, Ship.move_down, "CentiheadYellow", "blank", 10, 60),
+        "CentiPurple": Species(3, Ship.crawl_right, "CentiPurple", "blank", 10, 60),
+        "CentiRed": Species(3, Ship.crawl_right, "CentiRed", "blank", 10, 60),
+        "FlappyBlue": Species(1, Ship.move_down, "FlappyBlue", "blueShot", 10, 10),
+        "FlappyGreen": Species(1, Ship.move_down, "FlappyGreen", "blueShot", 10, 10),
+        "FlappyRed": Species(1, Ship.move_down, "FlappyRed", "blueShot", 10, 10),
+        "FlappyStealth": Species(1, Ship.move_down, "FlappyStealth", "blueShot", 10, 10),
+        "FlappyWhite": Species(2, Ship.move_down, "FlappyWhite", "blasterGreen", 20, 15),
+        "FlappyWhite2": Species(2, Ship.move_down, "FlappyWhite", "blasterGreen2", 20, 15),
+        "GreenSpark": Species(1, Ship.move_down, "GreenSpark", "blueShot", 10, 10),
+        "Hammer": Species(3, Ship.move_down, "hammer", "explosion", 10, 10),
+        "Metal1": Species(1, Ship.zig, "metal_1", "rayGreen", 10, 10),
+        "MetalSquid": Species(1, Ship.move_down, "MetalSquid", "blueShot", 10, 10),
+        "RedMetalSquid": Species(1, Ship.move_down, "RedMetalSquid", "blueShot", 10, 10)
+    }
+
+    @classmethod
+    def get_species(cls, enemy_type):
+        """takes a species name and returns its shared Species design"""
+        return cls._species[enemy_type]
+
+    @classmethod
+    def get_species_names(cls):
+        """returns the name of every species"""
+        return list(cls._species)
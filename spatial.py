@@ -0,0 +1,72 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Uniform-grid spatial hash used as the broad phase for collisions.
+#   Objects are bucketed by the grid cells their image covers, so the pixel-mask
+#   test in lasers.collide only runs on pairs that share a cell.
+
+
+class SpatialHash:
+    """
+    Buckets objects with x/y coordinates and a width/height into square grid cells.
+    Rebuilt each frame from the objects' current positions.
+    """
+
+    def __init__(self, cell_size=64):
+        """Takes an optional cell size in pixels and creates an empty grid."""
+        self._cell_size = cell_size
+        self._cells = {}
+
+    def get_cell_size(self):
+        """Returns the width and height of each grid cell in pixels."""
+        return self._cell_size
+
+    def get_cell_count(self):
+        """Returns the number of occupied grid cells."""
+        return len(self._cells)
+
+    def clear(self):
+        """Removes every object from the grid."""
+        self._cells.clear()
+
+    def insert(self, obj):
+        """Takes an object and adds it to every cell its image covers."""
+        cells = self._cells
+        for key in self._cover(obj):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [obj]
+            else:
+                bucket.append(obj)
+
+    def rebuild(self, objects):
+        """Takes a collection of objects and replaces the grid's contents with them."""
+        self._cells.clear()
+        for obj in objects:
+            self.insert(obj)
+
+    def query(self, obj):
+        """
+        Takes an object.
+        Returns a list of the stored objects sharing at least one cell with it,
+        in the order they were inserted and without duplicates.
+        """
+        cells = self._cells
+        found = {}
+        for key in self._cover(obj):
+            bucket = cells.get(key)
+            if bucket is not None:
+                for other in bucket:
+                    found[other] = None
+        return list(found)
+
+    def _cover(self, obj):
+        """Takes an object and returns the grid cells its image covers."""
+        size = self._cell_size
+        x = obj.get_x()
+        y = obj.get_y()
+        # The far edge is included so objects less than a pixel apart still share a cell.
+        left = int(x // size)
+        top = int(y // size)
+        right = int((x + obj.get_width()) // size)
+        bottom = int((y + obj.get_height()) // size)
+        return [(col, row) for col in range(left, right + 1) for row in range(top, bottom + 1)]
@@ -0,0 +1,344 @@
+# Author: Justin David Todd
+# Last Modified: 10/17/2026
+# Description: Optional NumPy backend for enemy and laser movement patterns.
+#   Movement state (positions, speeds/velocities, counters, directions) is kept in
+#   NumPy arrays, one row per entity, and each movement pattern advances every
+#   entity using it in one vectorized step. Results match the per-object methods
+#   in ships.py and lasers.py exactly. The arrays follow their pool as entities are added
+#   and removed, so lasers fired and destroyed every frame never cause a rebuild.
+#   NumPy is only needed if this backend is used.
+from operator import itemgetter
+from ships import Ship
+from lasers import Laser
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class MotionStore:
+    """
+    Structure-of-arrays movement state of every entity in one pool, one row per entity.
+    The store listens to its pool, so its rows are appended and swap-removed in step with the
+    pool's own storage and never rebuilt from the pool. The arrays are the source of truth between
+    frames: each step advances them and writes the changed columns back to the entities.
+    A new entity's state is read from its object on the first step after it was added,
+    so changes made right after adding it (a laser centered on its ship) are kept.
+    """
+
+    def __init__(self, pool, columns, patterns, setter, floats=()):
+        """
+        Takes the EntityPool to mirror, the names of the state columns, a dictionary of
+        movement pattern function -> (vectorized step method, names of the columns it changes),
+        the function that writes changed columns back to the entities,
+        and the names of the columns holding floats (the others hold integers).
+        """
+        self._pool = pool
+        self._columns = columns
+        self._steps = list(patterns.values())
+        self._pattern_index = {pattern: index for index, pattern in enumerate(patterns)}
+        self._setter = setter
+        self._size = 0
+        self._entities = []         # Entity of each row, in the pool's storage order
+        self._data = {name: numpy.zeros(16, dtype=numpy.float64 if name in floats else numpy.int64)
+                      for name in columns}
+        self._pattern = numpy.zeros(16, dtype=numpy.intp)   # Step index of each row, or -1 if not vectorized
+        self._fresh = {}            # Entity -> row, of entities whose state is read on the next step
+        self._groups = None         # (step method, changed columns, rows, entities) per pattern, until rows change
+        self._stepped = []          # Entities whose pattern has no vectorized step
+        for entity in pool:
+            self.added(entity)
+        pool.set_listener(self)
+
+    def get_pool(self):
+        """Returns the EntityPool the store mirrors."""
+        return self._pool
+
+    def get_columns(self):
+        """Returns a dictionary of column name -> array of that state, one row per stored entity."""
+        return {name: array[:self._size] for name, array in self._data.items()}
+
+    def get_entities(self):
+        """Returns the entities stored in the arrays, in row order."""
+        return self._entities
+
+    def get_stepped(self):
+        """Returns the entities moved one at a time by their own pattern method."""
+        if self._groups is None:
+            self._group()
+        return self._stepped
+
+    def detach(self):
+        """Stops mirroring the pool; the entities keep the state last written back."""
+        if self._pool.get_listener() is self:
+            self._pool.set_listener(None)
+
+    # Pool Listener Methods
+    def added(self, entity):
+        """Takes an entity just appended to the pool and appends its row; its state is read on the next step."""
+        row = self._size
+        if row == len(self._pattern):
+            self._grow()
+        index = self._pattern_index.get(entity.get_move_pattern(), -1)
+        self._pattern[row] = index
+        self._entities.append(entity)
+        self._size += 1
+        if index >= 0:
+            self._fresh[entity] = row
+        self._groups = None
+
+    def removed(self, position):
+        """Takes the position of an entity just removed from the pool and moves the last row into its place."""
+        last = self._size - 1
+        self._fresh.pop(self._entities[position], None)
+        if position != last:
+            moved = self._entities[last]
+            self._entities[position] = moved
+            for array in self._data.values():
+                array[position] = array[last]
+            self._pattern[position] = self._pattern[last]
+            if moved in self._fresh:
+                self._fresh[moved] = position
+        self._entities.pop()
+        self._size = last
+        self._groups = None
+
+    def cleared(self):
+        """Drops every row after the pool was cleared."""
+        self._size = 0
+        self._entities = []
+        self._fresh.clear()
+        self._groups = None
+
+    # Other Methods
+    def step(self):
+        """
+        Advances every stored entity by one frame of its movement pattern,
+        then writes the columns each pattern changed back to the entities.
+        """
+        if self._fresh:
+            self._read_fresh()
+        if self._groups is None:
+            self._group()
+        data = self._data
+        for step, changed, rows, entities in self._groups:
+            step(data, rows)
+            self._setter(entities, {name: data[name][rows].tolist() for name in changed})
+
+    def _read_fresh(self):
+        """Reads the state of the entities added since the last step into their rows."""
+        rows = numpy.fromiter(self._fresh.values(), dtype=numpy.intp, count=len(self._fresh))
+        motions = [entity.get_motion() for entity in self._fresh]
+        for column, name in enumerate(self._columns):
+            values = numpy.array([motion[column] for motion in motions])
+            # A float in an integer column keeps its fraction, as it does in the per-object methods
+            if values.dtype.kind == "f" and self._data[name].dtype.kind != "f":
+                self._data[name] = self._data[name].astype(numpy.float64)
+            self._data[name][rows] = values
+        self._fresh.clear()
+
+    def _group(self):
+        """Finds the rows of each movement pattern, and the entities without a vectorized step."""
+        patterns = self._pattern[:self._size]
+        self._groups = []
+        for index, (step, changed) in enumerate(self._steps):
+            rows = numpy.flatnonzero(patterns == index)
+            if len(rows):
+                self._groups.append((step, changed, rows, self._pick(rows)))
+        self._stepped = self._pick(numpy.flatnonzero(patterns < 0))
+
+    def _pick(self, rows):
+        """Takes an array of rows and returns a list of their entities."""
+        if len(rows) == 0:
+            return []
+        if len(rows) == 1:
+            return [self._entities[rows[0]]]
+        return list(itemgetter(*rows.tolist())(self._entities))
+
+    def _grow(self):
+        """Doubles the number of rows the arrays can hold."""
+        for name, array in self._data.items():
+            self._data[name] = numpy.concatenate((array, numpy.zeros_like(array)))
+        self._pattern = numpy.concatenate((self._pattern, numpy.zeros_like(self._pattern)))
+
+
+class VectorMovement:
+    """
+    Moves enemies and lasers with vectorized NumPy steps.
+    Patterns that depend on random numbers (crawl_drop) fall back to the per-object method.
+    """
+
+    def __init__(self):
+        """Creates the array stores for enemies, enemy lasers and player lasers."""
+        if numpy is None:
+            raise ImportError("The vectorized movement backend requires NumPy.")
+        # Movement pattern: (vectorized step, columns the step changes)
+        weaving = ("x", "y", "counter", "direction")
+        enemy_patterns = {
+            Ship.move_down: (self._move_down, ("y",)),
+            Ship.sneak_sprint: (self._sneak_sprint, ("y",)),
+            Ship.zig: (self._zig, weaving),
+            Ship.zag: (self._zag, weaving),
+            Ship.crawl_left: (self._crawl_left, weaving),
+            Ship.crawl_right: (self._crawl_right, weaving)
+        }
+        laser_patterns = {
+            Laser.normal: (self._normal, ("y",)),
+            Laser.weave: (self._weave, ("x", "y", "timer")),
+            Laser.weave2: (self._weave2, ("x", "y", "timer")),
+            Laser.delayed: (self._delayed, ("x", "y", "timer"))
+        }
+        enemy_columns = ("x", "y", "speed", "counter", "direction", "width", "height", "ship_width")
+        laser_columns = ("x", "y", "velocity", "timer")
+        self._enemies = {}
+        self._enemy_columns = enemy_columns
+        self._enemy_patterns = enemy_patterns
+        self._lasers = {}
+        self._laser_columns = laser_columns
+        self._laser_patterns = laser_patterns
+
+    @staticmethod
+    def available():
+        """Returns True if NumPy is installed, else False."""
+        return numpy is not None
+
+    def detach(self):
+        """Stops every store following its pool, so the pools can be moved by the per-object methods again."""
+        for store in list(self._enemies.values()) + list(self._lasers.values()):
+            store.detach()
+        self._enemies.clear()
+        self._lasers.clear()
+
+    def move_enemies(self, pool):
+        """Takes an enemy pool and moves every enemy one frame."""
+        store = self._enemies.get(id(pool))
+        if store is None:
+            store = MotionStore(pool, self._enemy_columns, self._enemy_patterns, Ship.set_motions)
+            self._enemies[id(pool)] = store
+        store.step()
+        for enemy in store.get_stepped():
+            enemy.move()
+
+    def move_lasers(self, pool):
+        """Takes a laser pool and moves every laser one frame."""
+        store = self._lasers.get(id(pool))
+        if store is None:
+            store = MotionStore(pool, self._laser_columns, self._laser_patterns, Laser.set_motions, ("x",))
+            self._lasers[id(pool)] = store
+        store.step()
+        for laser in store.get_stepped():
+            laser.mov()
+
+    # Vectorized Ship Movement Patterns, matching the methods of the same name in Ship
+    @staticmethod
+    def _move_down(data, rows):
+        """sends the enemies down in a straight line"""
+        data["y"][rows] += data["speed"][rows]
+
+    @staticmethod
+    def _sneak_sprint(data, rows):
+        """moves enemies down, three times faster once a third of the way down the screen"""
+        y = data["y"][rows]
+        speed = data["speed"][rows]
+        data["y"][rows] = y + numpy.where(y >= data["height"][rows] // 3, speed * 3, speed)
+
+    @staticmethod
+    def _zigzag(data, rows, sign):
+        """moves enemies down while weaving; sign 1 weaves like zig, -1 like zag"""
+        counter = data["counter"][rows]
+        speed = data["speed"][rows]
+        data["x"][rows] += numpy.where(counter <= 60, speed * 2 * sign, -speed * 2 * sign)
+        data["y"][rows] += speed
+        counter += 1
+        counter[counter > 120] = 0
+        data["counter"][rows] = counter
+
+    def _zig(self, data, rows):
+        """enemies descend while weaving right first"""
+        self._zigzag(data, rows, 1)
+
+    def _zag(self, data, rows):
+        """enemies descend while weaving left first"""
+        self._zigzag(data, rows, -1)
+
+    @staticmethod
+    def _crawl(data, rows, left_direction):
+        """
+        enemies cross the screen in rows, descending at each wall.
+        left_direction is the direction value that moves the enemy left.
+        """
+        x = data["x"][rows]
+        y = data["y"][rows]
+        counter = data["counter"][rows]
+        direction = data["direction"][rows]
+        speed = data["speed"][rows]
+        right_wall = data["width"][rows] - data["ship_width"][rows]
+
+        # Hitting the left wall
+        hit = (x < 0) & (counter == 0)
+        x[hit] = 0
+        counter[hit] += 70
+        direction[hit] = 1 - left_direction
+        # Hitting the right wall
+        hit = x > right_wall
+        x[hit] = right_wall[hit]
+        counter[hit] += 70
+        direction[hit] = left_direction
+
+        # Moves down while move_counter is active, else left or right
+        down = counter > 0
+        y[down] += 2
+        counter[down] -= 1
+        left = ~down & (direction == left_direction)
+        right = ~down & (direction != left_direction)
+        x[left] -= speed[left]
+        x[right] += speed[right]
+
+        data["x"][rows] = x
+        data["y"][rows] = y
+        data["counter"][rows] = counter
+        data["direction"][rows] = direction
+
+    def _crawl_left(self, data, rows):
+        """enemies crawl in rows, direction 0 moving left"""
+        self._crawl(data, rows, 0)
+
+    def _crawl_right(self, data, rows):
+        """enemies crawl in rows, direction 1 moving left"""
+        self._crawl(data, rows, 1)
+
+    # Vectorized Laser Movement Patterns, matching the methods of the same name in Laser
+    @staticmethod
+    def _normal(data, rows):
+        """lasers travel in a straight line"""
+        data["y"][rows] += data["velocity"][rows]
+
+    @staticmethod
+    def _weave_laser(data, rows, sign):
+        """lasers travel while weaving; sign 1 weaves like weave, -1 like weave2"""
+        timer = data["timer"][rows]
+        data["x"][rows] += numpy.where(timer < 30, 3 * sign, -3 * sign)
+        timer += 1
+        timer[timer > 60] = 0
+        data["timer"][rows] = timer
+        data["y"][rows] += data["velocity"][rows]
+
+    def _weave(self, data, rows):
+        """lasers weave right first"""
+        self._weave_laser(data, rows, 1)
+
+    def _weave2(self, data, rows):
+        """lasers weave left first"""
+        self._weave_laser(data, rows, -1)
+
+    @staticmethod
+    def _delayed(data, rows):
+        """blasts hold in place for 30 frames, then move below the screen"""
+        timer = data["timer"][rows]
+        waiting = timer < 30
+        timer[waiting] += 1
+        data["timer"][rows] = timer
+        y = data["y"][rows]
+        y[~waiting] = 10000
+        data["y"][rows] = y